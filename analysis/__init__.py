@@ -0,0 +1,14 @@
+import importlib
+
+from .crafting_graph import CraftingGraph, CraftingNode
+
+# The tables computed with NumPy are only imported when they are used, so the crafting graph works without NumPy.
+_numpy_modules = {
+    'ResistanceMatrix': '.resistance_matrix',
+    'DamageTable': '.damage_table'
+}
+
+def __getattr__(name: str):
+    if name in _numpy_modules:
+        return getattr(importlib.import_module(_numpy_modules[name], __name__), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
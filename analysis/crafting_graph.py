@@ -0,0 +1,212 @@
+import math
+
+from pathlib import Path
+
+from models import CraftingRecipe
+from global_database import GlobalDatabase
+
+class CraftingNode:
+    """
+    A node of an expanded crafting tree. Nodes are shared between the trees that need the same quantity of an item.
+    #### Parameters
+    - `item_key` : `str`
+        - The key name of the item.
+    - `quantity` : `int`
+        - The quantity of the item needed.
+    - `recipe_key` : `str`
+        - The key name of the recipe used to craft the item, or `None` for a raw material.
+    - `crafts` : `int`
+        - The number of times the recipe is crafted.
+    - `components` : `list[CraftingNode]`
+        - The expanded components of the recipe.
+    - `raw_materials` : `dict[str, int]`
+        - The total quantity of every raw material of the tree, by item key name.
+    - `cycle` : `bool`
+        - Whether the item was left unexpanded because it is needed to craft itself.
+    """
+    def __init__(self, item_key: str, quantity: int, recipe_key: str, crafts: int, components: list['CraftingNode'], raw_materials: dict[str, int], cycle: bool = False):
+        self.item_key = item_key
+        self.quantity = quantity
+        self.recipe_key = recipe_key
+        self.crafts = crafts
+        self.components = components
+        self.raw_materials = raw_materials
+        self.cycle = cycle
+
+    def to_dict(self) -> dict:
+        """
+        This method is responsible for converting the tree to a dictionary.
+        #### Returns
+        - `dict` : The converted tree.
+        """
+        return {
+            'item_key': self.item_key,
+            'quantity': self.quantity,
+            'recipe_key': self.recipe_key,
+            'crafts': self.crafts,
+            'components': [component.to_dict() for component in self.components],
+            'raw_materials': self.raw_materials,
+            'cycle': self.cycle
+        }
+
+class CraftingGraph:
+    """
+    The crafting recipes as a graph from every item to the recipes that craft it, used to expand an item into its full
+    crafting tree. A recipe is crafted as many whole times as needed for the requested quantity, and the expanded
+    sub-trees are memoized by item and quantity, so the sub-trees shared by many items are only expanded once.
+    When there are alternative recipes for an item the first crawled one is used, unless another one is chosen. An item
+    needed to craft itself is left unexpanded and counted as a raw material.
+    #### Parameters
+    - `recipes` : `dict[str, CraftingRecipe]`
+        - The recipes by key name (e.g.: the output of the `crafting_recipes` crawler).
+    - `recipe_choices` : `dict[str, str]`
+        - The key name of the recipe to use, by item key name, for items with alternative recipes.
+    """
+    def __init__(self, recipes: dict[str, CraftingRecipe], recipe_choices: dict[str, str] = None):
+        self.recipes = recipes
+        self.item_recipes: dict[str, list[CraftingRecipe]] = {}
+        for recipe in recipes.values():
+            if recipe.item is not None:
+                self.item_recipes.setdefault(recipe.item.key_name, []).append(recipe)
+
+        self.recipe_choices = {}
+        for item_key, recipe_key in (recipe_choices or {}).items():
+            if recipe_key not in [recipe.key_name for recipe in self.item_recipes.get(item_key, [])]:
+                raise ValueError(f'The recipe: {recipe_key} does not craft the item: {item_key}')
+            self.recipe_choices[item_key] = recipe_key
+        # The memoized trees by item and quantity, with the key names of the items in each tree.
+        self.cache: dict[tuple[str, int], tuple[CraftingNode, frozenset[str]]] = {}
+
+    @staticmethod
+    def from_crawled_data(data_path: Path, recipe_choices: dict[str, str] = None) -> 'CraftingGraph':
+        """
+        This method is responsible for building the graph from the saved output of the `crafting_recipes` crawler.
+        #### Parameters
+        - `data_path` : `Path`
+            - The path to `crafting_recipes.json`.
+        - `recipe_choices` : `dict[str, str]`
+            - The key name of the recipe to use, by item key name, for items with alternative recipes.
+        #### Returns
+        - `CraftingGraph` : The built graph.
+        """
+        return CraftingGraph(GlobalDatabase.load_crawled_data('crafting_recipes', data_path), recipe_choices)
+
+    def get_recipes(self, item_key: str) -> list[CraftingRecipe]:
+        """
+        This method is responsible for getting the alternative recipes that craft an item.
+        #### Parameters
+        - `item_key` : `str`
+            - The key name of the item.
+        #### Returns
+        - `list[CraftingRecipe]` : The recipes, in the crawled order. Empty for a raw material.
+        """
+        return self.item_recipes.get(item_key, [])
+
+    def get_recipe(self, item_key: str) -> CraftingRecipe:
+        """
+        This method is responsible for getting the recipe used to craft an item.
+        #### Parameters
+        - `item_key` : `str`
+            - The key name of the item.
+        #### Returns
+        - `CraftingRecipe` : The chosen recipe, or `None` for a raw material.
+        """
+        recipes = self.get_recipes(item_key)
+        if not recipes:
+            return None
+        if item_key in self.recipe_choices:
+            return next(recipe for recipe in recipes if recipe.key_name == self.recipe_choices[item_key])
+        return recipes[0]
+
+    def expand(self, item_key: str, quantity: int = 1) -> CraftingNode:
+        """
+        This method is responsible for expanding an item into its full crafting tree.
+        #### Parameters
+        - `item_key` : `str`
+            - The key name of the item.
+        - `quantity` : `int`
+            - The quantity of the item needed.
+        #### Returns
+        - `CraftingNode` : The root of the tree.
+        #### Raises
+        - `ValueError` : If the quantity is not positive.
+        """
+        if quantity < 1:
+            raise ValueError(f'Invalid quantity: {quantity}')
+        return self._expand(item_key, quantity, set())[0]
+
+    def get_raw_materials(self, item_key: str, quantity: int = 1) -> dict[str, int]:
+        """
+        This method is responsible for totaling the raw materials needed to craft an item.
+        #### Parameters
+        - `item_key` : `str`
+            - The key name of the item.
+        - `quantity` : `int`
+            - The quantity of the item needed.
+        #### Returns
+        - `dict[str, int]` : The quantity of every raw material, by item key name.
+        """
+        return dict(self.expand(item_key, quantity).raw_materials)
+
+    def expand_all(self) -> dict[str, CraftingNode]:
+        """
+        This method is responsible for expanding every craftable item into its crafting tree.
+        #### Returns
+        - `dict[str, CraftingNode]` : The tree of a single unit of every craftable item, by item key name.
+        """
+        return {item_key: self.expand(item_key) for item_key in self.item_recipes}
+
+    def _expand(self, item_key: str, quantity: int, path: set[str]) -> tuple[CraftingNode, set[str], frozenset[str]]:
+        """
+        This method is responsible for expanding an item, given the items being expanded above it.
+        #### Parameters
+        - `item_key` : `str`
+            - The key name of the item.
+        - `quantity` : `int`
+            - The quantity of the item needed.
+        - `path` : `set[str]`
+            - The key names of the items being expanded above this one.
+        #### Returns
+        - `tuple[CraftingNode, set[str], frozenset[str]]` : The tree, the items above it where a cycle was cut inside
+          it, and the key names of the items in the tree.
+        """
+        # A memoized tree is only the same as a new expansion when none of its items are being expanded above it,
+        # otherwise the cycle would be cut somewhere else.
+        entry = self.cache.get((item_key, quantity))
+        if entry is not None and path.isdisjoint(entry[1]):
+            return entry[0], set(), entry[1]
+
+        recipe = self.get_recipe(item_key)
+        if item_key in path:
+            return CraftingNode(item_key, quantity, None, 0, [], {item_key: quantity}, cycle=True), {item_key}, frozenset([item_key])
+        if recipe is None:
+            node = CraftingNode(item_key, quantity, None, 0, [], {item_key: quantity})
+            items = frozenset([item_key])
+            self.cache[(item_key, quantity)] = (node, items)
+            return node, set(), items
+
+        crafts = math.ceil(quantity / recipe.quantity) if recipe.quantity else 1
+        components = []
+        raw_materials: dict[str, int] = {}
+        cuts: set[str] = set()
+        items = {item_key}
+        path.add(item_key)
+        for component in recipe.components:
+            if component is None:
+                continue
+            child, child_cuts, child_items = self._expand(component.item_key, component.quantity * crafts, path)
+            components.append(child)
+            cuts |= child_cuts
+            items |= child_items
+            for material_key, material_quantity in child.raw_materials.items():
+                raw_materials[material_key] = raw_materials.get(material_key, 0) + material_quantity
+        path.discard(item_key)
+
+        # A cycle back to this item is closed here, so only the cycles to the items above it keep the tree from being
+        # reused: where they are cut depends on where the expansion started.
+        cuts.discard(item_key)
+        node = CraftingNode(item_key, quantity, recipe.key_name, crafts, components, raw_materials)
+        items = frozenset(items)
+        if not cuts:
+            self.cache[(item_key, quantity)] = (node, items)
+        return node, cuts, items
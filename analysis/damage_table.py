@@ -0,0 +1,243 @@
+import re
+import numpy as np
+
+from pathlib import Path
+
+from models import Creature, ToolWeapon, DamageData
+from global_database import GlobalDatabase
+from .resistance_matrix import ResistanceMatrix
+
+class DamageTable:
+    """
+    The damage of every attack of a combo of every weapon against every creature and weakpoint, computed in batch.
+    The damage of a hit is the sum of its main and secondary damage data, each multiplied by the combo scaling of the
+    attack, by the creature resistance to every damage type of its compound type (e.g.: `BP_FreshChoppingDamage` is
+    fresh and chopping), by the percentage `base_damage_reduction` of the creature and by the weakpoint multiplier.
+    A weakpoint applies when one of the attack tags is, or is a child of, one of its `damage_sources`, or when it has
+    no damage sources.
+    #### Parameters
+    - `weapons` : `dict[str, ToolWeapon]`
+        - The weapons by key name (e.g.: the output of the `tools_weapons` crawler).
+    - `creatures` : `dict[str, Creature]`
+        - The creatures by key name (e.g.: the output of the `bestiary` crawler).
+    - `combo` : `str`
+        - The combo of the weapons to use: `main`, `alternate` or `swimming`.
+    - `resistances` : `ResistanceMatrix`
+        - The resistances of the creatures. Built from `creatures` when not given.
+    #### Attributes
+    - `locations` : `list[list[str]]`
+        - The hit locations of each creature: `body` followed by its weakpoints.
+    - `attack_keys` : `list[tuple[str, int]]`
+        - The weapon key name and position in the combo of each row of `per_hit`.
+    - `per_hit` : `np.ndarray`
+        - The damage of each attack, by attack, creature and location. Locations a creature doesn't have are `nan`.
+    - `per_combo` : `np.ndarray`
+        - The damage of the whole combo, by weapon, creature and location.
+    """
+    combo_names = ['main', 'alternate', 'swimming']
+    damage_type_pattern = re.compile(r'[A-Z][a-z]*')
+
+    def __init__(self, weapons: dict[str, ToolWeapon], creatures: dict[str, Creature], combo: str = 'main', resistances: ResistanceMatrix = None):
+        if combo not in DamageTable.combo_names:
+            raise ValueError(f'Invalid combo: {combo}')
+
+        self.weapon_keys = list(weapons)
+        self.creature_keys = list(creatures)
+        self.weapon_index = {key: index for index, key in enumerate(self.weapon_keys)}
+        self.creature_index = {key: index for index, key in enumerate(self.creature_keys)}
+        self.resistances = resistances if resistances is not None else ResistanceMatrix(creatures)
+
+        # Flatten the damage data of every attack, so every step below is a single array operation.
+        self.attack_keys: list[tuple[str, int]] = []
+        attack_weapons, attack_tags = [], []
+        damage_attacks, damage_values, damage_types = [], [], []
+        for weapon_key, weapon in weapons.items():
+            attacks_info = weapon.melee_attacks_info
+            attacks = getattr(attacks_info, f'{combo}_combo') if attacks_info else []
+            scaling = getattr(attacks_info, f'{combo}_scaling') if attacks_info else []
+            for position, attack in enumerate(attacks):
+                attack_index = len(self.attack_keys)
+                self.attack_keys.append((weapon_key, position))
+                attack_weapons.append(self.weapon_index[weapon_key])
+                attack_tags.append(attack.tags)
+
+                scale = scaling[position] if position < len(scaling) else 1.0
+                for damage_data in [attack.main_damage_data, *attack.secondary_damage_data]:
+                    damage_attacks.append(attack_index)
+                    damage_values.append(damage_data.damage * scale)
+                    damage_types.append(DamageTable.get_damage_types(damage_data))
+
+        self.attack_weapons = np.array(attack_weapons, dtype=np.intp)
+        self.locations = self._get_locations(creatures)
+        resistance = self._get_resistance(damage_types)
+        reduction = self._get_reduction(creatures)
+        weakpoints = self._get_weakpoint_multipliers(creatures, attack_tags)
+
+        # (damage data x creature) -> (attack x creature)
+        damage = np.array(damage_values, dtype=np.float64)[:, None] * resistance
+        attack_damage = np.zeros((len(self.attack_keys), len(self.creature_keys)), dtype=np.float64)
+        np.add.at(attack_damage, np.array(damage_attacks, dtype=np.intp), damage)
+
+        self.per_hit = attack_damage[:, :, None] * reduction[None, :, None] * weakpoints
+        # A weapon without attacks still has no damage on the locations a creature doesn't have.
+        self.per_combo = np.zeros((len(self.weapon_keys), *self.per_hit.shape[1:]), dtype=np.float64)
+        self.per_combo[:, self._get_missing_locations()] = np.nan
+        np.add.at(self.per_combo, self.attack_weapons, self.per_hit)
+
+    @staticmethod
+    def from_crawled_data(crawled_data_path: Path, combo: str = 'main') -> 'DamageTable':
+        """
+        This method is responsible for building the table from the saved output of the `tools_weapons` and `bestiary` crawlers.
+        #### Parameters
+        - `crawled_data_path` : `Path`
+            - The directory with the saved output of the crawlers (e.g.: `data/crawled/1.4.4.4634`).
+        - `combo` : `str`
+            - The combo of the weapons to use: `main`, `alternate` or `swimming`.
+        #### Returns
+        - `DamageTable` : The built table.
+        #### Raises
+        - `ValueError` : If the output of a crawler is missing or was saved with fields the models no longer have.
+        """
+        crawled_data_path = Path(crawled_data_path)
+        weapons = DamageTable._load_crawled_data('tools_weapons', crawled_data_path)
+        creatures = DamageTable._load_crawled_data('bestiary', crawled_data_path)
+        return DamageTable(weapons, creatures, combo)
+
+    @staticmethod
+    def _load_crawled_data(crawler_name: str, crawled_data_path: Path) -> dict:
+        data_path = crawled_data_path / f'{crawler_name}.json'
+        if not data_path.exists():
+            raise ValueError(f'There is no output of the crawler: {crawler_name} in {crawled_data_path}, run it first')
+        try:
+            return GlobalDatabase.load_crawled_data(crawler_name, data_path)
+        except KeyError as error:
+            # Outputs saved by an older version of the crawler lack the fields that were added since.
+            raise ValueError(f'The output of the crawler: {crawler_name} in {crawled_data_path} has no field: {error.args[0]}, crawl it again') from error
+
+    @staticmethod
+    def get_damage_types(damage_data: DamageData) -> list[str]:
+        """
+        This method is responsible for splitting a damage type into the damage types of the resistances.
+        #### Parameters
+        - `damage_data` : `DamageData`
+            - The damage data.
+        #### Returns
+        - `list[str]` : The damage types (e.g.: `['fresh', 'chopping']` for `BP_FreshChoppingDamage`). Types without
+          resistances, like mining, are left out.
+        """
+        if not damage_data.damage_type:
+            return []
+        name = damage_data.damage_type.removeprefix('BP_').removesuffix('Damage')
+        words = [word.lower() for word in DamageTable.damage_type_pattern.findall(name)]
+        return [word for word in words if word in Creature.valid_damage_types]
+
+    def get_hit_damage(self, weapon_key: str, creature_key: str, location: str = 'body') -> list[float]:
+        """
+        This method is responsible for getting the damage of each attack of a weapon combo against a creature.
+        #### Parameters
+        - `weapon_key` : `str`
+            - The key name of the weapon.
+        - `creature_key` : `str`
+            - The key name of the creature.
+        - `location` : `str`
+            - `body` or the key name of a weakpoint of the creature.
+        #### Returns
+        - `list[float]` : The damage of each attack, in combo order.
+        """
+        creature, location_index = self._get_location_index(creature_key, location)
+        attacks = np.flatnonzero(self.attack_weapons == self._get_weapon_index(weapon_key))
+        return self.per_hit[attacks, creature, location_index].tolist()
+
+    def get_combo_damage(self, weapon_key: str, creature_key: str, location: str = 'body') -> float:
+        """
+        This method is responsible for getting the damage of a whole weapon combo against a creature.
+        #### Parameters
+        - `weapon_key` : `str`
+            - The key name of the weapon.
+        - `creature_key` : `str`
+            - The key name of the creature.
+        - `location` : `str`
+            - `body` or the key name of a weakpoint of the creature.
+        #### Returns
+        - `float` : The damage of the combo.
+        """
+        creature, location_index = self._get_location_index(creature_key, location)
+        return float(self.per_combo[self._get_weapon_index(weapon_key), creature, location_index])
+
+    def _get_locations(self, creatures: dict[str, Creature]) -> list[list[str]]:
+        locations = []
+        for creature in creatures.values():
+            weakpoints = creature.info.weakpoints if creature.info else []
+            locations.append(['body'] + [weakpoint.key_name for weakpoint in weakpoints])
+        return locations
+
+    def _get_missing_locations(self) -> np.ndarray:
+        location_count = max(len(locations) for locations in self.locations) if self.locations else 1
+        counts = np.array([len(locations) for locations in self.locations], dtype=np.intp)
+        return np.arange(location_count)[None, :] >= counts[:, None]
+
+    def _get_resistance(self, damage_types: list[list[str]]) -> np.ndarray:
+        # (damage data x damage type) mask, so a compound type multiplies the resistances of all its parts.
+        mask = np.zeros((len(damage_types), len(self.resistances.damage_types)), dtype=bool)
+        for row, types in enumerate(damage_types):
+            for damage_type in types:
+                mask[row, self.resistances.damage_type_index[damage_type]] = True
+
+        # The creature order of the resistances may differ from the one of the table.
+        values = self.resistances.values[[self.resistances.creature_index[key] for key in self.creature_keys]]
+        resistance = np.ones((len(damage_types), len(self.creature_keys)), dtype=np.float64)
+        for column in range(mask.shape[1]):
+            resistance *= np.where(mask[:, column, None], values[None, :, column], 1.0)
+        return resistance
+
+    def _get_reduction(self, creatures: dict[str, Creature]) -> np.ndarray:
+        reduction = [
+            creature.info.base_damage_reduction if creature.info and creature.info.base_damage_reduction else 0.0
+            for creature in creatures.values()
+        ]
+        return 1.0 - np.array(reduction, dtype=np.float64) / 100.0
+
+    def _get_weakpoint_multipliers(self, creatures: dict[str, Creature], attack_tags: list[list[str]]) -> np.ndarray:
+        location_count = max(len(locations) for locations in self.locations) if self.locations else 1
+        multipliers = np.full((len(self.creature_keys), location_count), np.nan, dtype=np.float64)
+        multipliers[:, 0] = 1.0
+
+        # Every damage source becomes a column, and a weakpoint without sources gets a column that every attack has.
+        sources = {'': 0}
+        weakpoint_sources = []
+        for row, creature in enumerate(creatures.values()):
+            for column, weakpoint in enumerate(creature.info.weakpoints if creature.info else [], start=1):
+                multipliers[row, column] = weakpoint.damage_multiplier
+                for source in weakpoint.damage_sources or ['']:
+                    weakpoint_sources.append((row, column, sources.setdefault(source, len(sources))))
+
+        source_mask = np.zeros((len(self.creature_keys), location_count, len(sources)), dtype=np.float64)
+        for row, column, source in weakpoint_sources:
+            source_mask[row, column, source] = 1.0
+
+        tag_mask = np.zeros((len(attack_tags), len(sources)), dtype=np.float64)
+        tag_mask[:, 0] = 1.0
+        for source, index in sources.items():
+            if not source:
+                continue
+            for row, tags in enumerate(attack_tags):
+                if any(tag == source or tag.startswith(f'{source}.') for tag in tags):
+                    tag_mask[row, index] = 1.0
+
+        # (attack x source) . (creature x location x source) -> (attack x creature x location)
+        applies = np.einsum('as,cls->acl', tag_mask, source_mask) > 0
+        applies[:, :, 0] = True
+        return np.where(applies, multipliers[None, :, :], np.where(np.isnan(multipliers), np.nan, 1.0)[None, :, :])
+
+    def _get_weapon_index(self, weapon_key: str) -> int:
+        if weapon_key not in self.weapon_index:
+            raise ValueError(f'Invalid weapon: {weapon_key}')
+        return self.weapon_index[weapon_key]
+
+    def _get_location_index(self, creature_key: str, location: str) -> tuple[int, int]:
+        if creature_key not in self.creature_index:
+            raise ValueError(f'Invalid creature: {creature_key}')
+        creature = self.creature_index[creature_key]
+        if location not in self.locations[creature]:
+            raise ValueError(f'Invalid location: {location} for the creature: {creature_key}')
+        return creature, self.locations[creature].index(location)
@@ -0,0 +1,86 @@
+import numpy as np
+
+from pathlib import Path
+
+from models import Creature
+from global_database import GlobalDatabase
+
+class ResistanceMatrix:
+    """
+    The weakness or resistance multiplier of every creature against every damage type, computed once.
+    Rows follow the order of the creatures and columns the order of the damage types.
+    #### Parameters
+    - `creatures` : `dict[str, Creature]`
+        - The creatures by key name (e.g.: the output of the `bestiary` crawler).
+    - `damage_types` : `list[str]`
+        - The damage types of the columns.
+    """
+    def __init__(self, creatures: dict[str, Creature], damage_types: list[str] = Creature.valid_damage_types):
+        self.creature_keys = list(creatures)
+        self.damage_types = list(damage_types)
+        self.creature_index = {key: index for index, key in enumerate(self.creature_keys)}
+        self.damage_type_index = {damage_type: index for index, damage_type in enumerate(self.damage_types)}
+
+        self.values = np.ones((len(self.creature_keys), len(self.damage_types)), dtype=np.float64)
+        for row, creature in enumerate(creatures.values()):
+            for column, damage_type in enumerate(self.damage_types):
+                self.values[row, column] = creature.get_weakness_or_resistance(damage_type)
+
+    @staticmethod
+    def from_crawled_data(data_path: Path) -> 'ResistanceMatrix':
+        """
+        This method is responsible for building the matrix from the saved output of the `bestiary` crawler.
+        #### Parameters
+        - `data_path` : `Path`
+            - The path to `bestiary.json`.
+        #### Returns
+        - `ResistanceMatrix` : The built matrix.
+        """
+        return ResistanceMatrix(GlobalDatabase.load_crawled_data('bestiary', data_path))
+
+    def get(self, creature_key: str, damage_type: str) -> float:
+        """
+        This method is responsible for getting the multiplier of a creature against a damage type.
+        #### Parameters
+        - `creature_key` : `str`
+            - The key name of the creature.
+        - `damage_type` : `str`
+            - The damage type.
+        #### Returns
+        - `float` : The weakness or resistance multiplier.
+        #### Raises
+        - `ValueError` : If the creature or the damage type is not in the matrix.
+        """
+        return float(self.values[self._get_creature_index(creature_key), self._get_damage_type_index(damage_type)])
+
+    def get_creature(self, creature_key: str) -> np.ndarray:
+        """
+        This method is responsible for getting the multipliers of a creature against every damage type.
+        #### Parameters
+        - `creature_key` : `str`
+            - The key name of the creature.
+        #### Returns
+        - `np.ndarray` : The multipliers, in the order of `damage_types`.
+        """
+        return self.values[self._get_creature_index(creature_key)]
+
+    def get_damage_type(self, damage_type: str) -> np.ndarray:
+        """
+        This method is responsible for getting the multipliers of every creature against a damage type.
+        #### Parameters
+        - `damage_type` : `str`
+            - The damage type.
+        #### Returns
+        - `np.ndarray` : The multipliers, in the order of `creature_keys`.
+        """
+        return self.values[:, self._get_damage_type_index(damage_type)]
+
+    def _get_creature_index(self, creature_key: str) -> int:
+        if creature_key not in self.creature_index:
+            raise ValueError(f'Invalid creature: {creature_key}')
+        return self.creature_index[creature_key]
+
+    def _get_damage_type_index(self, damage_type: str) -> int:
+        if damage_type not in self.damage_type_index:
+            raise ValueError(f'Invalid damage type: {damage_type}')
+        return self.damage_type_index[damage_type]
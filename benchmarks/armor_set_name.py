@@ -0,0 +1,74 @@
+"""
+Benchmark of `ItemSetsCrawler._get_armor_set_name` against the previous brute force implementation, on the item names
+of the crawled item sets and on synthetic sets with long names.
+
+Usage (from the repository root):
+    python -m benchmarks.armor_set_name [path to item_sets.json]
+"""
+import json
+import random
+import string
+import sys
+import time
+
+from pathlib import Path
+
+from crawler.item_sets import ItemSetsCrawler
+
+def brute_force_armor_set_name(item_names: list[str]) -> str:
+    if len(item_names) == 0:
+        return ''
+
+    shortest_string = min(item_names, key=len)
+    for length in range(len(shortest_string), 0, -1):
+        for start in range(len(shortest_string) - length + 1):
+            substring = shortest_string[start:start+length]
+            if all(substring in s for s in item_names):
+                return substring.strip().replace('of the ', '')
+
+    return ''
+
+def get_crawled_sets(data_path: Path) -> list[list[str]]:
+    data = json.loads(data_path.read_text())
+    return [[item['name']['text'] for item in item_set['items']] for item_set in data.values()]
+
+def get_synthetic_sets(name_length: int, set_count: int = 20, item_count: int = 5, seed: int = 0) -> list[list[str]]:
+    generator = random.Random(seed)
+    alphabet = string.ascii_letters + ' '
+    sets = []
+    for _ in range(set_count):
+        common = ''.join(generator.choices(alphabet, k=name_length // 4))
+        names = []
+        for _ in range(item_count):
+            prefix = ''.join(generator.choices(alphabet, k=generator.randint(0, name_length // 2)))
+            suffix = ''.join(generator.choices(alphabet, k=name_length - len(prefix) - len(common)))
+            names.append(f'{prefix}{common}{suffix}')
+        sets.append(names)
+    return sets
+
+def measure(function, sets: list[list[str]], repeat: int) -> tuple[float, list[str]]:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [function(names) for names in sets]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+def main() -> None:
+    data_path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('data/crawled/1.4.4.4634/item_sets.json')
+    cases = [(f'crawled, {data_path.name}', get_crawled_sets(data_path) if data_path.exists() else [], 20)]
+    for name_length in (50, 200, 800):
+        cases.append((f'synthetic, {name_length} characters', get_synthetic_sets(name_length), 1))
+
+    print(f'{"case":<50} {"sets":>5} {"brute force":>12} {"automaton":>12} {"speedup":>8}')
+    for name, sets, repeat in cases:
+        if not sets:
+            continue
+        brute_force_time, expected = measure(brute_force_armor_set_name, sets, repeat)
+        automaton_time, results = measure(ItemSetsCrawler._get_armor_set_name, sets, repeat)
+        if results != expected:
+            raise ValueError(f'The results differ from the brute force ones for: {name}')
+        print(f'{name:<50} {len(sets):>5} {brute_force_time * 1000:>10.2f}ms {automaton_time * 1000:>10.2f}ms {brute_force_time / automaton_time:>7.1f}x')
+
+if __name__ == '__main__':
+    main()
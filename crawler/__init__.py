@@ -16,4 +16,13 @@ from .crafting_recipes import CraftingRecipesCrawler
 from .status_effects import StatusEffectsCrawler
 from .mutations import MutationsCrawler
 
-from .base_crawler import BaseCrawler
\ No newline at end of file
+from .base_crawler import BaseCrawler
+from .datatable_cache import DataTableCache
+from .scheduler import CrawlScheduler
+from .manifest import CrawlManifest, SourceTracker
+from .datatable_reader import DataTableReader
+from .json_writer import JsonWriter
+from .model_cache import ModelCache
+from .crawled_data_reader import CrawledDataReader
+from .asset_index import AssetIndex
+from .path_resolver import PathResolver
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+Command line entry point of the crawlers, e.g.:
+    python -m crawler "D:/Grounded DataMining" 1.4.4.4634 --crawlers items status_effects --workers 4
+The output is saved to `data/crawled/<version>`, relative to the working directory.
+"""
+import argparse
+import re
+import sys
+
+from pathlib import Path
+
+from . import (
+    AchievementsCrawler, HarvestNodesCrawler, BestiaryCrawler, CharacterDataCrawler, ChatWheelCrawler, EmotesCrawler,
+    PetPersonalitiesCrawler, PlaceableStaticMeshesCrawler, PlaceableStaticMeshesManmadeCrawler,
+    PlaceableStaticMeshesNaturalCrawler, PlayerUpgradesCrawler, ToolsWeaponsCrawler, ItemsCrawler, ItemSetsCrawler,
+    CraftingRecipesCrawler, StatusEffectsCrawler, MutationsCrawler, BaseCrawler, CrawlScheduler
+)
+from global_database import GlobalDatabase
+
+# The crawlers by crawler name, since some of them already read the dump when they are created.
+crawler_classes: dict[str, type[BaseCrawler]] = {
+    'achievements': AchievementsCrawler,
+    'harvest_nodes': HarvestNodesCrawler,
+    'bestiary': BestiaryCrawler,
+    'character_data': CharacterDataCrawler,
+    'chat_wheel': ChatWheelCrawler,
+    'emotes': EmotesCrawler,
+    'pet_personalities': PetPersonalitiesCrawler,
+    'placeable_static_meshes': PlaceableStaticMeshesCrawler,
+    'placeable_static_meshes_manmade': PlaceableStaticMeshesManmadeCrawler,
+    'placeable_static_meshes_natural': PlaceableStaticMeshesNaturalCrawler,
+    'player_upgrades': PlayerUpgradesCrawler,
+    'tools_weapons': ToolsWeaponsCrawler,
+    'items': ItemsCrawler,
+    'item_sets': ItemSetsCrawler,
+    'crafting_recipes': CraftingRecipesCrawler,
+    'status_effects': StatusEffectsCrawler,
+    'mutations': MutationsCrawler
+}
+
+# The versions `GameVersion` reads: major, minor, patch and an optional build.
+version_pattern = re.compile(r'\d+\.\d+\.\d+(\.\d+)?')
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m crawler', description='Crawls the data of a game dump.')
+    parser.add_argument('root_path', type=Path, nargs='?', help='the directory with the dumps, one directory per version')
+    parser.add_argument('version', nargs='?', help='the game version to crawl (e.g.: 1.4.4.4634)')
+    parser.add_argument('--locale', default='enus', help='the locale of the localization file (default: enus)')
+    parser.add_argument('--crawlers', nargs='+', metavar='NAME', help='the crawlers to run (default: all), their dependencies are added')
+    parser.add_argument('--skip-crawled-dependencies', action='store_true', help='don\'t run the dependencies that have a saved output, it is loaded when it is looked up')
+    parser.add_argument('--list', action='store_true', help='list the crawler names and exit')
+    parser.add_argument('--workers', type=int, default=None, help='the number of worker processes (default: the number of CPUs, 1 runs in this process)')
+    parser.add_argument('--format', choices=['pretty', 'compact'], default='pretty', help='the JSON output format (default: pretty)')
+    parser.add_argument('--indent', type=int, default=4, help='the indentation of the pretty output (default: 4)')
+    parser.add_argument('--normalized', action='store_true', help='save the nested items and status effects as references')
+    parser.add_argument('--hide-unknown-fields', action='store_true', help='leave out the unknown fields of the rows')
+    return parser
+
+def get_crawlers(names: list[str], hide_unknown_fields: bool, skip_crawled_dependencies: bool = False) -> list[BaseCrawler]:
+    """
+    This function is responsible for creating the crawlers to run. `BaseCrawler.init` must have been called before.
+    #### Parameters
+    - `names` : `list[str]`
+        - The names of the crawlers, or `None` for all of them.
+    - `hide_unknown_fields` : `bool`
+        - Whether the unknown fields of the rows are left out.
+    - `skip_crawled_dependencies` : `bool`
+        - Whether the dependencies that have a saved output are left out, see `GlobalDatabase.get_table`.
+    #### Returns
+    - `list[BaseCrawler]` : The crawlers, with the crawlers they depend on.
+    #### Raises
+    - `ValueError` : If a crawler name is unknown.
+    """
+    if names is None:
+        names = list(crawler_classes)
+
+    unknown_names = [name for name in names if name not in crawler_classes]
+    if unknown_names:
+        raise ValueError(f'Unknown crawlers: {", ".join(unknown_names)}. Available crawlers: {", ".join(crawler_classes)}')
+
+    # The dependencies reuse their previous output when it is up to date, see `BaseCrawler.crawl`.
+    selected = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending += [
+                dependency for dependency in crawler_classes[name].dependencies
+                if not (skip_crawled_dependencies and dependency not in names and GlobalDatabase.is_available(dependency))
+            ]
+    return [crawler_class(hide_unknown_fields) for name, crawler_class in crawler_classes.items() if name in selected]
+
+def main() -> None:
+    parser = get_parser()
+    args = parser.parse_args()
+    if args.list:
+        print('\n'.join(crawler_classes))
+        return
+    if args.root_path is None or args.version is None:
+        parser.error('the root_path and the version are required')
+    if not version_pattern.fullmatch(args.version):
+        parser.error(f'invalid version: {args.version} (expected major.minor.patch[.build], e.g.: 1.4.4.4634)')
+
+    indent = args.indent if args.format == 'pretty' else None
+    BaseCrawler.init(root_path=args.root_path, version=args.version, locale=args.locale, indent=indent, normalized=args.normalized)
+    if not BaseCrawler.root_path.exists():
+        sys.exit(f'The dump directory does not exist: {BaseCrawler.root_path}')
+    try:
+        crawlers = get_crawlers(args.crawlers, args.hide_unknown_fields, args.skip_crawled_dependencies)
+    except ValueError as error:
+        sys.exit(str(error))
+
+    scheduler = CrawlScheduler(crawlers, args.workers)
+    scheduler.run()
+    print(scheduler.get_report())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+import os
+
+from pathlib import Path
+from typing import Iterable
+
+class AssetIndex:
+    """
+    The exported files of a dump (`json_data` and `media_data`), indexed with a single directory walk, so the crawlers
+    check and resolve the referenced assets without a syscall per lookup.
+    Paths are looked up case insensitively, like the game paths, by their path relative to the dump, and resolve to the
+    real path of the file. Game paths (e.g.: `/Game/Blueprints/Items/Table_AllItems.Table_AllItems`, as an ObjectPath
+    or an AssetPathName) are looked up with `get_json_path` and `get_media_path`.
+    The assets that are checked with `check` and are missing are recorded as dangling references, with the crawlers
+    that reference them, until they are taken with `pop_dangling`.
+    #### Parameters
+    - `root_path` : `Path`
+        - The path to the dump of a version.
+    #### Attributes
+    - `indexes` : `dict[str, AssetIndex]`
+        - The index of every dump, by absolute path, built on the first `get`.
+    """
+    indexes: dict[str, 'AssetIndex'] = {}
+    folders: list[str] = ['json_data', 'media_data']
+
+    def __init__(self, root_path: Path):
+        self.root_path = os.path.abspath(root_path)
+        self.prefix = os.path.join(self.root_path, '').lower()
+        self.files: dict[str, str] = {}
+        self.dangling: dict[str, set[str]] = {}
+        # The folders that were exported, since a dump without images has no `media_data`.
+        self.exported_folders = {folder for folder in AssetIndex.folders if os.path.isdir(os.path.join(self.root_path, folder))}
+
+        for folder in self.exported_folders:
+            for directory, _, file_names in os.walk(os.path.join(self.root_path, folder)):
+                for file_name in file_names:
+                    path = os.path.join(directory, file_name)
+                    self.files[self._get_key(path)] = path
+
+    @staticmethod
+    def get(root_path: Path) -> 'AssetIndex':
+        """
+        This method is responsible for getting the index of a dump, walking it only the first time.
+        #### Parameters
+        - `root_path` : `Path`
+            - The path to the dump of a version.
+        #### Returns
+        - `AssetIndex` : The index of the dump.
+        """
+        root_path = os.path.abspath(root_path)
+        if root_path not in AssetIndex.indexes:
+            AssetIndex.indexes[root_path] = AssetIndex(root_path)
+        return AssetIndex.indexes[root_path]
+
+    @staticmethod
+    def clear() -> None:
+        """
+        This method is responsible for dropping the indexes, so the dumps are walked again on the next `get`.
+        """
+        AssetIndex.indexes.clear()
+
+    @staticmethod
+    def pop_all_dangling() -> dict[str, list[str]]:
+        """
+        This method is responsible for taking the dangling references recorded so far by every index.
+        #### Returns
+        - `dict[str, list[str]]` : The referrers of every missing file, by path.
+        """
+        dangling = {}
+        for index in AssetIndex.indexes.values():
+            dangling.update(index.pop_dangling())
+        return dangling
+
+    def exists(self, path: Path | str) -> bool:
+        """
+        This method is responsible for checking if a file exists in the dump.
+        #### Parameters
+        - `path` : `Path | str`
+            - The path to the file.
+        #### Returns
+        - `bool` : Whether the file exists. Paths outside of the dump are checked on the disk.
+        """
+        return self.resolve(path) is not None
+
+    def resolve(self, path: Path | str) -> str:
+        """
+        This method is responsible for getting the real path of a file of the dump.
+        #### Parameters
+        - `path` : `Path | str`
+            - The path to the file, in any case.
+        #### Returns
+        - `str` : The path to the file on the disk, or `None` if it doesn't exist.
+        """
+        key = self._get_key(path)
+        if key is None:
+            return str(path) if os.path.exists(path) else None
+        return self.files.get(key)
+
+    def get_json_path(self, game_path: str) -> str:
+        """
+        This method is responsible for getting the JSON export of a game path.
+        #### Parameters
+        - `game_path` : `str`
+            - The game path (e.g.: `/Game/Blueprints/Items/Table_AllItems.Table_AllItems`).
+        #### Returns
+        - `str` : The path to the JSON export, or `None` if it wasn't exported.
+        """
+        return self.files.get(AssetIndex._get_game_key(game_path, 'json_data', '.json'))
+
+    def get_media_path(self, game_path: str) -> str:
+        """
+        This method is responsible for getting the exported image of a game path.
+        #### Parameters
+        - `game_path` : `str`
+            - The game path (e.g.: `/Game/UI/Images/Icons/T_UI_Pebble.T_UI_Pebble`).
+        #### Returns
+        - `str` : The path to the PNG, or `None` if it wasn't exported.
+        """
+        return self.files.get(AssetIndex._get_game_key(game_path, 'media_data', '.png'))
+
+    def check(self, path: Path | str, referrer: str) -> bool:
+        """
+        This method is responsible for checking if a referenced file exists, recording it as dangling otherwise. The
+        files of a folder that was not exported at all are not recorded.
+        #### Parameters
+        - `path` : `Path | str`
+            - The path to the file.
+        - `referrer` : `str`
+            - What references the file, usually the name of the crawler.
+        #### Returns
+        - `bool` : Whether the file exists.
+        """
+        if self.exists(path):
+            return True
+        key = self._get_key(path)
+        if key is not None and key.split('/')[0] not in self.exported_folders:
+            return False
+        self.dangling.setdefault(Path(path).as_posix(), set()).add(referrer)
+        return False
+
+    def find_dangling(self, paths: Iterable[Path | str]) -> list[str]:
+        """
+        This method is responsible for checking many paths at once.
+        #### Parameters
+        - `paths` : `Iterable[Path | str]`
+            - The paths to check.
+        #### Returns
+        - `list[str]` : The paths that don't exist, in the given order.
+        """
+        return [str(path) for path in paths if not self.exists(path)]
+
+    def pop_dangling(self) -> dict[str, list[str]]:
+        """
+        This method is responsible for taking the dangling references recorded so far.
+        #### Returns
+        - `dict[str, list[str]]` : The referrers of every missing file, by path.
+        """
+        dangling = {path: sorted(referrers) for path, referrers in sorted(self.dangling.items())}
+        self.dangling.clear()
+        return dangling
+
+    def _get_key(self, path: Path | str) -> str:
+        # The crawlers build some paths with doubled separators (e.g.: `json_data//Maine`), which are normalized too.
+        path = os.path.abspath(path).lower()
+        if not path.startswith(self.prefix):
+            return None
+        return path[len(self.prefix):].replace(os.sep, '/')
+
+    @staticmethod
+    def _get_game_key(game_path: str, folder: str, extension: str) -> str:
+        # `/Game/...` is the content of the `Maine` project, and the object name after the `.` is not part of the file.
+        directory, _, name = game_path.strip('/').rpartition('/')
+        mount, _, directory = directory.partition('/')
+        project = 'Maine' if mount.lower() == 'game' else mount
+        return '/'.join(part for part in (folder, project, 'Content', directory, name.split('.')[0] + extension) if part).lower()
@@ -1,14 +1,25 @@
-from typing import Any
+from typing import Any, Callable, Iterable
 from pathlib import Path
-from models import DisplayName
+from models import DisplayName, Localization, Reference
 from models.status_effect import StatusEffect
 from models.item import Item
 from models.recipe_component import RecipeComponent
 from models.item_effects_info import ItemEffectsInfo
 from models.equippable_data import EquippableData
 from global_database import GlobalDatabase
+from row_store import RowStoreWriter
+from util.parse_cache import ParseCache
+from .datatable_cache import DataTableCache
+from .model_cache import ModelCache
+from .datatable_reader import DataTableReader
+from .json_writer import JsonWriter
+from .blueprint_resolver import BlueprintResolver
+from .asset_index import AssetIndex
+from .path_resolver import PathResolver
+from .manifest import CrawlManifest, SourceTracker
 
 import json
+import os
 
 class BaseCrawler:
     """
@@ -20,74 +31,173 @@ class BaseCrawler:
         - The path to the root directory.
     - `json_path` : `Path`
         - The path to the json data directory.
+    - `lang_path` : `Path`
+        - The path to the localization file of the current build.
     - `media_path` : `Path`
         - The path to the media directory.
     - `hide_unknown_fields` : `bool`
         - A flag to hide the unknown fields.
     - `unknown_field_list` : `list`
         - The list of unknown fields.
+    - `blueprints` : `BlueprintResolver`
+        - The memoized blueprints read by the crawler.
+    - `source_files` : `list[Path]`
+        - The files, besides the DataTable and the localization file, that every row of the crawler depends on.
+    - `stream_rows` : `bool`
+        - A flag to read the DataTable row by row instead of parsing the whole export, for large tables.
     """
     root_path: Path = None
+    lang_path: Path = None
 
-    items_table = None
-    status_effects_table = None
+    # DataTables read by most of the crawlers. They are pinned in the `DataTableCache` for the whole run.
+    shared_tables: list[Path] = [
+        Path('Maine/Content/Blueprints/Items/Table_AllItems.json'),
+        Path('Maine/Content/Blueprints/Attacks/Table_StatusEffects.json'),
+        Path('Maine/Content/Blueprints/DataTables/Table_CharacterData.json'),
+    ]
+    pinned_tables: list[Path] = []
+    init_args: tuple = None
+
+    # The indentation of the saved JSON files. `None` saves them compact.
+    indent: int = 4
+
+    # The names of the crawlers whose data this crawler reads from the `GlobalDatabase`.
+    dependencies: list[str] = []
+
+    # The compiled extractor of each list of unknown fields, see `_compile_unknown_fields`.
+    unknown_field_extractors: dict[tuple, Callable[[Any], dict[str, Any]]] = {}
 
     def __init__(self, name: str, json_path: Path, hide_unknown_fields: bool = False):
         self.crawler_name = name
         self.json_path = self.root_path / 'json_data' / json_path
-        self.lang_path = self.root_path / 'json_data/Maine/Content/Exported/BaseGame/Localized' / BaseCrawler.locale / f'Text/Text_{BaseCrawler.locale}.json'
         self.media_path = self.root_path / 'media_data'
         self.hide_unknown_fields = hide_unknown_fields
         self.unknown_field_list = []
         self.crawled_data = {}
-
-        DisplayName.init(self.lang_path)
+        self.blueprints = BlueprintResolver(self._build_real_path, self._resolve_asset)
+        self.source_files = []
+        self.stream_rows = False
 
     @staticmethod
-    def init(root_path: Path, version: str, locale: str = 'enus'):
+    def init(root_path: Path, version: str, locale: str = 'enus', indent: int = 4, normalized: bool = False):
         """
         This method is responsible for initializing the crawler.
         #### Parameters
         - `root_path` : `Path`
             - The path to the root directory.
+        - `version` : `str`
+            - The game version to crawl.
+        - `locale` : `str`
+            - The locale of the localization file.
+        - `indent` : `int`
+            - The indentation of the saved JSON files, or `None` to save them compact.
+        - `normalized` : `bool`
+            - A flag to save the nested items and status effects as references to the `items` and `status_effects`
+              outputs instead of full copies.
         """
+        BaseCrawler.init_args = (root_path, version, locale, indent, normalized)
         BaseCrawler.version = GameVersion(version)
+        BaseCrawler.indent = indent
+        Reference.normalized = normalized
         BaseCrawler.root_path = Path(f'{root_path}/{version}')
         BaseCrawler.locale = locale
+        BaseCrawler.lang_path = BaseCrawler.root_path / 'json_data/Maine/Content/Exported/BaseGame/Localized' / locale / f'Text/Text_{locale}.json'
+
+        # The localization file is only read on the first lookup and is shared by every crawler of this build.
+        Localization.register(version, locale, BaseCrawler.lang_path)
+        # The referenced items and status effects are built once per run, for the current build and locale.
+        ModelCache.clear()
+        # The dump is walked again on the first asset lookup of the run.
+        AssetIndex.clear()
+        PathResolver.clear()
+        # The parsed exports are saved next to the dump, so the next runs on this build don't parse the JSON again.
+        ParseCache.configure(BaseCrawler.root_path / 'parse_cache')
+        # The crawlers that don't run in this process are loaded from their saved output when they are looked up.
+        GlobalDatabase.set_crawled_data_path(BaseCrawler._get_crawled_data_path())
+
+        for table_path in BaseCrawler.pinned_tables:
+            DataTableCache.unpin(table_path)
+        BaseCrawler.pinned_tables = [BaseCrawler.root_path / 'json_data' / table_path for table_path in BaseCrawler.shared_tables]
+        for table_path in BaseCrawler.pinned_tables:
+            DataTableCache.pin(table_path)
 
     def dispose(self) -> None:
         """
         This method is responsible for disposing the crawler.
+        The DataTables stay in the `DataTableCache` so the next crawlers don't parse them again.
         """
-        BaseCrawler.items_table = None
-        BaseCrawler.status_effects_table = None
+        self.raw_data = None
+        self.blueprints.clear()
 
     def crawl(self) -> list:
         """
         This method is responsible for crawling the data from the game.
+        The previous output is reused when the manifest of the last run shows that none of the source files changed.
+        Otherwise only the rows whose source row or referenced files changed are parsed again.
         #### Returns
         - `list` : The crawled data.
         """
-        json_data = self.json_path.read_text()
-        data = json.loads(json_data)
-        if len(data) > 1:
-            print('There are more than 1 entry in the creatures DataTable.')
-            return []
-        data = data[0]['Rows']
-        self.raw_data = data
-
+        manifest = CrawlManifest(BaseCrawler._get_crawled_data_path() / 'manifest' / f'{self.crawler_name}.json')
+        options = {'hide_unknown_fields': self.hide_unknown_fields, 'indent': BaseCrawler.indent, 'normalized': Reference.normalized}
+        source_files = self._get_source_files()
+        model = GlobalDatabase.models.get(self.crawler_name)
+
+        previous_data = None
+        if model is not None and manifest.is_reusable(options) and manifest.are_sources_unchanged(source_files, exclude=os.path.abspath(self.json_path)):
+            previous_data = self._load_previous_data()
+
+        if previous_data is not None and manifest.are_sources_unchanged(source_files) and manifest.are_files_unchanged():
+            print(f'{self.crawler_name} is up to date, reusing the previous output.')
+            rows_path = BaseCrawler._get_crawled_data_path() / f'{self.crawler_name}.rows'
+            if not rows_path.exists():
+                # An output saved before the `.rows` files were written next to it.
+                with RowStoreWriter(rows_path) as row_writer:
+                    for key, value in previous_data.items():
+                        row_writer.write(key, value)
+            crawled_data = {key: model.from_dict(value) for key, value in previous_data.items()}
+            GlobalDatabase.add_crawled_data(self.crawler_name, crawled_data)
+            self.crawled_data = crawled_data
+            return crawled_data
+
+        rows = {}
         crawled_data = {}
-        for key, value in data.items():
-            if self.hide_unknown_fields:
-                unknown_fields = None
-            else:
-                unknown_fields = self._get_unknown_fields(value, self.unknown_field_list)
-
-            crawled_data[key] = self._get_crawled_data(key, value, unknown_fields)
+        with SourceTracker.track() as files:
+            data = self._read_rows()
+            if data is None:
+                return []
+
+            # Each row is written as soon as it is crawled, so the whole output is never held as dicts or as a string.
+            # The `.rows` file is the same output, indexed by key name for the readers that only look up a few rows.
+            data_path = BaseCrawler._get_crawled_data_path() / f'{self.crawler_name}.json'
+            # The previous output may be mapped, if it was looked up before, and is about to be replaced.
+            GlobalDatabase.unload(self.crawler_name)
+            with JsonWriter(data_path, BaseCrawler.indent) as writer, RowStoreWriter(data_path.with_suffix('.rows')) as row_writer:
+                for key, value in data:
+                    row_hash = CrawlManifest.hash_row(value)
+                    if previous_data is not None and key in previous_data and manifest.is_row_unchanged(key, row_hash):
+                        row_files = manifest.get_row_files(key)
+                        SourceTracker.touch_all(row_files)
+                        crawled_data[key] = model.from_dict(previous_data[key])
+                        rows[key] = {'hash': row_hash, 'files': row_files}
+                        writer.write(key, previous_data[key])
+                        row_writer.write(key, previous_data[key])
+                        continue
+
+                    with SourceTracker.track() as row_files:
+                        if self.hide_unknown_fields:
+                            unknown_fields = None
+                        else:
+                            unknown_fields = self._get_unknown_fields(value, self.unknown_field_list)
+
+                        crawled_data[key] = self._get_crawled_data(key, value, unknown_fields)
+                    rows[key] = {'hash': row_hash, 'files': sorted(row_files)}
+                    row = crawled_data[key].to_dict()
+                    writer.write(key, row)
+                    row_writer.write(key, row)
         
         GlobalDatabase.add_crawled_data(self.crawler_name, crawled_data)
 
-        self._save(crawled_data, f'{self.crawler_name}.json')
+        manifest.save(options, source_files, files, rows)
 
         self.dispose()
 
@@ -125,57 +235,100 @@ class BaseCrawler:
         """
         pass
 
-    # TODO: Refactor this function so it can handle index based unknown fields (like the ones in the creature info)
-    def _get_unknown_fields(self, value: dict, fields: list[str]) -> dict[str, Any]:
+    def _get_unknown_fields(self, value: dict | list, fields: list[str | int]) -> dict[str, Any]:
         """
         This method is responsible for getting the unknown fields of the creature.
         #### Parameters
-        - `value` : `dict`
+        - `value` : `dict | list`
             - The value of the creature.
         - `fields` : `list`
-            - The fields to be extracted.
+            - The fields to be extracted: keys, `'A>B>C'` paths, and indexes (e.g.: `10` or `'Tiers>0>Value'`).
         #### Returns
         - `dict` : The unknown fields of the creature.
         """
         if self.hide_unknown_fields:
             return None
 
-        unknown_fields = {}
+        fields_key = tuple(fields)
+        extractor = BaseCrawler.unknown_field_extractors.get(fields_key)
+        if extractor is None:
+            extractor = BaseCrawler._compile_unknown_fields(fields)
+            BaseCrawler.unknown_field_extractors[fields_key] = extractor
+        return extractor(value)
+
+    @staticmethod
+    def _compile_unknown_fields(fields: list[str | int]) -> Callable[[Any], dict[str, Any]]:
+        """
+        This method is responsible for compiling a list of unknown fields into a function that extracts them, so the
+        paths are only split once instead of once per row.
+        #### Parameters
+        - `fields` : `list`
+            - The fields to be extracted: keys, `'A>B>C'` paths, and indexes (e.g.: `10` or `'Tiers>0>Value'`). A digit
+              segment is an index when its value is a list and a key when it is a dictionary.
+        #### Returns
+        - `Callable` : The function that extracts the fields from a value, nesting them as in the value.
+        """
+        # A trie of the paths, where `None` marks a field that is extracted whole.
+        trie: dict = {}
         for field in fields:
-            if '>' in field:
-                keys = field.split('>')
-                first_key = keys[0]
-                second_key = '>'.join(keys[1:])
-                if first_key not in unknown_fields:
-                    unknown_fields[first_key] = {}
-                unknown_fields[first_key].update(self._get_unknown_fields(value[first_key], [second_key]))
+            segments = field.split('>') if isinstance(field, str) else [field]
+            node = trie
+            for segment in segments[:-1]:
+                node = node.setdefault(segment, {})
+                if node is None:
+                    break
             else:
-                unknown_fields[field] = value[field]
+                node[segments[-1]] = None
 
-        return unknown_fields
+        return BaseCrawler._compile_unknown_field_node(trie)
+
+    @staticmethod
+    def _compile_unknown_field_node(node: dict) -> Callable[[Any], dict[str, Any]]:
+        children = [
+            (
+                segment,
+                int(segment) if isinstance(segment, int) or segment.isdigit() else None,
+                BaseCrawler._compile_unknown_field_node(child) if child is not None else None
+            )
+            for segment, child in node.items()
+        ]
+
+        if all(child is None and index is None for _, index, child in children):
+            segments = list(node)
+
+            def extract(value: Any) -> dict[str, Any]:
+                return {segment: value[segment] for segment in segments}
+
+            return extract
+
+        def extract(value: Any) -> dict[str, Any]:
+            if isinstance(value, list):
+                # A key segment on a list fails like the lookup itself would.
+                return {
+                    segment: value[key] if child is None else child(value[key])
+                    for segment, index, child in children
+                    for key in [segment if index is None else index]
+                }
+            return {segment: value[segment] if child is None else child(value[segment]) for segment, _, child in children}
+
+        return extract
 
     def _get_media_path(self, value: dict) -> Path:
         """
-        This method is responsible for getting the media path of the harvest node.
+        This method is responsible for getting the path of the exported image of an object or soft object reference.
         #### Parameters
         - `value` : `dict`
-          - The value of the harvest node.
+          - The reference, with either an `ObjectPath` or an `AssetPathName`.
         #### Returns
-        - `Path` : The media path of the harvest node.
+        - `Path` : The path to the image, or an empty path if the reference is empty.
         """
-        if value == None:
+        game_path = PathResolver.get_game_path(value)
+        if game_path is None:
             return Path()
-        if 'ObjectPath' in value and value['ObjectPath'] == 'None':
-            return Path()
-        if 'AssetPathName' in value and value['AssetPathName'] == 'None':
-            return Path()
-        
-        path = value['ObjectPath'] if 'ObjectPath' in value else value['AssetPathName']
 
-        icon_ingame_path = path.replace('Game/', 'Maine/Content/')
-        icon_ingame_path = f'{icon_ingame_path.split('.')[0]}.png'
-        icon_path = str(self.media_path) + icon_ingame_path
-        return Path(icon_path)
+        icon_path = PathResolver.resolve(self.root_path, 'media_data', game_path, '.png')
+        self._get_assets().check(icon_path, self.crawler_name)
+        return icon_path
 
     def _build_real_path(self, path: str) -> str:
         """
@@ -186,61 +339,127 @@ class BaseCrawler:
         #### Returns
         - `str` : The real path of the path.
         """
-        real_path = path.replace('Game/', 'Maine/Content/')
-        real_path = f'{real_path.split('.')[0]}.json'
-        real_path = str(self.root_path) + '/json_data/' + real_path
-        return real_path
+        return str(PathResolver.resolve(self.root_path, 'json_data', path, '.json'))
+
+    @staticmethod
+    def _get_assets() -> AssetIndex:
+        """
+        This method is responsible for getting the index of the exported files of the current build.
+        #### Returns
+        - `AssetIndex` : The index, built on the first lookup of the run.
+        """
+        return AssetIndex.get(BaseCrawler.root_path)
+
+    def _resolve_asset(self, path: str) -> str:
+        """
+        This method is responsible for getting the real path of an exported file, recording it as a dangling reference
+        of the crawler when it is missing.
+        #### Parameters
+        - `path` : `str`
+            - The path to the exported file.
+        #### Returns
+        - `str` : The path to the file on the disk, or `None` if it wasn't exported.
+        """
+        assets = self._get_assets()
+        if not assets.check(path, self.crawler_name):
+            return None
+        return assets.resolve(path)
 
     def _get_object_path(self, value: dict) -> Path:
         """
-        This method is responsible for getting the object path of the harvest node.
+        This method is responsible for getting the path of the JSON export of an object or soft object reference.
         #### Parameters
         - `value` : `dict`
-          - The value of the harvest node.
+          - The reference, with either an `ObjectPath` or an `AssetPathName`.
         #### Returns
-        - `Path` : The object path of the harvest node.
+        - `Path` : The path to the export, or an empty path if the reference is empty.
         """
-        if value == None:
-            return Path()
-        if 'ObjectPath' in value and value['ObjectPath'] == 'None':
+        game_path = PathResolver.get_game_path(value)
+        if game_path is None:
             return Path()
+        return PathResolver.resolve(self.root_path, 'json_data', game_path, '.json')
 
-        path = value['ObjectPath']
-        object_path = path.replace('Game/', 'Maine/Content/')
-        object_path = f'{object_path.split('.')[0]}.json'
-        object_path = str(self.root_path) + '/json_data/' + object_path
-        return Path(object_path)
+    def _read_rows(self) -> Iterable[tuple[str, dict[str, Any]]]:
+        """
+        This method is responsible for reading the rows of the DataTable of the crawler.
+        With `stream_rows` the rows are read one at a time and never kept, instead of parsing the whole export.
+        #### Returns
+        - `Iterable[tuple[str, dict]]` : The `(row_name, row)` pairs, or `None` if the DataTable has more than one export.
+        """
+        if self.stream_rows:
+            self.raw_data = None
+            reader = DataTableReader(self.json_path)
+            if reader.count_exports() > 1:
+                print('There are more than 1 entry in the creatures DataTable.')
+                return None
+            return reader
+
+        data = DataTableCache.get(self.json_path)
+        if len(data) > 1:
+            print('There are more than 1 entry in the creatures DataTable.')
+            return None
+        self.raw_data = data[0]['Rows']
+        return self.raw_data.items()
 
-    def _save(self, data: list, file_name: str) -> None:
+    @staticmethod
+    def _get_crawled_data_path() -> Path:
         """
-        This method is responsible for saving the data to a file.
-        #### Parameters
-        - `data` : `list`
-            - The data to be saved.
-        - `file_name` : `str`
-            - The name of the file to save the data.
+        This method is responsible for getting the directory where the crawled data of the current build is saved.
+        #### Returns
+        - `Path` : The path to the crawled data directory.
+        """
+        return Path(f'data/crawled/{BaseCrawler.version}')
+
+    def _load_previous_data(self) -> dict[str, Any]:
+        """
+        This method is responsible for loading the output of the last run of the crawler.
+        #### Returns
+        - `dict` : The saved rows, or `None` if the crawler was never saved for this build.
         """
-        crawled_data_path = Path(f'data/crawled/{BaseCrawler.version}')
-        if not crawled_data_path.exists():
-            crawled_data_path.mkdir(parents=True)
-        data_path = crawled_data_path / file_name
+        data_path = BaseCrawler._get_crawled_data_path() / f'{self.crawler_name}.json'
+        if not data_path.exists():
+            return None
+        return json.loads(data_path.read_text())
 
-        json_data = {}
-        for key, value in data.items():
-            json_data[key] = value.to_dict()
-        data_path.write_text(json.dumps(json_data, indent=4))
+    def _get_source_files(self) -> list[Path]:
+        """
+        This method is responsible for getting the files that every row of the crawler depends on.
+        The code of the crawlers and models is included, so a change in the parsing invalidates the previous output.
+        #### Returns
+        - `list[Path]` : The paths to the source files.
+        """
+        package_path = Path(__file__).parent
+        code_files = [*package_path.glob('*.py'), *(package_path.parent / 'models').glob('*.py'), package_path.parent / 'global_database.py']
+        return [self.json_path, self.lang_path, *self.source_files, *code_files]
 
     def _parse_status_effect(self, datatable: dict[str, Any]) -> StatusEffect:
         key_name = datatable['RowName']
         object_path = self._get_object_path(datatable['DataTable'])
 
-        if BaseCrawler.status_effects_table is None and 'Table_StatusEffects' in object_path.name:
-            BaseCrawler.status_effects_table = json.loads(object_path.read_text(encoding='utf-8'))[0]['Rows']
-        elif 'Table_StatusEffects' not in object_path.name:
+        if 'Table_StatusEffects' not in object_path.name:
             raise ValueError('The provided object path is not a status effects table.')
         
-        status_effect_json = BaseCrawler.status_effects_table[key_name]
+        return self._get_status_effect(object_path, key_name)
 
+    def _get_status_effect(self, table_path: Path | str, key_name: str) -> StatusEffect:
+        """
+        This method is responsible for getting a status effect from the flyweight `ModelCache`.
+        #### Parameters
+        - `table_path` : `Path | str`
+            - The path to the status effects table.
+        - `key_name` : `str`
+            - The RowName of the status effect.
+        #### Returns
+        - `StatusEffect` : The status effect, shared by every row that references it.
+        """
+        return ModelCache.get(
+            table_path,
+            key_name,
+            lambda: self._build_status_effect(key_name, DataTableCache.get_rows(table_path)[key_name]),
+            self.hide_unknown_fields
+        )
+
+    def _build_status_effect(self, key_name: str, status_effect_json: dict[str, Any]) -> StatusEffect:
         display_name = DisplayName(
             table_id=status_effect_json['DisplayData']['Name']['StringTableID'],
             string_id=status_effect_json['DisplayData']['Name']['StringID'],
@@ -318,16 +537,21 @@ class BaseCrawler:
             return None
         object_path = self._get_object_path(datatable['DataTable'])
 
-        if BaseCrawler.items_table is None and 'Table_AllItems' in object_path.name:
-            BaseCrawler.items_table = json.loads(object_path.read_text(encoding='utf-8'))[0]['Rows']
-        elif 'Table_AllItems' not in object_path.name:
+        if 'Table_AllItems' not in object_path.name:
             raise ValueError('The provided object path is not an items table.')
         
         # TODO: Keep track of this as this is the only different key that I found
         if key_name == 'CrossbowCrow':
             key_name = 'CrossBowCrow'
-        item_json = BaseCrawler.items_table[key_name]
 
+        return ModelCache.get(
+            object_path,
+            key_name,
+            lambda: self._build_item(key_name, DataTableCache.get_rows(object_path)[key_name]),
+            self.hide_unknown_fields
+        )
+
+    def _build_item(self, key_name: str, item_json: dict[str, Any]) -> Item:
         display_name = self._get_display_name(item_json['LocalizedDisplayName'])
         description = self._get_display_name(item_json['LocalizedDescription'])
 
@@ -1,19 +1,15 @@
-import json
-import os
-
 from pathlib import Path
 from typing import Any
 
-from models import Creature, CreatureInfo, StatusEffect, DisplayName, Item, CharacterData
+from models import Creature, CreatureInfo, DisplayName, Item, CharacterData
 from models import UEDataTableReference, UEObject, Weakpoint, RecipeComponent
 from .base_crawler import BaseCrawler
+from .datatable_cache import DataTableCache
 
 class BestiaryCrawler(BaseCrawler):
     """
     This class is responsible for crawling the bestiary data from the game.
     """
-    character_data_table = None
-
     def __init__(self, hide_unknown_fields: bool = False):
         super().__init__(
             name='bestiary',
@@ -25,17 +21,9 @@ class BestiaryCrawler(BaseCrawler):
             'Stats'
         ]
 
-    def dispose(self) -> None:
-        BestiaryCrawler.character_data_table = None
-
     # TODO: Revise this parsing since the Creature Blueprint has a structure of its own
     def _parse_creature_info(self, asset_path_name: str) -> tuple[DisplayName, CreatureInfo]:
-        creature_bp_path = self._build_real_path(asset_path_name)
-        creature_bp = None
-        if not os.path.exists(creature_bp_path):
-            return None, None
-        with open(creature_bp_path, 'r') as file:
-            creature_bp = json.load(file)
+        creature_bp = self.blueprints.resolve(asset_path_name)
         if creature_bp is None:
             return None, None
         
@@ -47,67 +35,33 @@ class BestiaryCrawler(BaseCrawler):
             'StatusEffectComponent': {},
             'TeamComponent': {}
         }
-        for component in creature_bp:
-            if component['Name'].startswith('Default__'):
-                components['DefaultComponent'] = component['Properties']
-                continue
-            if component['Type'] not in components:
+        for component_type in components:
+            components[component_type] = creature_bp.components.get(component_type, {})
+        
+        # The templates are memoized and shared by every creature that uses them, so their values are copied instead.
+        health = None
+        base_damage_reduction = None
+        team = None
+        name = None
+        for component_type, template_path in creature_bp.template_paths.items():
+            if component_type not in components or component_type == 'DefaultComponent':
                 continue
 
-            components[component['Type']] = {}
-            if 'Properties' in component:
-                components[component['Type']] = component['Properties']
+            templated_name, template = self.blueprints.parse('creature_info', template_path, self._parse_creature_info)
+            if template is None:
+                continue
 
-            if 'Template' in component:
-                components[f'{component["Type"]}Template'] = component['Template']
-        
-        creature_info = CreatureInfo(
-            health=None,
-            base_damage_reduction=None,
-            weakpoints=None,
-            loot=None,
-            max_stun=None,
-            stun_decay=None,
-            stun_duration=None,
-            stun_cooldown=None,
-            status_effects=None,
-            immunity_tags=None,
-            team=None,
-            unknown_fields=None
-        )   
-        name = None 
-        for component in components:
-            if component.endswith('Template'):
-                templated_name, template = self._parse_creature_info(components[component]['ObjectPath'])
-
-                if template is not None:
-                    creature_info = template
-
-                if component.startswith('Default__'):
-                    continue
-                elif component.startswith('HealthComponent'):
-                    creature_info.health = template.health
-                    creature_info.base_damage_reduction = template.base_damage_reduction
-                    if templated_name is not None:
-                        name = templated_name
-                elif component.startswith('LootComponent'):
-                    continue
-                elif component.startswith('ReactionComponent'):
-                    continue
-                elif component.startswith('StatusEffectComponent'):
-                    continue
-                elif component.startswith('TeamComponent'):
-                    continue
+            health = template.health
+            base_damage_reduction = template.base_damage_reduction
+            team = template.team
+            if component_type == 'HealthComponent' and templated_name is not None:
+                name = templated_name
 
-        try:
-            creature_info.health = components['HealthComponent']['MaxHealth']
-        except:
-            pass
+        if 'MaxHealth' in components['HealthComponent']:
+            health = components['HealthComponent']['MaxHealth']
 
-        try:
-            creature_info.base_damage_reduction = components['HealthComponent']['BaseDamageReduction']
-        except:
-            pass
+        if 'BaseDamageReduction' in components['HealthComponent']:
+            base_damage_reduction = components['HealthComponent']['BaseDamageReduction']
 
         weakpoints = []
         collision_configs = [] if 'ColliderConfigs' not in components['HealthComponent'] else components['HealthComponent']['ColliderConfigs']
@@ -147,62 +101,30 @@ class BestiaryCrawler(BaseCrawler):
             stun_duration = 0
             stun_cooldown = 0
 
-        if BestiaryCrawler.status_effects_table is None:
-            with open(self._build_real_path('/Game/Blueprints/Attacks/Table_StatusEffects.json'), 'r') as file:
-                BestiaryCrawler.status_effects_table = json.load(file)[0]['Rows']
+        status_effects_table_path = self._build_real_path('/Game/Blueprints/Attacks/Table_StatusEffects.json')
 
         status_effects = []
         default_status_effects = []
         if 'DefaultStatusEffects' in components['StatusEffectComponent']:
             default_status_effects = components['StatusEffectComponent']['DefaultStatusEffects']
         for status_effect_obj in default_status_effects:
-            status_effect_json = BestiaryCrawler.status_effects_table[status_effect_obj['RowName']]
-
-            display_name = DisplayName(
-                table_id=status_effect_json['DisplayData']['Name']['StringTableID'],
-                string_id=status_effect_json['DisplayData']['Name']['StringID'],
-                string_table_name=status_effect_json['DisplayData']['Name']['StringTableName']
-            )
-            description = DisplayName(
-                table_id=status_effect_json['DisplayData']['Description']['StringTableID'],
-                string_id=status_effect_json['DisplayData']['Description']['StringID'],
-                string_table_name=status_effect_json['DisplayData']['Description']['StringTableName']
-            )
-            icon_path = self._get_media_path(status_effect_json['DisplayData']['Icon'])
-
-            unknown_fields = self._get_unknown_fields(status_effect_json, StatusEffect.get_unknown_fields())
-            
-            status_effects.append(StatusEffect(
-                key_name=status_effect_obj['RowName'],
-                display_name=display_name,
-                description=description,
-                icon_path=icon_path,
-                effect_type=status_effect_json['Type'],
-                value=status_effect_json['Value'],
-                duration_type=status_effect_json['DurationType'],
-                duration=status_effect_json['Duration'],
-                interval=status_effect_json['Interval'],
-                max_stack=status_effect_json['MaxStackCount'],
-                is_negative_effect=status_effect_json['bIsNegativeEffectInUI'],
-                show_in_ui=status_effect_json['bShowInUI'],
-                effect_tags=status_effect_json['EffectTags'],
-                unknown_fields=unknown_fields
-            ))
+            status_effects.append(self._get_status_effect(status_effects_table_path, status_effect_obj['RowName']))
 
         immunity_tags = []
         if 'ImmunityTags' in components['StatusEffectComponent']:
             immunity_tags = components['StatusEffectComponent']['ImmunityTags']
 
 
-        team = creature_info.team
         if 'TeamDataTable' in components['TeamComponent']:
             team = components['TeamComponent']['TeamDataTable']['RowName']
 
-        unknown_fields = self._get_unknown_fields(creature_bp, CreatureInfo.get_unknown_fields())
+        # Not every creature blueprint has all the components.
+        unknown_components = [component_type for component_type in CreatureInfo.get_unknown_fields() if component_type in creature_bp.components]
+        unknown_fields = self._get_unknown_fields(creature_bp.components, unknown_components)
 
         creature_info = CreatureInfo(
-            health=creature_info.health,
-            base_damage_reduction=creature_info.base_damage_reduction,
+            health=health,
+            base_damage_reduction=base_damage_reduction,
             weakpoints=weakpoints,
             loot=loot,
             max_stun=max_stun,
@@ -231,60 +153,38 @@ class BestiaryCrawler(BaseCrawler):
         return (name, creature_info)
 
     def _get_character_data(self, asset_path_name: str) -> dict[str, Any]:
-        creature_bp_path = self._build_real_path(asset_path_name)
-        creature_bp = None
-        if not os.path.exists(creature_bp_path):
-            return None
-        with open(creature_bp_path, 'r') as file:
-            creature_bp = json.load(file)
+        creature_bp = self.blueprints.resolve(asset_path_name)
         if creature_bp is None:
             return None
 
-        main_component = None
-        template_component = None
-        for component in creature_bp:
-            if component['Name'].startswith('Default__'):
-                main_component = component['Properties']
-            if 'Template' in component:
-                template_component = component['Template']
-
+        main_component = creature_bp.components.get('DefaultComponent')
         if main_component is None:
             return None
         
-        if template_component is not None:
-            # print(f'Found template component: {template_component} for {asset_path_name}')
-            character_data_datatable = self._get_character_data_table(template_component['ObjectPath'])
+        character_data = main_component['CharacterData']
+        if creature_bp.last_template is not None:
+            # print(f'Found template component: {creature_bp.last_template} for {asset_path_name}')
+            character_data_datatable = self._get_character_data_table(creature_bp.template_paths[creature_bp.last_template])
             if character_data_datatable is not None:
-                main_component['CharacterData']['DataTable'] = character_data_datatable
+                # The blueprint is memoized, so the override goes into a copy instead of its properties.
+                character_data = {**character_data, 'DataTable': character_data_datatable}
 
-        if 'DataTable' not in main_component['CharacterData']:
+        if 'DataTable' not in character_data:
             return None
 
-        return self._parse_character_data(main_component['CharacterData'])
+        return self._parse_character_data(character_data)
 
     def _get_character_data_table(self, asset_path_name: str) -> dict[str, Any]:
-        creature_bp_path = self._build_real_path(asset_path_name)
-        creature_bp = None
-        if not os.path.exists(creature_bp_path):
-            return None
-        with open(creature_bp_path, 'r') as file:
-            creature_bp = json.load(file)
+        creature_bp = self.blueprints.resolve(asset_path_name)
         if creature_bp is None:
             return None
         
-        main_component = None
-        template_component = None
-        for component in creature_bp:
-            if component['Name'].startswith('Default__'):
-                main_component = component['Properties']
-            if 'Template' in component:
-                template_component = component['Template']
-
-        if template_component is not None:
-            character_data_datatable = self._get_character_data_table(template_component['ObjectPath'])
+        if creature_bp.last_template is not None:
+            character_data_datatable = self._get_character_data_table(creature_bp.template_paths[creature_bp.last_template])
             if character_data_datatable is not None:
                 return character_data_datatable
 
+        main_component = creature_bp.components.get('DefaultComponent')
         if main_component is None or 'DataTable' not in main_component['CharacterData']:
             return None
         
@@ -294,12 +194,10 @@ class BestiaryCrawler(BaseCrawler):
         key_name = datatable['RowName']
         object_path = self._get_object_path(datatable['DataTable'])
 
-        if BestiaryCrawler.character_data_table is None and 'Table_CharacterData' in object_path.name:
-            BestiaryCrawler.character_data_table = json.loads(object_path.read_text(encoding='utf-8'))[0]['Rows']
-        elif 'Table_CharacterData' not in object_path.name:
+        if 'Table_CharacterData' not in object_path.name:
             raise ValueError('The provided object path is not an character data table.')
         
-        character_data_json = BestiaryCrawler.character_data_table[key_name]
+        character_data_json = DataTableCache.get_rows(object_path)[key_name]
 
         icon = self._get_media_path(character_data_json['Icon'])
         hud_icon = self._get_media_path(character_data_json['HudIcon'])
@@ -357,7 +255,7 @@ class BestiaryCrawler(BaseCrawler):
         return character_data
 
     def _get_crawled_data(self, key: str, value: dict, unknown_fields: dict[str, Any]) -> Creature:
-        name, creature_info = self._parse_creature_info(value['Creature']['AssetPathName'])
+        name, creature_info = self.blueprints.parse('creature_info', value['Creature']['AssetPathName'], self._parse_creature_info)
 
         character_data = self._get_character_data(value['Creature']['AssetPathName'])
 
@@ -0,0 +1,134 @@
+import os
+
+from typing import Any, Callable
+
+from util.parse_cache import ParseCache
+
+from .manifest import SourceTracker
+
+class Blueprint:
+    """
+    A parsed blueprint export with its components indexed by type.
+    #### Parameters
+    - `asset_path` : `str`
+        - The game path the blueprint was first requested with.
+    - `path` : `str`
+        - The real path of the exported blueprint.
+    - `exports` : `list[dict]`
+        - The raw objects of the export.
+    - `components` : `dict[str, dict]`
+        - The properties of the `Default__` object under `DefaultComponent` and of every other component under its type.
+          When a type appears more than once, the last component wins.
+    - `template_paths` : `dict[str, str]`
+        - The `Template` object path of each component that has one, in the order they appear in the export.
+    - `last_template` : `str`
+        - The component of the last object in the export that has a `Template`.
+    """
+    def __init__(self, asset_path: str, path: str, exports: list[dict]):
+        self.asset_path = asset_path
+        self.path = path
+        self.exports = exports
+        self.components: dict[str, dict] = {}
+        self.template_paths: dict[str, str] = {}
+        self.last_template: str = None
+
+        for component in exports:
+            if component['Name'].startswith('Default__'):
+                component_type = 'DefaultComponent'
+            else:
+                component_type = component['Type']
+
+            self.components[component_type] = component.get('Properties', {})
+            if 'Template' in component:
+                self.template_paths[component_type] = component['Template']['ObjectPath']
+                self.last_template = component_type
+
+class BlueprintResolver:
+    """
+    Parses each blueprint export once and memoizes what the crawlers build from a blueprint and its template chain.
+    Blueprints are memoized by real path, and the templates are only read when a crawler follows them. The values built
+    with `parse` are memoized by real path too, so the shared parent templates are only read and built once per crawl.
+    #### Parameters
+    - `build_real_path` : `Callable[[str], str]`
+        - The function that turns a game path into the path of its JSON export.
+    - `resolve_path` : `Callable[[str], str]`
+        - The function that gets the path of a JSON export on the disk, or `None` if it wasn't exported. By default the
+          disk is checked for every path.
+    """
+    def __init__(self, build_real_path: Callable[[str], str], resolve_path: Callable[[str], str] = None):
+        self.build_real_path = build_real_path
+        self.resolve_path = resolve_path
+        self.blueprints: dict[str, Blueprint] = {}
+        self.parsed: dict[tuple[str, str], tuple[Any, frozenset[str]]] = {}
+        self.parsing: list[tuple[str, str]] = []
+
+    def resolve(self, asset_path: str) -> Blueprint:
+        """
+        This method is responsible for getting a blueprint, without its templates.
+        #### Parameters
+        - `asset_path` : `str`
+            - The game path of the blueprint.
+        #### Returns
+        - `Blueprint` : The blueprint, or `None` if it was not exported.
+        """
+        path = self.build_real_path(asset_path)
+        SourceTracker.touch(path)
+        if path in self.blueprints:
+            return self.blueprints[path]
+
+        exports = self._load(path)
+        blueprint = Blueprint(asset_path, path, exports) if exports is not None else None
+        self.blueprints[path] = blueprint
+        return blueprint
+
+    def parse(self, name: str, asset_path: str, parse: Callable[[str], Any]) -> Any:
+        """
+        This method is responsible for getting a value built from a blueprint and the templates it follows, building
+        it only the first time. The source files read while building it are touched again on every hit, so the
+        `SourceTracker` scopes see the same files as if it had been built again. The memoized values are shared, so
+        they must not be modified.
+        #### Parameters
+        - `name` : `str`
+            - The name of what is built (e.g.: `creature_info`), so different values of a blueprint are memoized apart.
+        - `asset_path` : `str`
+            - The game path of the blueprint.
+        - `parse` : `Callable[[str], Any]`
+            - The function that builds the value from the game path. It follows the templates with `parse` again.
+        #### Returns
+        - `Any` : The built value.
+        #### Raises
+        - `ValueError` : If the template chain loops back to a blueprint that is being built.
+        """
+        key = (name, self.build_real_path(asset_path))
+        entry = self.parsed.get(key)
+        if entry is not None:
+            SourceTracker.touch_all(entry[1])
+            return entry[0]
+        if key in self.parsing:
+            cycle = [path for _, path in self.parsing[self.parsing.index(key):]] + [key[1]]
+            raise ValueError(f'Template cycle detected: {" -> ".join(cycle)}')
+
+        self.parsing.append(key)
+        try:
+            with SourceTracker.track() as sources:
+                value = parse(asset_path)
+        finally:
+            self.parsing.pop()
+        self.parsed[key] = (value, frozenset(sources))
+        return value
+
+    def clear(self) -> None:
+        """
+        This method is responsible for dropping the memoized blueprints and built values.
+        """
+        self.blueprints.clear()
+        self.parsed.clear()
+
+    def _load(self, path: str) -> list[dict[str, Any]]:
+        if self.resolve_path is not None:
+            path = self.resolve_path(path)
+        elif not os.path.exists(path):
+            path = None
+        if path is None:
+            return None
+        return ParseCache.load(path)
@@ -26,16 +26,16 @@ class CraftingRecipesCrawler(BaseCrawler):
         for component in value['Requirements']:
             quantity = component['ItemCount']
             item_key = component['Item']['RowName']
-            item = self._parse_item(component['Item'])
+            component_item = self._parse_item(component['Item'])
             recipe_component = None
-            if item is not None:
+            if component_item is not None:
                 recipe_component = RecipeComponent(
                     item_key=item_key,
                     quantity=quantity,
-                    display_name=item.name,
-                    description=item.description,
-                    icon_path=item.icon_path,
-                    icon_modifier_path=item.icon_modifier_path,
+                    display_name=component_item.name,
+                    description=component_item.description,
+                    icon_path=component_item.icon_path,
+                    icon_modifier_path=component_item.icon_modifier_path,
                 )
 
             components.append(recipe_component)
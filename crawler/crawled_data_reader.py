@@ -0,0 +1,70 @@
+import json
+
+from typing import Any, Iterator
+
+from .datatable_reader import DataTableReader
+
+class CrawledDataReader(DataTableReader):
+    """
+    Reads the entities of a crawled output (`{key_name: entity}`) one at a time, with the byte span of each one, so
+    an entity can be read again later with `read_entity` without reading the whole file.
+    The file is decoded as latin-1, which maps every byte to one character: the JSON structure is the same as with
+    UTF-8 and the positions are byte offsets. The non-ASCII characters of the strings are then not decoded, which is
+    enough to compare the entities, while the key names and `read_entity` are decoded as UTF-8.
+    #### Parameters
+    - `path` : `Path`
+        - The path to the crawled output.
+    - `chunk_size` : `int`
+        - The number of bytes read from the file at a time.
+    """
+    def __iter__(self) -> Iterator[tuple[str, Any, int, int]]:
+        """
+        This method is responsible for reading the entities of the crawled output.
+        #### Returns
+        - `Iterator[tuple[str, Any, int, int]]` : The `(key_name, entity, start, end)` tuples, in the order of the file,
+          where the entity is decoded as latin-1 and `start` and `end` are the byte offsets of the entity.
+        #### Raises
+        - `ValueError` : If the file is not a JSON object.
+        """
+        # Without newline translation, so the positions stay byte offsets.
+        with open(self.path, 'r', encoding='latin-1', newline='') as file:
+            self.file = file
+            self.buffer = ''
+            self.position = 0
+            self.offset = 0
+            self.eof = False
+
+            self._expect('{')
+            while not self._accept('}'):
+                key = self._read_entity_key()
+                self._skip_whitespace()
+                start = self.offset + self.position
+                entity = self._read_value()
+                yield key, entity, start, self.offset + self.position
+                self._accept(',')
+
+    def _read_entity_key(self) -> str:
+        self._skip_whitespace()
+        start = self.position
+        key = self._read_value()
+        if not isinstance(key, str):
+            raise ValueError(f'Expected an object key at byte {self.offset + self.position} of {self.path}')
+        if not key.isascii():
+            key = json.loads(self.buffer[start:self.position].encode('latin-1').decode('utf-8'))
+        self._expect(':')
+        return key
+
+    def read_entity(self, start: int, end: int) -> Any:
+        """
+        This method is responsible for reading an entity again from its byte span.
+        #### Parameters
+        - `start` : `int`
+            - The byte offset of the start of the entity.
+        - `end` : `int`
+            - The byte offset of the end of the entity.
+        #### Returns
+        - `Any` : The entity.
+        """
+        with open(self.path, 'rb') as file:
+            file.seek(start)
+            return json.loads(file.read(end - start).decode('utf-8'))
@@ -0,0 +1,165 @@
+import os
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from util.parse_cache import ParseCache
+
+from .manifest import SourceTracker
+
+class DataTableCache:
+    """
+    Process-wide cache of the parsed DataTable exports shared by all the crawlers.
+    Entries are keyed by the absolute path of the export and validated against its mtime and size, so a re-exported
+    file is parsed again. Pinned entries are validated once after every `pin`, since the dump doesn't change during a
+    run, and are then served without touching the disk. Unpinned entries are evicted least-recently-used once the size
+    of their source files exceeds `max_bytes`.
+    #### Attributes
+    - `max_bytes` : `int`
+        - The budget, in bytes of source JSON, of the unpinned entries. `None` disables the eviction.
+    - `entries` : `OrderedDict[str, tuple[int, int, Any]]`
+        - The `(mtime_ns, size, data)` of each cached export, from the least to the most recently used.
+    - `pins` : `dict[str, int]`
+        - The pin count of each path. Pinned entries are never evicted.
+    - `validated` : `set[str]`
+        - The pinned entries that were validated since they were pinned.
+    - `total_bytes` : `int`
+        - The size of the source files of the cached entries.
+    """
+    max_bytes: int = 512 * 1024 * 1024
+    entries: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+    pins: dict[str, int] = {}
+    validated: set[str] = set()
+    total_bytes: int = 0
+    # The absolute path of every looked up path, since the lookups of the rows use the same few paths.
+    keys: dict[Path | str, str] = {}
+
+    @staticmethod
+    def configure(max_bytes: int = None) -> None:
+        """
+        This method is responsible for changing the eviction budget of the cache.
+        #### Parameters
+        - `max_bytes` : `int`
+            - The budget, in bytes of source JSON, of the unpinned entries. `None` disables the eviction.
+        """
+        DataTableCache.max_bytes = max_bytes
+        DataTableCache._evict()
+
+    @staticmethod
+    def get(path: Path) -> Any:
+        """
+        This method is responsible for getting a parsed export, reading it only if it is not cached or has changed.
+        #### Parameters
+        - `path` : `Path`
+            - The path to the export.
+        #### Returns
+        - `Any` : The parsed export.
+        """
+        key = DataTableCache._get_key(path)
+        SourceTracker.touch(key)
+
+        entry = DataTableCache.entries.get(key)
+        if entry is not None and key in DataTableCache.validated:
+            DataTableCache.entries.move_to_end(key)
+            return entry[2]
+
+        stat = os.stat(key)
+        if entry is not None:
+            mtime, size, data = entry
+            if mtime == stat.st_mtime_ns and size == stat.st_size:
+                DataTableCache.entries.move_to_end(key)
+                if key in DataTableCache.pins:
+                    DataTableCache.validated.add(key)
+                return data
+            DataTableCache._remove(key)
+
+        data = ParseCache.load(key)
+
+        DataTableCache.entries[key] = (stat.st_mtime_ns, stat.st_size, data)
+        DataTableCache.total_bytes += stat.st_size
+        if key in DataTableCache.pins:
+            DataTableCache.validated.add(key)
+        DataTableCache._evict()
+
+        return data
+
+    @staticmethod
+    def get_rows(path: Path) -> dict[str, Any]:
+        """
+        This method is responsible for getting the rows of a DataTable export.
+        #### Parameters
+        - `path` : `Path`
+            - The path to the DataTable export.
+        #### Returns
+        - `dict` : The rows of the DataTable.
+        """
+        return DataTableCache.get(path)[0]['Rows']
+
+    @staticmethod
+    def pin(path: Path) -> None:
+        """
+        This method is responsible for keeping an export in the cache for the rest of the run.
+        Pins are reference-counted, so every `pin` must be matched by an `unpin`. The export is validated again on the
+        next lookup.
+        #### Parameters
+        - `path` : `Path`
+            - The path to the export.
+        """
+        key = DataTableCache._get_key(path)
+        DataTableCache.pins[key] = DataTableCache.pins.get(key, 0) + 1
+        DataTableCache.validated.discard(key)
+
+    @staticmethod
+    def unpin(path: Path) -> None:
+        """
+        This method is responsible for releasing a pin, making the export evictable again once no pins are left.
+        #### Parameters
+        - `path` : `Path`
+            - The path to the export.
+        """
+        key = DataTableCache._get_key(path)
+        count = DataTableCache.pins.get(key, 0) - 1
+        if count > 0:
+            DataTableCache.pins[key] = count
+        else:
+            DataTableCache.pins.pop(key, None)
+            DataTableCache.validated.discard(key)
+        DataTableCache._evict()
+
+    @staticmethod
+    def clear() -> None:
+        """
+        This method is responsible for dropping every cached export. The pins are kept.
+        """
+        DataTableCache.entries.clear()
+        DataTableCache.validated.clear()
+        DataTableCache.keys.clear()
+        DataTableCache.total_bytes = 0
+
+    @staticmethod
+    def _get_key(path: Path) -> str:
+        key = DataTableCache.keys.get(path)
+        if key is None:
+            key = os.path.abspath(path)
+            DataTableCache.keys[path] = key
+        return key
+
+    @staticmethod
+    def _remove(key: str) -> None:
+        _, size, _ = DataTableCache.entries.pop(key)
+        DataTableCache.validated.discard(key)
+        DataTableCache.total_bytes -= size
+
+    @staticmethod
+    def _evict() -> None:
+        if DataTableCache.max_bytes is None:
+            return
+
+        pinned_bytes = sum(entry[1] for key, entry in DataTableCache.entries.items() if key in DataTableCache.pins)
+        for key in list(DataTableCache.entries):
+            if DataTableCache.total_bytes - pinned_bytes <= DataTableCache.max_bytes:
+                break
+            if key in DataTableCache.pins:
+                continue
+            DataTableCache._remove(key)
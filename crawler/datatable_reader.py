@@ -0,0 +1,175 @@
+import json
+import re
+
+from pathlib import Path
+from typing import Any, Iterator
+
+from .manifest import SourceTracker
+
+class DataTableReader:
+    """
+    Reads the rows of a DataTable export one at a time, without loading the whole file.
+    The export is read in chunks and only the unparsed text and the current row are kept in memory.
+    #### Parameters
+    - `path` : `Path`
+        - The path to the DataTable export.
+    - `chunk_size` : `int`
+        - The number of characters read from the file at a time.
+    """
+    whitespace = ' \t\n\r'
+    number_characters = '0123456789.eE+-'
+    # The patterns of `count_exports`, which scans the UTF-8 bytes: no byte of a multibyte character is a `"` or a `\`.
+    string_pattern = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+    # Every character that can be outside of a string in JSON, besides the brackets.
+    non_bracket_characters = b' \t\n\r0123456789.eE+-truefalsn:,'
+    group_pattern = re.compile(rb'\{[^\[\]{}]*\}|\[[^\[\]{}]*\]')
+
+    def __init__(self, path: Path, chunk_size: int = 1024 * 1024):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.exports: int = None
+
+    def __iter__(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        This method is responsible for reading the rows of the first export of the DataTable.
+        #### Returns
+        - `Iterator[tuple[str, dict]]` : The `(row_name, row)` pairs, in the order of the export.
+        #### Raises
+        - `ValueError` : If the file is not a DataTable export or has more than one export, before any row is read.
+        """
+        if self.count_exports() > 1:
+            raise ValueError(f'There are more than 1 entry in the DataTable: {self.path}')
+
+        SourceTracker.touch(self.path)
+        with open(self.path, 'r', encoding='utf-8') as file:
+            self.file = file
+            self.buffer = ''
+            self.position = 0
+            self.offset = 0
+            self.eof = False
+
+            self._expect('[')
+            self._expect('{')
+            found_rows = False
+            while not self._accept('}'):
+                key = self._read_key()
+                if key == 'Rows' and not found_rows:
+                    found_rows = True
+                    yield from self._read_rows()
+                else:
+                    self._read_value()
+                self._accept(',')
+
+            if not found_rows:
+                raise ValueError(f'The export has no Rows: {self.path}')
+            self._expect(']')
+
+    def count_exports(self) -> int:
+        """
+        This method is responsible for counting the exports of the file, without parsing them. The file is scanned
+        once and the count is kept.
+        #### Returns
+        - `int` : The number of objects in the top level array.
+        """
+        if self.exports is not None:
+            return self.exports
+
+        # Only the brackets are kept, and every innermost group is replaced by `o` until the top level objects are left.
+        residue = b''
+        pending = b''
+        started = False
+        with open(self.path, 'rb') as file:
+            for chunk in iter(lambda: file.read(self.chunk_size), b''):
+                text, pending = DataTableReader._remove_strings(pending + chunk)
+                residue += text.translate(None, DataTableReader.non_bracket_characters)
+                if not started and residue:
+                    # The top level array is left open, so its objects are not collapsed with it.
+                    started = True
+                    residue = residue[1:] if residue.startswith(b'[') else residue
+                count = 1
+                while count:
+                    residue, count = DataTableReader.group_pattern.subn(b'o', residue)
+
+        exports = residue.count(b'o')
+        self.exports = exports
+        return exports
+
+    @staticmethod
+    def _remove_strings(text: bytes) -> tuple[bytes, bytes]:
+        # Without escapes, the strings are every other part between the quotes, which is much faster than the pattern.
+        if b'\\' not in text:
+            parts = text.split(b'"')
+            pending = b''
+            if len(parts) % 2 == 0:
+                pending = b'"' + parts.pop()
+            return b''.join(parts[0::2]), pending
+
+        text = DataTableReader.string_pattern.sub(b'', text)
+        # The complete strings are removed, so a `"` left starts a string that continues in the next chunk.
+        quote = text.find(b'"')
+        if quote == -1:
+            return text, b''
+        return text[:quote], text[quote:]
+
+    def _read_rows(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        self._expect('{')
+        while not self._accept('}'):
+            key = self._read_key()
+            yield key, self._read_value()
+            self._accept(',')
+
+    def _read_key(self) -> str:
+        key = self._read_value()
+        if not isinstance(key, str):
+            raise ValueError(f'Expected an object key at character {self.position} of {self.path}')
+        self._expect(':')
+        return key
+
+    def _read_value(self) -> Any:
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                # The value is cut by the end of the buffer, so the buffer is at least doubled to stay linear.
+                self._fill(max(self.chunk_size, len(self.buffer) - self.position))
+                continue
+
+            # A number can also be cut by the end of the buffer (`1.5e` parses as `1.5`) while still being valid JSON.
+            if not self.eof and type(value) in (int, float) and self.buffer[end:].strip(DataTableReader.number_characters) == '':
+                self._fill(self.chunk_size)
+                continue
+
+            self.position = end
+            return value
+
+    def _accept(self, token: str) -> bool:
+        self._skip_whitespace()
+        if self.buffer.startswith(token, self.position):
+            self.position += len(token)
+            return True
+        return False
+
+    def _expect(self, token: str) -> None:
+        if not self._accept(token):
+            raise ValueError(f'Expected "{token}" at character {self.position} of {self.path}')
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in DataTableReader.whitespace:
+                self.position += 1
+            if self.position < len(self.buffer) or self.eof:
+                return
+            self._fill(self.chunk_size)
+
+    def _fill(self, size: int) -> None:
+        chunk = self.file.read(size)
+        if not chunk:
+            self.eof = True
+        # The offset of the start of the buffer in the file, in characters.
+        self.offset += self.position
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
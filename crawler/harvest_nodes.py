@@ -1,5 +1,3 @@
-import json
-import os
 import uuid
 
 from pathlib import Path
@@ -50,12 +48,7 @@ class HarvestNodesCrawler(BaseCrawler):
 
     # TODO: Figure out a more readable way to set a field "recursively-safe" without using try-except (maybe a function?)
     def _parse_harvest_node_info(self, asset_path_name: str) -> HarvestNodeInfo:
-        harvest_node_bp_path = self._build_real_path(asset_path_name)
-        harvest_node_bp = None
-        if not os.path.exists(harvest_node_bp_path):
-            return None
-        with open(harvest_node_bp_path, 'r') as file:
-            harvest_node_bp = json.load(file)
+        harvest_node_bp = self.blueprints.resolve(asset_path_name)
         if harvest_node_bp is None:
             return None
         
@@ -64,21 +57,8 @@ class HarvestNodesCrawler(BaseCrawler):
             'HealthComponent': {},
             'LootComponent': {},
         }
-        for component in harvest_node_bp:
-            if component['Name'].startswith('Default__'):
-                components['DefaultComponent'] = component['Properties']
-                if 'Template' in component:
-                    components['DefaultComponentTemplate'] = component['Template']
-                continue
-            if component['Type'] not in components:
-                continue
-
-            components[component['Type']] = {}
-            if 'Properties' in component:
-                components[component['Type']] = component['Properties']
-
-            if 'Template' in component:
-                components[f'{component["Type"]}Template'] = component['Template']
+        for component_type in components:
+            components[component_type] = harvest_node_bp.components.get(component_type, {})
 
         harvest_node_info = HarvestNodeInfo(
             health=0,
@@ -86,14 +66,18 @@ class HarvestNodesCrawler(BaseCrawler):
             tags=[],
             loot=[]
         )
-        for component in components:
-            if component.endswith('Template'):
-                template = self._parse_harvest_node_info(components[component]['ObjectPath'])
-
-                if component.startswith('HealthComponent'):
-                    harvest_node_info.required_damage_type_flags = template.required_damage_type_flags
-                if component.startswith('DefaultComponent'):
-                    harvest_node_info.tags = template.tags
+        for component_type, template_path in harvest_node_bp.template_paths.items():
+            if component_type not in components:
+                continue
+
+            template = self.blueprints.parse('harvest_node_info', template_path, self._parse_harvest_node_info)
+            if template is None:
+                continue
+
+            if component_type == 'HealthComponent':
+                harvest_node_info.required_damage_type_flags = template.required_damage_type_flags
+            if component_type == 'DefaultComponent':
+                harvest_node_info.tags = template.tags
 
         try:
             harvest_node_info.required_damage_type_flags = components['HealthComponent']['RequiredDamageTypeFlags']
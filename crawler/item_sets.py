@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Any
 from crawler.base_crawler import BaseCrawler
 from models import ItemSet, StatusEffect, DisplayName, Item, RecipeComponent
+from util.suffix_automaton import SuffixAutomaton
 
 class ItemSetsCrawler(BaseCrawler):
     """
@@ -22,15 +23,10 @@ class ItemSetsCrawler(BaseCrawler):
         if len(item_names) == 0:
             return ''
         
+        # The longest substring of the shortest name that is in every name, the first one on ties.
         shortest_string = min(item_names, key=len)
-        for length in range(len(shortest_string), 0, -1):
-            for start in range(len(shortest_string) - length + 1):
-                substring = shortest_string[start:start+length]
-                if all(substring in s for s in item_names):
-                    armor_set = substring.strip().replace('of the ', '')
-                    return armor_set
-        
-        return ''
+        substring = SuffixAutomaton(shortest_string).longest_common_substring(item_names)
+        return substring.strip().replace('of the ', '')
 
     # TODO: Those `_parse_` methods can be moved into a utility class (or made the code depend on each other)
     def _get_crawled_data(self, key: str, value: dict, unknown_fields: dict[str, Any]) -> ItemSet:
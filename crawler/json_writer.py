@@ -0,0 +1,78 @@
+import json
+import os
+
+from pathlib import Path
+from typing import Any
+
+class JsonWriter:
+    """
+    Writes a JSON object to a file one entry at a time, so the whole document is never built in memory.
+    With an `indent` the output is the same as `json.dumps(data, indent=indent)`, with `None` it is compact.
+    The entries are written to a temporary file that replaces the target when the writer is closed without errors.
+    #### Parameters
+    - `path` : `Path`
+        - The path to the output file.
+    - `indent` : `int`
+        - The indentation of the pretty-printed output, or `None` for the compact output.
+    """
+    def __init__(self, path: Path, indent: int = 4):
+        self.path = Path(path)
+        self.indent = indent
+        self.temp_path = self.path.with_name(f'{self.path.name}.tmp')
+        self.file = None
+        self.count = 0
+
+    def __enter__(self) -> 'JsonWriter':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def open(self) -> None:
+        """
+        This method is responsible for opening the temporary file and writing the start of the object.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.temp_path, 'w', encoding='utf-8')
+        self.file.write('{')
+        self.count = 0
+
+    def write(self, key: str, value: Any) -> None:
+        """
+        This method is responsible for writing an entry of the object.
+        #### Parameters
+        - `key` : `str`
+            - The key of the entry.
+        - `value` : `Any`
+            - The JSON serializable value of the entry.
+        """
+        separator = ',' if self.count else ''
+        if self.indent is None:
+            self.file.write(f'{separator}{json.dumps(key)}:{json.dumps(value, separators=(",", ":"))}')
+        else:
+            # Nested lines are indented one more level, since the value is written inside the top level object.
+            padding = ' ' * self.indent
+            value_json = json.dumps(value, indent=self.indent).replace('\n', '\n' + padding)
+            self.file.write(f'{separator}\n{padding}{json.dumps(key)}: {value_json}')
+        self.count += 1
+
+    def close(self) -> None:
+        """
+        This method is responsible for ending the object and moving the temporary file to the output path.
+        """
+        if self.indent is not None and self.count:
+            self.file.write('\n')
+        self.file.write('}')
+        self.file.close()
+        os.replace(self.temp_path, self.path)
+
+    def abort(self) -> None:
+        """
+        This method is responsible for dropping the temporary file, leaving the previous output untouched.
+        """
+        self.file.close()
+        os.remove(self.temp_path)
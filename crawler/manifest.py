@@ -0,0 +1,246 @@
+import hashlib
+import json
+import os
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+class SourceTracker:
+    """
+    Records the source files read while crawling.
+    Every path touched while a scope is open is added to it, so a row scope nested in a crawler scope fills both.
+    #### Attributes
+    - `scopes` : `list[set[str]]`
+        - The open scopes, from the outermost to the innermost.
+    """
+    scopes: list[set[str]] = []
+
+    @staticmethod
+    @contextmanager
+    def track() -> Iterator[set[str]]:
+        """
+        This method is responsible for opening a scope that collects the absolute paths of the files read inside it.
+        #### Returns
+        - `set[str]` : The paths touched while the scope is open.
+        """
+        scope = set()
+        SourceTracker.scopes.append(scope)
+        try:
+            yield scope
+        finally:
+            SourceTracker.scopes.remove(scope)
+
+    @staticmethod
+    def touch(path: Path | str) -> None:
+        """
+        This method is responsible for recording that a source file was read.
+        #### Parameters
+        - `path` : `Path | str`
+            - The path to the source file. It is recorded even if the file does not exist.
+        """
+        if not SourceTracker.scopes:
+            return
+        key = os.path.abspath(path)
+        for scope in SourceTracker.scopes:
+            scope.add(key)
+
+    @staticmethod
+    def touch_all(paths: Iterable[str]) -> None:
+        """
+        This method is responsible for recording that several source files were read.
+        #### Parameters
+        - `paths` : `Iterable[str]`
+            - The paths to the source files.
+        """
+        for path in paths:
+            SourceTracker.touch(path)
+
+class CrawlManifest:
+    """
+    The content hashes of the source files read by a crawler on its last run, and of each row of its DataTable.
+    It lets a crawler skip the whole crawl when none of its inputs changed, or re-parse only the rows whose source row
+    or referenced files changed. Files are compared by size and mtime first and only hashed again when those differ.
+    #### Parameters
+    - `path` : `Path`
+        - The path to the manifest of the crawler.
+    #### Attributes
+    - `hashes` : `dict[str, tuple[int, int, str]]`
+        - The `(mtime_ns, size, sha1)` of every file hashed by this process.
+    """
+    hashes: dict[str, tuple[int, int, str]] = {}
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entry: dict[str, Any] = None
+        if path.exists():
+            self.entry = json.loads(path.read_text(encoding='utf-8'))
+        self.checked: dict[str, bool] = {}
+
+    def is_reusable(self, options: dict[str, Any]) -> bool:
+        """
+        This method is responsible for checking if the previous run was made with the same options.
+        #### Parameters
+        - `options` : `dict`
+            - The options of the crawler that change its output.
+        #### Returns
+        - `bool` : Whether the previous output can be reused.
+        """
+        return self.entry is not None and self.entry['options'] == options
+
+    def are_sources_unchanged(self, paths: Iterable[str], exclude: str = None) -> bool:
+        """
+        This method is responsible for checking if the crawler-level source files are the same as on the last run.
+        #### Parameters
+        - `paths` : `Iterable[str]`
+            - The source files the crawler reads for every row.
+        - `exclude` : `str`
+            - A source file to leave out of the comparison.
+        #### Returns
+        - `bool` : Whether the sources, and the list of sources, are unchanged.
+        """
+        paths = {os.path.abspath(path) for path in paths} - {exclude}
+        sources = self.entry['sources']
+        if paths != set(sources) - {exclude}:
+            return False
+        return all(self.is_file_unchanged(path, sources[path]) for path in paths)
+
+    def are_files_unchanged(self) -> bool:
+        """
+        This method is responsible for checking if every file referenced by the rows is the same as on the last run.
+        #### Returns
+        - `bool` : Whether the referenced files are unchanged.
+        """
+        return all(self.is_file_unchanged(path, state) for path, state in self.entry['files'].items())
+
+    def is_row_unchanged(self, key: str, row_hash: str) -> bool:
+        """
+        This method is responsible for checking if a row and the files it referenced are the same as on the last run.
+        #### Parameters
+        - `key` : `str`
+            - The name of the row.
+        - `row_hash` : `str`
+            - The hash of the row, from `hash_row`.
+        #### Returns
+        - `bool` : Whether the row can be reused.
+        """
+        row = self.entry['rows'].get(key)
+        if row is None or row['hash'] != row_hash:
+            return False
+        files = self.entry['files']
+        return all(path in files and self.is_file_unchanged(path, files[path]) for path in row['files'])
+
+    def get_row_files(self, key: str) -> list[str]:
+        """
+        This method is responsible for getting the files a row referenced on the last run.
+        #### Parameters
+        - `key` : `str`
+            - The name of the row.
+        #### Returns
+        - `list[str]` : The absolute paths of the referenced files.
+        """
+        return self.entry['rows'][key]['files']
+
+    def is_file_unchanged(self, path: str, state: dict[str, Any]) -> bool:
+        """
+        This method is responsible for comparing a file with its recorded state.
+        #### Parameters
+        - `path` : `str`
+            - The absolute path to the file.
+        - `state` : `dict`
+            - The state recorded by `describe`.
+        #### Returns
+        - `bool` : Whether the file has the same content, or is still missing.
+        """
+        if path not in self.checked:
+            self.checked[path] = self._compare(path, state)
+        return self.checked[path]
+
+    def save(self, options: dict[str, Any], sources: Iterable[str], files: Iterable[str], rows: dict[str, dict[str, Any]]) -> None:
+        """
+        This method is responsible for writing the manifest of a finished crawl.
+        #### Parameters
+        - `options` : `dict`
+            - The options of the crawler that change its output.
+        - `sources` : `Iterable[str]`
+            - The source files the crawler reads for every row.
+        - `files` : `Iterable[str]`
+            - Every file read while parsing the rows.
+        - `rows` : `dict`
+            - The `hash` of each row and the `files` it read.
+        """
+        self.entry = {
+            'options': options,
+            'sources': {path: CrawlManifest.describe(path) for path in sorted({os.path.abspath(path) for path in sources})},
+            'files': {path: CrawlManifest.describe(path) for path in sorted(files)},
+            'rows': rows
+        }
+        self.checked = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps(self.entry, indent=4), encoding='utf-8')
+        os.replace(temp_path, self.path)
+
+    @staticmethod
+    def describe(path: str) -> dict[str, Any]:
+        """
+        This method is responsible for getting the state of a file to record in the manifest.
+        #### Parameters
+        - `path` : `str`
+            - The path to the file.
+        #### Returns
+        - `dict` : The `size`, `mtime_ns` and `sha1` of the file. `sha1` is `None` when the file does not exist.
+        """
+        if not os.path.exists(path):
+            return {'size': None, 'mtime_ns': None, 'sha1': None}
+        stat = os.stat(path)
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha1': CrawlManifest.hash_file(path)}
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """
+        This method is responsible for hashing the content of a file, once per process for each version of the file.
+        #### Parameters
+        - `path` : `str`
+            - The path to the file.
+        #### Returns
+        - `str` : The SHA-1 of the content.
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+
+        entry = CrawlManifest.hashes.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        digest = hashlib.sha1()
+        with open(key, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(chunk)
+
+        CrawlManifest.hashes[key] = (stat.st_mtime_ns, stat.st_size, digest.hexdigest())
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_row(value: Any) -> str:
+        """
+        This method is responsible for hashing a row of a DataTable.
+        #### Parameters
+        - `value` : `Any`
+            - The row.
+        #### Returns
+        - `str` : The SHA-1 of the canonical JSON of the row.
+        """
+        return hashlib.sha1(json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+    def _compare(self, path: str, state: dict[str, Any]) -> bool:
+        if not os.path.exists(path):
+            return state['sha1'] is None
+        if state['sha1'] is None:
+            return False
+
+        stat = os.stat(path)
+        if stat.st_size == state['size'] and stat.st_mtime_ns == state['mtime_ns']:
+            return True
+        return CrawlManifest.hash_file(path) == state['sha1']
@@ -0,0 +1,73 @@
+import os
+
+from pathlib import Path
+from typing import Any, Callable
+
+from .manifest import SourceTracker
+
+class ModelCache:
+    """
+    Per-run flyweight cache of the models built from DataTable rows that other rows reference, like the items of the
+    recipes or the status effects of the items. Every row is built once and the same instance is returned afterwards,
+    so the cached models must not be modified.
+    Entries are keyed by the absolute path of the DataTable and the RowName, plus a `variant` for the crawler options
+    that change the built model. The source files read while building a model are recorded with it and touched again
+    on every hit, so the `SourceTracker` scopes see the same files as if the row had been built again.
+    #### Attributes
+    - `entries` : `dict[tuple[str, str, Any], tuple[Any, frozenset[str]]]`
+        - The model and the source files of each cached row.
+    - `hits` : `int`
+        - The number of lookups served from the cache.
+    - `misses` : `int`
+        - The number of lookups that built the model.
+    """
+    entries: dict[tuple[str, str, Any], tuple[Any, frozenset[str]]] = {}
+    hits: int = 0
+    misses: int = 0
+
+    @staticmethod
+    def get(path: Path | str, row_name: str, build: Callable[[], Any], variant: Any = None) -> Any:
+        """
+        This method is responsible for getting the model of a row, building it only on the first lookup.
+        #### Parameters
+        - `path` : `Path | str`
+            - The path to the DataTable of the row.
+        - `row_name` : `str`
+            - The RowName of the row.
+        - `build` : `Callable[[], Any]`
+            - The function that builds the model.
+        - `variant` : `Any`
+            - The crawler options that change the built model (e.g.: `hide_unknown_fields`).
+        #### Returns
+        - `Any` : The model of the row.
+        """
+        key = (os.path.abspath(path), row_name, variant)
+        entry = ModelCache.entries.get(key)
+        if entry is not None:
+            ModelCache.hits += 1
+            SourceTracker.touch_all(entry[1])
+            return entry[0]
+
+        ModelCache.misses += 1
+        with SourceTracker.track() as sources:
+            model = build()
+        ModelCache.entries[key] = (model, frozenset(sources))
+        return model
+
+    @staticmethod
+    def get_stats() -> dict[str, int]:
+        """
+        This method is responsible for getting the counters of the cache.
+        #### Returns
+        - `dict[str, int]` : The `hits`, `misses` and `size` of the cache.
+        """
+        return {'hits': ModelCache.hits, 'misses': ModelCache.misses, 'size': len(ModelCache.entries)}
+
+    @staticmethod
+    def clear() -> None:
+        """
+        This method is responsible for dropping every cached model and resetting the counters.
+        """
+        ModelCache.entries.clear()
+        ModelCache.hits = 0
+        ModelCache.misses = 0
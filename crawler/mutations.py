@@ -8,6 +8,8 @@ class MutationsCrawler(BaseCrawler):
     """
     Crawler for the mutations(perks) data.
     """
+    dependencies = ['status_effects']
+
     def __init__(self, hide_unknown_fields: bool = False):
         super().__init__(
             name='mutations',
@@ -15,6 +17,8 @@ class MutationsCrawler(BaseCrawler):
             hide_unknown_fields=hide_unknown_fields
         )
         self.unknown_fields = Mutation.get_unknown_fields()
+        # The status effects come from the `GlobalDatabase`, so their table is a source of every row.
+        self.source_files.append(self.root_path / 'json_data/Maine/Content/Blueprints/Attacks/Table_StatusEffects.json')
 
     def dispose(self) -> None:
         pass
@@ -0,0 +1,109 @@
+from collections import OrderedDict
+from pathlib import Path
+
+class PathResolver:
+    """
+    Process-wide translation of the game paths of the exports (e.g.: `/Game/Blueprints/Items/Table_AllItems.0`) to the
+    paths of the exported files (e.g.: `<root>/json_data/Maine/Content/Blueprints/Items/Table_AllItems.json`).
+    Only the leading `/Game/` is the content of the `Maine` project, and only the last segment has an object name
+    after the `.` (`.0` in an ObjectPath, `.Table_AllItems` in an AssetPathName). The translated paths are memoized
+    least-recently-used, since the same paths are referenced by many rows.
+    #### Attributes
+    - `max_size` : `int`
+        - The number of memoized paths.
+    - `entries` : `OrderedDict[tuple[str, str, str, str], Path]`
+        - The translated path of each `(root_path, folder, game_path, extension)`, from the least to the most recently
+          used.
+    - `hits` : `int`
+        - The number of translations served from the memo.
+    - `misses` : `int`
+        - The number of translations that were computed.
+    """
+    max_size: int = 16384
+    entries: OrderedDict[tuple[str, str, str, str], Path] = OrderedDict()
+    hits: int = 0
+    misses: int = 0
+
+    @staticmethod
+    def get_game_path(value: dict) -> str:
+        """
+        This method is responsible for getting the game path of an object or soft object reference.
+        #### Parameters
+        - `value` : `dict`
+            - The reference, with either an `ObjectPath` or an `AssetPathName`.
+        #### Returns
+        - `str` : The game path, or `None` if the reference is empty.
+        """
+        if value is None:
+            return None
+        game_path = value.get('ObjectPath', value.get('AssetPathName'))
+        if not game_path or game_path == 'None':
+            return None
+        return game_path
+
+    @staticmethod
+    def resolve(root_path: Path, folder: str, game_path: str, extension: str) -> Path:
+        """
+        This method is responsible for getting the path of the exported file of a game path.
+        #### Parameters
+        - `root_path` : `Path`
+            - The path to the dump of the current build.
+        - `folder` : `str`
+            - The folder of the export (`json_data` or `media_data`).
+        - `game_path` : `str`
+            - The game path.
+        - `extension` : `str`
+            - The extension of the exported file (e.g.: `.json`).
+        #### Returns
+        - `Path` : The path to the exported file. The same instance is returned for the same arguments.
+        """
+        key = (str(root_path), folder, game_path, extension)
+        path = PathResolver.entries.get(key)
+        if path is not None:
+            PathResolver.hits += 1
+            PathResolver.entries.move_to_end(key)
+            return path
+
+        PathResolver.misses += 1
+        path = Path(f'{key[0]}/{folder}{PathResolver.translate(game_path, extension)}')
+        PathResolver.entries[key] = path
+        if len(PathResolver.entries) > PathResolver.max_size:
+            PathResolver.entries.popitem(last=False)
+        return path
+
+    @staticmethod
+    def translate(game_path: str, extension: str) -> str:
+        """
+        This method is responsible for translating a game path to the path of its export, relative to the export folder.
+        #### Parameters
+        - `game_path` : `str`
+            - The game path (e.g.: `/Game/UI/Images/T_UI_Pebble.T_UI_Pebble`).
+        - `extension` : `str`
+            - The extension of the exported file (e.g.: `.png`).
+        #### Returns
+        - `str` : The relative path, with a leading `/` (e.g.: `/Maine/Content/UI/Images/T_UI_Pebble.png`).
+        """
+        if game_path.startswith('/Game/'):
+            game_path = '/Maine/Content/' + game_path[len('/Game/'):]
+        elif not game_path.startswith('/'):
+            game_path = '/' + game_path
+        directory, _, name = game_path.rpartition('/')
+        return f'{directory}/{name.split(".")[0]}{extension}'
+
+    @staticmethod
+    def get_stats() -> dict[str, int]:
+        """
+        This method is responsible for getting the counters of the memo.
+        #### Returns
+        - `dict[str, int]` : The `hits`, `misses` and `size` of the memo.
+        """
+        return {'hits': PathResolver.hits, 'misses': PathResolver.misses, 'size': len(PathResolver.entries)}
+
+    @staticmethod
+    def clear() -> None:
+        """
+        This method is responsible for dropping every memoized path and resetting the counters.
+        """
+        PathResolver.entries.clear()
+        PathResolver.hits = 0
+        PathResolver.misses = 0
@@ -18,6 +18,8 @@ class PlaceableStaticMeshesCrawler(BaseCrawler):
             'OverrideMaterials',
             'InspectModelOverrideSoft'
         ]
+        # The table is only read by this crawler, so it is not worth keeping it parsed in the DataTableCache.
+        self.stream_rows = True
 
     def _get_crawled_data(self, key: str, value: dict, unknown_fields: dict[str, Any]) -> PlaceableStaticMeshes:
         name = DisplayName(
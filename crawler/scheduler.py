@@ -0,0 +1,218 @@
+import json
+import os
+import sys
+import time
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any
+
+from global_database import GlobalDatabase
+from used_in_index import UsedInIndex
+from .base_crawler import BaseCrawler
+from .asset_index import AssetIndex
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, where the peak RSS is not reported.
+    resource = None
+
+class CrawlScheduler:
+    """
+    This class is responsible for running crawlers in the order given by their declared `dependencies`.
+    Crawlers whose dependencies are done run concurrently in a process pool, and their results are merged back into
+    the `GlobalDatabase` of the calling process.
+    #### Parameters
+    - `crawlers` : `list[BaseCrawler]`
+        - The crawlers to run. `BaseCrawler.init` must have been called before creating them.
+    - `max_workers` : `int`
+        - The number of worker processes. Defaults to the number of CPUs. With `1` the crawlers run in this process.
+    #### Attributes
+    - `stats` : `dict[str, dict[str, float]]`
+        - The `time` in seconds, `rows`, `rows_per_second` and `peak_rss` in MiB of each crawler after `run`. The peak
+          RSS is the one of the process that ran the crawler so far, and is `None` where it is not available.
+    - `elapsed` : `float`
+        - The wall time of the last `run` in seconds.
+    - `dangling` : `dict[str, list[str]]`
+        - The crawlers that reference every missing exported file in the last `run`, by path. The rows reused from a
+          previous output are not checked again.
+    """
+    def __init__(self, crawlers: list[BaseCrawler], max_workers: int = None):
+        self.crawlers = {crawler.crawler_name: crawler for crawler in crawlers}
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self.order = self._sort()
+        self.stats: dict[str, dict[str, float]] = {}
+        self.elapsed = 0.0
+        self.dangling: dict[str, list[str]] = {}
+
+    def run(self) -> dict[str, dict[str, Any]]:
+        """
+        This method is responsible for running all the crawlers, and then saving the `used_in.json` index of the data
+        in the `GlobalDatabase` next to the crawled output.
+        #### Returns
+        - `dict` : The crawled data of each crawler, by crawler name.
+        """
+        start = time.perf_counter()
+        if self.max_workers <= 1:
+            results = {}
+            for name in self.order:
+                print(f'Crawling {name}...')
+                results[name], self.stats[name], dangling = _crawl(self.crawlers[name], {})
+                self._add_dangling(dangling)
+        else:
+            results = self._run_parallel()
+
+        print('Indexing the references...')
+        UsedInIndex.build().save(BaseCrawler._get_crawled_data_path() / 'used_in.json', BaseCrawler.indent)
+        self.dangling = dict(sorted(self.dangling.items()))
+        with open(BaseCrawler._get_crawled_data_path() / 'dangling.json', 'w', encoding='utf-8') as file:
+            json.dump(self.dangling, file, indent=BaseCrawler.indent)
+        self.elapsed = time.perf_counter() - start
+        return results
+
+    def _run_parallel(self) -> dict[str, dict[str, Any]]:
+        results: dict[str, dict[str, Any]] = {}
+        pending = list(self.order)
+        running: dict[Future, str] = {}
+
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=BaseCrawler.init,
+            initargs=BaseCrawler.init_args
+        )
+        try:
+            while pending or running:
+                for name in [name for name in pending if self._is_ready(name, results)]:
+                    pending.remove(name)
+                    print(f'Crawling {name}...')
+                    dependencies = {dependency: self._get_dependency(dependency, results) for dependency in self.crawlers[name].dependencies}
+                    dependencies = {dependency: data for dependency, data in dependencies.items() if data is not None}
+                    running[executor.submit(_crawl, self.crawlers[name], dependencies)] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    crawled_data, self.stats[name], dangling = future.result()
+                    self._add_dangling(dangling)
+
+                    results[name] = crawled_data
+                    self.crawlers[name].crawled_data = crawled_data
+                    GlobalDatabase.add_crawled_data(name, crawled_data)
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+        executor.shutdown()
+        return results
+
+    def get_report(self) -> str:
+        """
+        This method is responsible for getting the table of the `stats` of the last run, e.g.:
+        ```
+        crawler                              time       rows     rows/s   peak RSS
+        items                               1.52s       1076      708.0   210.4MiB
+        ```
+        #### Returns
+        - `str` : The report, in the order the crawlers finished, with the wall time and the peak RSS of the whole run
+          on the last line.
+        """
+        def format_rss(rss: float) -> str:
+            return 'n/a' if rss is None else f'{rss:.1f}MiB'
+
+        lines = [f'{"crawler":<32} {"time":>8} {"rows":>10} {"rows/s":>10} {"peak RSS":>10}']
+        for name, stats in self.stats.items():
+            lines.append(f'{name:<32} {stats["time"]:>7.2f}s {stats["rows"]:>10} {stats["rows_per_second"]:>10.1f} {format_rss(stats["peak_rss"]):>10}')
+        lines.append(f'{"total":<32} {self.elapsed:>7.2f}s {sum(stats["rows"] for stats in self.stats.values()):>10} {"":>10} {format_rss(get_peak_rss()):>10}')
+        if self.dangling:
+            lines.append(f'{len(self.dangling)} referenced files were not exported, see dangling.json')
+        return '\n'.join(lines)
+
+    def _add_dangling(self, dangling: dict[str, list[str]]) -> None:
+        for path, referrers in dangling.items():
+            self.dangling[path] = sorted(set(self.dangling.get(path, [])) | set(referrers))
+
+    def _is_ready(self, name: str, results: dict[str, dict[str, Any]]) -> bool:
+        return all(dependency in results or dependency not in self.crawlers for dependency in self.crawlers[name].dependencies)
+
+    def _get_dependency(self, name: str, results: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        if name in results:
+            return results[name]
+        # The saved outputs are loaded by the worker itself, instead of being sent to it, and the `.rows` files loaded
+        # explicitly are pickled as their path, see `LazyRows`.
+        if name in GlobalDatabase.loaded:
+            return None
+        return getattr(GlobalDatabase, name)
+
+    def _sort(self) -> list[str]:
+        """
+        This method is responsible for ordering the crawlers topologically.
+        #### Returns
+        - `list[str]` : The crawler names, each one after its dependencies.
+        #### Raises
+        - `ValueError` : If a dependency is neither scheduled nor already crawled or saved, or if the dependencies have a
+          cycle.
+        """
+        remaining: dict[str, set[str]] = {}
+        for name, crawler in self.crawlers.items():
+            remaining[name] = set()
+            for dependency in crawler.dependencies:
+                if dependency in self.crawlers:
+                    remaining[name].add(dependency)
+                elif not GlobalDatabase.is_available(dependency):
+                    raise ValueError(f'The crawler {name} depends on {dependency}, which is not scheduled nor crawled yet.')
+
+        order = []
+        while remaining:
+            ready = [name for name, dependencies in remaining.items() if not dependencies]
+            if not ready:
+                raise ValueError(f'The crawler dependencies have a cycle: {", ".join(remaining)}')
+
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for dependencies in remaining.values():
+                dependencies.difference_update(ready)
+
+        return order
+
+def _crawl(crawler: BaseCrawler, dependencies: dict[str, dict[str, Any]]) -> tuple[dict[str, Any], dict[str, float], dict[str, list[str]]]:
+    """
+    This function is responsible for running a crawler, in this process or inside a worker process.
+    #### Parameters
+    - `crawler` : `BaseCrawler`
+        - The crawler to run.
+    - `dependencies` : `dict`
+        - The crawled data of the crawler's dependencies, by crawler name.
+    #### Returns
+    - `tuple[dict, dict, dict]` : The crawled data, the stats and the dangling references of the crawler.
+    """
+    for name, crawled_data in dependencies.items():
+        GlobalDatabase.add_crawled_data(name, crawled_data)
+
+    start = time.perf_counter()
+    crawled_data = crawler.crawl()
+    elapsed = time.perf_counter() - start
+    stats = {
+        'time': elapsed,
+        'rows': len(crawled_data),
+        'rows_per_second': len(crawled_data) / elapsed if elapsed > 0 else 0.0,
+        'peak_rss': get_peak_rss(children=False)
+    }
+    return crawled_data, stats, AssetIndex.pop_all_dangling()
+
+def get_peak_rss(children: bool = True) -> float:
+    """
+    This function is responsible for getting the peak resident set size.
+    #### Parameters
+    - `children` : `bool`
+        - Whether the finished worker processes are included.
+    #### Returns
+    - `float` : The peak RSS in MiB, or `None` if it is not available on this platform.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if children:
+        peak = max(peak, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # In bytes on macOS and in KiB elsewhere.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
@@ -1,17 +1,15 @@
-import json 
-
 from .base_crawler import BaseCrawler
+from .datatable_cache import DataTableCache
 from pathlib import Path
 from typing import Any
 from models import PlayerUpgrade, DisplayName, ToolWeapon, BlockActionInfo, StatusEffect, ItemEffectsInfo
 from models import RecipeComponent, Attack, DamageData, AttacksInfo
+from util.parse_cache import ParseCache
 
 class ToolsWeaponsCrawler(BaseCrawler):
     """
     This class is responsible for crawling the tools and weapons data from the game.
     """
-    attacks_table = None
-
     def __init__(self, hide_unknown_fields: bool = False):
         super().__init__(
             name='tools_weapons',
@@ -21,14 +19,12 @@ class ToolsWeaponsCrawler(BaseCrawler):
         self.unknown_field_list = ToolWeapon.get_unknown_fields()
 
         global_combat_data_path = self.root_path / 'json_data/Maine/Content/Blueprints/Global/GlobalCombatData.json'
-        global_combat_data = json.loads(global_combat_data_path.read_text(encoding='utf-8'))[0]['Properties']
+        global_combat_data = ParseCache.load(global_combat_data_path)[0]['Properties']
+        self.source_files.append(global_combat_data_path)
         self.combo_scaling_types = {}
         for scaling_type in global_combat_data['ComboScalingTypes']:
             tag_name = scaling_type['Tag']['TagName']
             self.combo_scaling_types[tag_name] = scaling_type['ScalingValue']
-    
-    def dispose(self) -> None:
-        ToolsWeaponsCrawler.attacks_table = None
 
     def _parse_recipe_component(self, component: dict[str, Any]) -> RecipeComponent:
         # TODO: Move this to a separate crawler
@@ -36,12 +32,10 @@ class ToolsWeaponsCrawler(BaseCrawler):
         quantity = component['ItemCount']
         datatable_path = self._get_object_path(component['Item']['DataTable'])
 
-        if ToolsWeaponsCrawler.items_table is None and 'Table_AllItems' in datatable_path.name:
-            ToolsWeaponsCrawler.items_table = json.loads(datatable_path.read_text(encoding='utf-8'))[0]['Rows']
-        elif 'Table_AllItems' not in datatable_path.name:
+        if 'Table_AllItems' not in datatable_path.name:
             raise ValueError('The provided object path is not an items table.')
         
-        item_json = ToolsWeaponsCrawler.items_table[item_key]
+        item_json = DataTableCache.get_rows(datatable_path)[item_key]
 
         display_name = DisplayName(
             table_id=item_json['LocalizedDisplayName']['StringTableID'],
@@ -72,12 +66,10 @@ class ToolsWeaponsCrawler(BaseCrawler):
         if 'ItemAttacks' in datatable_path.name:
             datatable_path = datatable_path.parent / 'AllAttacks.json'
 
-        if ToolsWeaponsCrawler.attacks_table is None and 'AllAttacks' in datatable_path.name:
-            ToolsWeaponsCrawler.attacks_table = json.loads(datatable_path.read_text(encoding='utf-8'))[0]['Rows']
-        elif 'AllAttacks' not in datatable_path.name and 'ItemAttacks' not in datatable_path.name:
+        if 'AllAttacks' not in datatable_path.name and 'ItemAttacks' not in datatable_path.name:
             raise ValueError('The provided object path is not an attacks table.')
         
-        attack_json = ToolsWeaponsCrawler.attacks_table[key_name]
+        attack_json = DataTableCache.get_rows(datatable_path)[key_name]
 
         unknown_fields = self._get_unknown_fields(attack_json['DamageData'], DamageData.get_unknown_fields())
         damage_type = attack_json['DamageData']['DamageType']
@@ -1,5 +1,12 @@
-from models import StatusEffect
+from models import StatusEffect, Achievement, HarvestNode, Creature, CharacterData, ChatWheel, Emote, PetPersonality
+from models import PlaceableStaticMeshes, PlayerUpgrade, ToolWeapon, Item, ItemSet, CraftingRecipe, Mutation, Reference
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
 from typing import Any
+from row_store import RowStore, LazyRows
+
+import json
 
 class GlobalDatabase:
     """
@@ -8,8 +15,69 @@ class GlobalDatabase:
     #### Attributes
     - `status_effects`: `dict[str, StatusEffect]`
         - The status effects data.
+    - `items`: `dict[str, Item]`
+        - The items data.
+    - `<crawler name>`: `dict[str, Any]`
+        - The data of every other crawler of `models`, used to build indexes across the crawled data.
+    - `models`: `dict[str, type]`
+        - The model class of the rows saved by each crawler, used to load its saved data back with `from_dict`.
+    - `backend`: `SQLiteDatabase`
+        - An exported database used for the crawlers that were not crawled or loaded in this process.
+    - `crawled_data_path`: `Path`
+        - The directory with the saved output of the crawlers (e.g.: `data/crawled/1.4.4.4634`). The crawlers that were
+          not crawled or loaded in this process are loaded from it on their first lookup, from the `.rows` file when
+          there is one and from the JSON otherwise.
+    - `max_loaded_models`: `int`
+        - The budget, in built models, of the tables loaded on their first lookup, which is what they hold in memory: a
+          JSON output builds all its rows, while a `.rows` file only builds the rows that are looked up and keeps at
+          most this many of them. When a table is loaded, the least recently used ones are unloaded until the budget is
+          met. `None` disables the eviction.
+    - `loaded`: `OrderedDict[str, None]`
+        - The names of the tables loaded on their first lookup, from the least to the most recently used.
     """
     status_effects: dict[str, StatusEffect] = None
+    items: dict[str, Item] = None
+    achievements: dict[str, Achievement] = None
+    harvest_nodes: dict[str, HarvestNode] = None
+    bestiary: dict[str, Creature] = None
+    character_data: dict[str, CharacterData] = None
+    chat_wheel: dict[str, ChatWheel] = None
+    emotes: dict[str, Emote] = None
+    pet_personalities: dict[str, PetPersonality] = None
+    placeable_static_meshes: dict[str, PlaceableStaticMeshes] = None
+    placeable_static_meshes_manmade: dict[str, PlaceableStaticMeshes] = None
+    placeable_static_meshes_natural: dict[str, PlaceableStaticMeshes] = None
+    player_upgrades: dict[str, PlayerUpgrade] = None
+    tools_weapons: dict[str, ToolWeapon] = None
+    item_sets: dict[str, ItemSet] = None
+    crafting_recipes: dict[str, CraftingRecipe] = None
+    mutations: dict[str, Mutation] = None
+
+    backend: 'SQLiteDatabase' = None
+
+    crawled_data_path: Path = None
+    max_loaded_models: int = None
+    loaded: OrderedDict[str, None] = OrderedDict()
+
+    models: dict[str, type] = {
+        'achievements': Achievement,
+        'harvest_nodes': HarvestNode,
+        'bestiary': Creature,
+        'character_data': CharacterData,
+        'chat_wheel': ChatWheel,
+        'emotes': Emote,
+        'pet_personalities': PetPersonality,
+        'placeable_static_meshes': PlaceableStaticMeshes,
+        'placeable_static_meshes_manmade': PlaceableStaticMeshes,
+        'placeable_static_meshes_natural': PlaceableStaticMeshes,
+        'player_upgrades': PlayerUpgrade,
+        'tools_weapons': ToolWeapon,
+        'items': Item,
+        'item_sets': ItemSet,
+        'crafting_recipes': CraftingRecipe,
+        'status_effects': StatusEffect,
+        'mutations': Mutation
+    }
 
     def __init__(self):
         pass
@@ -28,8 +96,87 @@ class GlobalDatabase:
             # TODO: This should be a logger. But for now, we will just skip since there are some crawlers that are not yet implemented.
             return
 
+        # The added data is never evicted, unlike the table it replaces.
+        GlobalDatabase.unload(crawler_name)
         setattr(GlobalDatabase, crawler_name, crawled_data)
 
+    @staticmethod
+    def set_crawled_data_path(crawled_data_path: Path) -> None:
+        """
+        This method is responsible for changing the directory the tables are loaded from on their first lookup. The
+        tables loaded from the previous directory are unloaded.
+        #### Parameters
+        - `crawled_data_path` : `Path`
+            - The directory with the saved output of the crawlers, or `None` to not load them.
+        """
+        crawled_data_path = Path(crawled_data_path) if crawled_data_path is not None else None
+        if crawled_data_path != GlobalDatabase.crawled_data_path:
+            for crawler_name in list(GlobalDatabase.loaded):
+                GlobalDatabase.unload(crawler_name)
+        GlobalDatabase.crawled_data_path = crawled_data_path
+
+    @staticmethod
+    def configure(max_loaded_models: int = None) -> None:
+        """
+        This method is responsible for changing the eviction budget of the tables loaded on their first lookup.
+        #### Parameters
+        - `max_loaded_models` : `int`
+            - The budget, in built models. `None` disables the eviction.
+        """
+        GlobalDatabase.max_loaded_models = max_loaded_models
+        for crawler_name in GlobalDatabase.loaded:
+            data = getattr(GlobalDatabase, crawler_name)
+            if isinstance(data, LazyRows):
+                data.set_max_models(max_loaded_models)
+        GlobalDatabase._evict()
+
+    @staticmethod
+    def get_table(crawler_name: str) -> Mapping[str, Any]:
+        """
+        This method is responsible for getting the data of a crawler, loading its saved output if it was not crawled or
+        loaded in this process.
+        #### Parameters
+        - `crawler_name` : `str`
+            - The name of the crawler.
+        #### Returns
+        - `Mapping[str, Any]` : The data by key name, or `None` if it was neither crawled, loaded nor saved.
+        """
+        data = getattr(GlobalDatabase, crawler_name, None)
+        if crawler_name in GlobalDatabase.loaded:
+            GlobalDatabase.loaded.move_to_end(crawler_name)
+        elif data is None and crawler_name in GlobalDatabase.models:
+            data = GlobalDatabase._load_table(crawler_name)
+        return data
+
+    @staticmethod
+    def is_available(crawler_name: str) -> bool:
+        """
+        This method is responsible for checking if the data of a crawler can be looked up, without loading it.
+        #### Parameters
+        - `crawler_name` : `str`
+            - The name of the crawler.
+        #### Returns
+        - `bool` : Whether the crawler was crawled or loaded in this process, or has a saved output.
+        """
+        return getattr(GlobalDatabase, crawler_name, None) is not None or GlobalDatabase._get_saved_path(crawler_name) is not None
+
+    @staticmethod
+    def unload(crawler_name: str) -> None:
+        """
+        This method is responsible for dropping a table loaded on its first lookup, so it is loaded again on the next
+        one, and closing its `.rows` file. The data that was crawled or loaded explicitly is kept.
+        #### Parameters
+        - `crawler_name` : `str`
+            - The name of the crawler.
+        """
+        if crawler_name not in GlobalDatabase.loaded:
+            return
+        del GlobalDatabase.loaded[crawler_name]
+        data = getattr(GlobalDatabase, crawler_name)
+        if isinstance(data, LazyRows):
+            data.store.close()
+        setattr(GlobalDatabase, crawler_name, None)
+
     @staticmethod
     def get_crawled_data(crawler_name: str, key: str) -> Any:
         """
@@ -42,12 +189,98 @@ class GlobalDatabase:
         #### Returns
         - `Any` : The crawled data.
         """
+        if getattr(GlobalDatabase, crawler_name, None) is None and GlobalDatabase.backend is not None and GlobalDatabase.backend.has_table(crawler_name):
+            return GlobalDatabase.backend.get(crawler_name, key)
+
         if not hasattr(GlobalDatabase, crawler_name):
             # TODO: Some crawlers that are not yet implemented.
             raise Exception(f'There is no data for the crawler: {crawler_name}')
         
-        data = getattr(GlobalDatabase, crawler_name)
+        data = GlobalDatabase.get_table(crawler_name)
+        if data is None:
+            raise Exception(f'The data for the crawler: {crawler_name} was not crawled or loaded')
         if key not in data:
             raise Exception(f'The key: {key} does not exist in the data for the crawler: {crawler_name}')
         
         return data[key]
+
+    @staticmethod
+    def load_crawled_data(crawler_name: str, data_path: Path) -> dict[str, Any]:
+        """
+        This method is responsible for loading the saved output of a crawler into the global database.
+        #### Parameters
+        - `crawler_name` : `str`
+            - The name of the crawler.
+        - `data_path` : `Path`
+            - The path to the saved output of the crawler.
+        #### Returns
+        - `dict` : The loaded data.
+        """
+        model = GlobalDatabase.models[crawler_name]
+        data = json.loads(Path(data_path).read_text())
+        crawled_data = {key: model.from_dict(value) for key, value in data.items()}
+        GlobalDatabase.add_crawled_data(crawler_name, crawled_data)
+        return crawled_data
+
+    @staticmethod
+    def load_row_store(crawler_name: str, store_path: Path) -> LazyRows:
+        """
+        This method is responsible for loading the `.rows` file of a crawler into the global database, without reading
+        its rows: each row is decoded and built on its first lookup.
+        #### Parameters
+        - `crawler_name` : `str`
+            - The name of the crawler.
+        - `store_path` : `Path`
+            - The path to the `.rows` file of the crawler (e.g.: `data/crawled/1.4.4.4634/items.rows`).
+        #### Returns
+        - `LazyRows` : The loaded data.
+        """
+        crawled_data = LazyRows(RowStore(store_path), GlobalDatabase.models[crawler_name])
+        GlobalDatabase.add_crawled_data(crawler_name, crawled_data)
+        return crawled_data
+
+    @staticmethod
+    def _get_saved_path(crawler_name: str) -> Path:
+        if GlobalDatabase.crawled_data_path is None or crawler_name not in GlobalDatabase.models:
+            return None
+        for suffix in ('.rows', '.json'):
+            path = GlobalDatabase.crawled_data_path / f'{crawler_name}{suffix}'
+            if path.exists():
+                return path
+        return None
+
+    @staticmethod
+    def _load_table(crawler_name: str) -> Mapping[str, Any]:
+        path = GlobalDatabase._get_saved_path(crawler_name)
+        if path is None:
+            return None
+        if path.suffix == '.rows':
+            data = GlobalDatabase.load_row_store(crawler_name, path)
+            data.set_max_models(GlobalDatabase.max_loaded_models)
+        else:
+            data = GlobalDatabase.load_crawled_data(crawler_name, path)
+
+        GlobalDatabase.loaded[crawler_name] = None
+        GlobalDatabase._evict()
+        return data
+
+    @staticmethod
+    def _count_models(crawler_name: str) -> int:
+        data = getattr(GlobalDatabase, crawler_name)
+        return len(data.models) if isinstance(data, LazyRows) else len(data)
+
+    @staticmethod
+    def _evict() -> None:
+        if GlobalDatabase.max_loaded_models is None:
+            return
+
+        # The most recently used table is kept even if it has more models than the budget.
+        loaded_models = sum(GlobalDatabase._count_models(crawler_name) for crawler_name in GlobalDatabase.loaded)
+        for crawler_name in list(GlobalDatabase.loaded)[:-1]:
+            if loaded_models <= GlobalDatabase.max_loaded_models:
+                break
+            loaded_models -= GlobalDatabase._count_models(crawler_name)
+            GlobalDatabase.unload(crawler_name)
+
+# The references of the normalized output are resolved against the crawled data.
+Reference.resolver = GlobalDatabase.get_crawled_data
\ No newline at end of file
@@ -1,6 +1,8 @@
 from .achievement import Achievement
 from .harvest_node import HarvestNode
 from .harvest_node_info import HarvestNodeInfo
+from .localization import Localization
+from .reference import Reference
 from .display_name import DisplayName
 from .creature_info import CreatureInfo
 from .creature import Creature
@@ -27,4 +29,5 @@ from .mutation import Mutation
 
 from .ue_object import UEObject
 from .ue_datatable_reference import UEDataTableReference
-from .placement_data import PlacementData
\ No newline at end of file
+from .placement_data import PlacementData
+from .model import Model, Field
\ No newline at end of file
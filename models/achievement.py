@@ -1,6 +1,6 @@
-import uuid
+from .model import Model, Field
 
-class Achievement:
+class Achievement(Model):
     """
     This class represents an achievement.
     #### Parameters
@@ -15,23 +15,10 @@ class Achievement:
     - `unknown_fields`: `dict`
         - The unknown fields of the achievement.
     """
-    def __init__(self, id: uuid.UUID, name: str, unlock_tag: str, can_unlock_in_creative: bool, unknown_fields: dict):
-        self.id = id
-        self.name = name
-        self.unlock_tag = unlock_tag
-        self.can_unlock_in_creative = can_unlock_in_creative
-        self.unknown_fields = unknown_fields
-    
-    def to_dict(self) -> dict:
-        """
-        This method is responsible for converting the achievement to a dictionary.
-        #### Returns
-        - `dict` : The converted achievement.
-        """
-        return {
-            'id': str(self.id),
-            'name': self.name,
-            'unlock_tag': self.unlock_tag,
-            'can_unlock_in_creative': self.can_unlock_in_creative,
-            'unknown_fields': self.unknown_fields
-        }
\ No newline at end of file
+    fields = [
+        Field('id', uuid=True),
+        Field('name'),
+        Field('unlock_tag'),
+        Field('can_unlock_in_creative'),
+        Field('unknown_fields')
+    ]
\ No newline at end of file
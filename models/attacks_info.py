@@ -1,6 +1,7 @@
 from models import Attack
+from .model import Model, Field
 
-class AttacksInfo:
+class AttacksInfo(Model):
     """
     Wraps the information about the attacks of a Tool or Weapon.
     #### Parameters
@@ -17,43 +18,11 @@ class AttacksInfo:
     - `swimming_scaling`: `list[float]`
         - The swimming scaling factors of the Tool or Weapon.
     """
-    def __init__(self, main_combo: list[Attack], main_scaling: list[float], alternate_combo: list[Attack], alternate_scaling: list[float], swimming_combo: list[Attack], swimming_scaling: list[float]):
-        self.main_combo = main_combo
-        self.main_scaling = main_scaling
-        self.alternate_combo = alternate_combo
-        self.alternate_scaling = alternate_scaling
-        self.swimming_combo = swimming_combo
-        self.swimming_scaling = swimming_scaling
-
-    def to_dict(self) -> dict:
-        """
-        This method is responsible for converting the Attacks data to a dictionary.
-        #### Returns
-        - `dict` : The converted Attacks data.
-        """
-        return {
-            'main_combo': [attack.to_dict() for attack in self.main_combo],
-            'main_scaling': self.main_scaling,
-            'alternate_combo': [attack.to_dict() for attack in self.alternate_combo],
-            'alternate_scaling': self.alternate_scaling,
-            'swimming_combo': [attack.to_dict() for attack in self.swimming_combo],
-            'swimming_scaling': self.swimming_scaling
-        }
-    
-    def from_dict(data: dict) -> 'AttacksInfo':
-        """
-        This method is responsible for converting the dictionary to a AttacksInfo object.
-        #### Parameters
-        - `data`: `dict`
-            - The dictionary to convert.
-        #### Returns
-        - `AttacksInfo` : The converted AttacksInfo object.
-        """
-        return AttacksInfo(
-            [Attack.from_dict(attack) for attack in data['main_combo']],
-            data['main_scaling'],
-            [Attack.from_dict(attack) for attack in data['alternate_combo']],
-            data['alternate_scaling'],
-            [Attack.from_dict(attack) for attack in data['swimming_combo']],
-            data['swimming_scaling']
-        )
\ No newline at end of file
+    fields = [
+        Field('main_combo', Attack, many=True),
+        Field('main_scaling'),
+        Field('alternate_combo', Attack, many=True),
+        Field('alternate_scaling'),
+        Field('swimming_combo', Attack, many=True),
+        Field('swimming_scaling')
+    ]
\ No newline at end of file
@@ -1,4 +1,6 @@
-class BlockActionInfo:
+from .model import Model, Field
+
+class BlockActionInfo(Model):
     """
     A class to represent data related to Block action of a Tool or Weapon.
     #### Parameters
@@ -13,40 +15,10 @@ class BlockActionInfo:
     - `block_stamina_regen_multiplier`: `float`
         - The stamina regeneration multiplier when blocking.
     """
-    def __init__(self, can_block: bool, cannot_block_while_attacking: bool, block_damage_reduction: float, block_stamina_cost: float, block_stamina_regen_multiplier: float):
-        self.can_block = can_block
-        self.cannot_block_while_attacking = cannot_block_while_attacking
-        self.block_damage_reduction = block_damage_reduction
-        self.block_stamina_cost = block_stamina_cost
-        self.block_stamina_regen_multiplier = block_stamina_regen_multiplier
-
-    def to_dict(self) -> dict:
-        """
-        This method is responsible for converting the Block data to a dictionary.
-        #### Returns
-        - `dict` : The converted Block data.
-        """
-        return {
-            'can_block': self.can_block,
-            'cannot_block_while_attacking': self.cannot_block_while_attacking,
-            'block_damage_reduction': self.block_damage_reduction,
-            'block_stamina_cost': self.block_stamina_cost,
-            'block_stamina_regen_multiplier': self.block_stamina_regen_multiplier
-        }
-    
-    def from_dict(data: dict) -> 'BlockActionInfo':
-        """
-        This method is responsible for converting the dictionary to a BlockActionInfo object.
-        #### Parameters
-        - `data`: `dict`
-            - The dictionary to convert.
-        #### Returns
-        - `BlockActionInfo` : The converted BlockActionInfo object.
-        """
-        return BlockActionInfo(
-            data['can_block'],
-            data['cannot_block_while_attacking'],
-            data['block_damage_reduction'],
-            data['block_stamina_cost'],
-            data['block_stamina_regen_multiplier']
-        )
\ No newline at end of file
+    fields = [
+        Field('can_block'),
+        Field('cannot_block_while_attacking'),
+        Field('block_damage_reduction'),
+        Field('block_stamina_cost'),
+        Field('block_stamina_regen_multiplier')
+    ]
\ No newline at end of file
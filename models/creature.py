@@ -9,8 +9,9 @@ from .item import Item
 from .character_data import CharacterData
 from pathlib import Path
 from models import CreatureInfo
+from .model import Model, Field
 
-class Creature:
+class Creature(Model):
     """
     This class is responsible for representing a creature.
     #### Parameters
@@ -33,35 +34,18 @@ class Creature:
     - `unknown_fields` : `dict`
         - The unknown fields of the creature.
     """
-    def __init__(self, key_name: str, name: DisplayName, asset_path_name: str, weakpoint_tags: list, info: CreatureInfo, character_data: CharacterData, rare_unlock_item: Item, rare_drop_chance: float, unknown_fields: dict):
-        self.key_name = key_name
-        self.name = name
-        self.asset_path_name = asset_path_name
-        self.weakpoint_tags = weakpoint_tags
-        self.info = info
-        self.character_data = character_data
-        self.rare_unlock_item = rare_unlock_item
-        self.rare_drop_chance = rare_drop_chance
-        self.unknown_fields = unknown_fields
+    fields = [
+        Field('key_name'),
+        Field('name', DisplayName, optional=True),
+        Field('asset_path_name'),
+        Field('weakpoint_tags'),
+        Field('info', CreatureInfo, optional=True),
+        Field('character_data', CharacterData, optional=True),
+        Field('rare_unlock_item', Item, table='items', optional=True),
+        Field('rare_drop_chance'),
+        Field('unknown_fields')
+    ]
 
-    def to_dict(self) -> dict:
-        """
-        This method is responsible for converting the creature to a dictionary.
-        #### Returns
-        - `dict` : The converted creature.
-        """
-        return {
-            'key_name': self.key_name,
-            'name': self.name.to_dict() if self.name else None,
-            'asset_path_name': self.asset_path_name,
-            'weakpoint_tags': self.weakpoint_tags,
-            'info': self.info.to_dict() if self.info else None,
-            'character_data': self.character_data.to_dict() if self.character_data else None,
-            'rare_unlock_item': self.rare_unlock_item.to_dict() if self.rare_unlock_item else None,
-            'rare_drop_chance': self.rare_drop_chance,
-            'unknown_fields': self.unknown_fields
-        }
-    
     valid_damage_types = [
         'general',  'smashing', 'chopping',  'slashing',
         'stabbing', 'fresh',    'salty',     'sour',    
@@ -76,8 +60,6 @@ class Creature:
         #### Returns
         - `float` : The weakness or resistance multiplier.
         """
-        if self.key_name == 'SpiderBlackWidow':
-            print()
         if damage_type not in Creature.valid_damage_types:
             raise ValueError(f"Invalid damage type: {damage_type}")
         if self.info is None:
@@ -87,27 +69,4 @@ class Creature:
             if effect.key_name.startswith('DamageResist') and damage_type in effect.key_name.lower():
                 return effect.value
             
-        return 1.0
-
-    @staticmethod
-    def from_dict(data: dict) -> 'Creature':
-        """
-        This method is responsible for converting the dictionary to a Creature object.
-        #### Parameters
-        - `data`: `dict`
-            - The dictionary to convert.
-        #### Returns
-        - `Creature` : The converted Creature object.
-        """
-        return Creature(
-            data['key_name'],
-            DisplayName.from_dict(data['name']) if data['name'] else None,
-            data['asset_path_name'],
-            data['weakpoint_tags'],
-            CreatureInfo.from_dict(data['info']) if data['info'] else None,
-            CharacterData.from_dict(data['character_data']) if data['character_data'] else None,
-            Item.from_dict(data['rare_unlock_item']) if data['rare_unlock_item'] else None,
-            data['rare_drop_chance'],
-            data['unknown_fields']
-        )
-    
\ No newline at end of file
+        return 1.0
\ No newline at end of file
@@ -1,17 +1,13 @@
-import json
+from .localization import Localization
+from .model import Model, Field
 
-from pathlib import Path
-
-class DisplayName:
+class DisplayName(Model):
     """
     This class represents a display name in the game.
     #### Parameters
-    - `localization_json` : `dict`
-        - The localization JSON. This needs to be initialized before using the class.
     - `string_table_names` : `dict`
         - The string table names.
     """
-    localization_json: dict = None
     # TODO: Add more string table names.
     string_table_names = {
         1: 'game/gui',
@@ -26,6 +22,13 @@ class DisplayName:
         197: 'game/petpersonalities',
         342: 'game/props'
     }
+
+    fields = [
+        Field('table_id'),
+        Field('string_id'),
+        Field('string_table_name'),
+        Field('text')
+    ]
     
     def __init__(self, table_id: int, string_id: int, string_table_name: str, text: str = None):
         self.table_id = table_id
@@ -33,78 +36,13 @@ class DisplayName:
         self.string_table_name = string_table_name
         self.text = text if text else self.get_string()
     
-    # TODO: Revise the way this verifies the version.
-    @staticmethod
-    def init(lang_path: Path):
-        """
-        This method is responsible for initializing the DisplayName localization.
-        #### Parameters
-        - `lang_path` : `Path`
-            - The path to the language file.
-        """
-        from crawler.base_crawler import BaseCrawler
-
-        buffer = []
-        with open(lang_path, 'r', encoding='utf-8') as file:
-            buffer = json.load(file)[0]['Properties']['StringTables']
-
-        DisplayName.localization_json = {}
-        for string_table in buffer:
-            if BaseCrawler.version.major == 1 and BaseCrawler.version.minor == 4 and BaseCrawler.version.patch < 4:
-                key = next(iter(string_table))
-                DisplayName.localization_json[key] = string_table[key]
-            else:
-                key = string_table['Key']
-                DisplayName.localization_json[key] = string_table['Value']
-
-    # TODO: Revise the way this verifies the version.
     def get_string(self) -> str:
         """
         This method is responsible for getting the string of the display name.
         #### Returns
         - `str` : The string of the display name.
         """
-        from crawler.base_crawler import BaseCrawler, GameVersion
-
         if self.table_id <= 0:
             return 'UNKNOWN'
         string_table_name = DisplayName.string_table_names[self.table_id]
-        entries = DisplayName.localization_json[string_table_name]['Entries']
-        for entry in entries:
-            if BaseCrawler.version.major == 1 and BaseCrawler.version.minor == 4 and BaseCrawler.version.patch < 4:
-                list(entry.values())[0]
-            else:
-                entry = entry['Value']
-            if entry['ID'] == self.string_id:
-                return entry['DefaultText']
-            
-        return 'UNKNOWN'
-
-    def to_dict(self) -> dict:
-        """
-        This method is responsible for converting the display name to a dictionary.
-        #### Returns
-        - `dict` : The converted display name.
-        """
-        return {
-            'table_id': self.table_id,
-            'string_id': self.string_id,
-            'string_table_name': self.string_table_name,
-            'text': self.text
-        }
-    
-    def from_dict(data: dict):
-        """
-        This method is responsible for creating a display name from a dictionary.
-        #### Parameters
-        - `data` : `dict`
-            - The dictionary data.
-        #### Returns
-        - `DisplayName` : The created display name.
-        """
-        return DisplayName(
-            data['table_id'],
-            data['string_id'],
-            data['string_table_name'],
-            data['text']
-        )
\ No newline at end of file
+        return Localization.get_index().get((string_table_name, self.string_id), 'UNKNOWN')
\ No newline at end of file
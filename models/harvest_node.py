@@ -1,15 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from .display_name import DisplayName
+from .harvest_node_info import HarvestNodeInfo
 
-if TYPE_CHECKING:
-    from .display_name import DisplayName
-    from .ue_object import UEObject
-    from models import HarvestNodeInfo
+from .model import Model, Field
 
-from pathlib import Path
-
-class HarvestNode:
+class HarvestNode(Model):
     """
     This class represents a harvest node in the game.
     #### Parameters
@@ -30,29 +26,13 @@ class HarvestNode:
     - `unknown_fields`: `dict`
         - The unknown fields of the harvest node.
     """
-    def __init__(self, name: str, display_name: 'DisplayName', icon: Path, asset_path_name: str, month_to_unlock: str, subcategory_tag: str, info: 'HarvestNodeInfo', unknown_fields: dict):
-        self.name = name
-        self.display_name = display_name
-        self.icon = icon
-        self.asset_path_name = asset_path_name
-        self.month_to_unlock = month_to_unlock
-        self.subcategory_tag = subcategory_tag
-        self.info = info
-        self.unknown_fields = unknown_fields
-
-    def to_dict(self) -> dict:
-        """
-        This method is responsible for converting the harvest node to a dictionary.
-        #### Returns
-        - `dict` : The converted harvest node.
-        """
-        return {
-            'name': self.name,
-            'display_name': self.display_name.to_dict(),
-            'icon': self.icon.as_posix(),
-            'asset_path_name': self.asset_path_name,
-            'month_to_unlock': self.month_to_unlock,
-            'subcategory_tag': self.subcategory_tag,
-            'info': self.info.to_dict() if self.info else None,
-            'unknown_fields': self.unknown_fields
-        }
\ No newline at end of file
+    fields = [
+        Field('name'),
+        Field('display_name', DisplayName),
+        Field('icon', path='posix'),
+        Field('asset_path_name'),
+        Field('month_to_unlock'),
+        Field('subcategory_tag'),
+        Field('info', HarvestNodeInfo, optional=True),
+        Field('unknown_fields')
+    ]
\ No newline at end of file
@@ -1,10 +1,10 @@
 from models.display_name import DisplayName
 from models.recipe_component import RecipeComponent
 from models.item_effects_info import ItemEffectsInfo
-from pathlib import Path
 from .equippable_data import EquippableData
+from .model import Model, Field
 
-class Item:
+class Item(Model):
     """
     Class that represents an item in the game.
     #### Parameters
@@ -39,71 +39,23 @@ class Item:
     - `unknown_fields` : `dict`
         - The unknown fields of the item.
     """
-    def __init__(self, key_name: str, name: DisplayName, description: DisplayName, icon_path: Path, icon_modifier_path: Path, tier: int, equippable_data: EquippableData, actor_name: str, duplication_cost: int, stack_size_tag: str, consumable_data: list, consume_animation_type: str, ugc_tag: str, unknown_fields: dict):
-        self.key_name = key_name
-        self.name = name
-        self.description = description
-        self.icon_path = icon_path
-        self.icon_modifier_path = icon_modifier_path
-        self.tier = tier
-        self.equippable_data = equippable_data
-        self.actor_name = actor_name
-        self.duplication_cost = duplication_cost
-        self.stack_size_tag = stack_size_tag
-        self.consumable_data = consumable_data
-        self.consume_animation_type = consume_animation_type
-        self.ugc_tag = ugc_tag
-        self.unknown_fields = unknown_fields
+    fields = [
+        Field('key_name'),
+        Field('name', DisplayName, optional=True),
+        Field('description', DisplayName, optional=True),
+        Field('icon_path', path='posix'),
+        Field('icon_modifier_path', path='posix'),
+        Field('tier'),
+        Field('equippable_data', EquippableData, optional=True),
+        Field('actor_name'),
+        Field('duplication_cost'),
+        Field('stack_size_tag'),
+        Field('consumable_data'),
+        Field('consume_animation_type'),
+        Field('ugc_tag'),
+        Field('unknown_fields')
+    ]
 
-    def to_dict(self) -> dict:
-        """
-        This method is responsible for converting the item to a dictionary.
-        #### Returns
-        - `dict` : The converted item.
-        """
-        return {
-            'key_name': self.key_name,
-            'name': self.name.to_dict() if self.name else None,
-            'description': self.description.to_dict() if self.description else None,
-            'icon_path': self.icon_path.as_posix(),
-            'icon_modifier_path': self.icon_modifier_path.as_posix(),
-            'tier': self.tier,
-            'equippable_data': self.equippable_data.to_dict() if self.equippable_data else None,
-            'actor_name': self.actor_name,
-            'duplication_cost': self.duplication_cost,
-            'stack_size_tag': self.stack_size_tag,
-            'consumable_data': self.consumable_data,
-            'consume_animation_type': self.consume_animation_type,
-            'ugc_tag': self.ugc_tag,
-            'unknown_fields': self.unknown_fields
-        }
-    
-    def from_dict(data: dict) -> 'Item':
-        """
-        This method is responsible for converting a dictionary to an item.
-        #### Parameters
-        - `data` : `dict`
-            - The dictionary to convert.
-        #### Returns
-        - `Item` : The converted item.
-        """
-        return Item(
-            key_name=data['key_name'],
-            name=DisplayName.from_dict(data['name']) if data['name'] else None,
-            description=DisplayName.from_dict(data['description']) if data['description'] else None,
-            icon_path=Path(data['icon_path']),
-            icon_modifier_path=Path(data['icon_modifier_path']),
-            tier=data['tier'],
-            equippable_data=EquippableData.from_dict(data['equippable_data']) if data['equippable_data'] else None,
-            ctor_name=data['actor_name'],
-            duplication_cost=data['duplication_cost'],
-            stack_size_tag=data['stack_size_tag'],
-            consumable_data=data['consumable_data'],
-            consume_animation_type=data['consume_animation_type'],
-            ugc_tag=data['ugc_tag'],
-            unknown_fields=data['unknown_fields']
-        )
-    
     @staticmethod
     def get_unknown_fields() -> dict:
         """
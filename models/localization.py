@@ -0,0 +1,156 @@
+from pathlib import Path
+
+from util.parse_cache import ParseCache
+
+class Localization:
+    """
+    Process-wide registry of the localization indexes used by `DisplayName`.
+    The indexes are keyed by `(version, locale)`, loaded lazily on first use and shared by all the crawlers.
+    #### Attributes
+    - `sources` : `dict[tuple[str, str], Path]`
+        - The language file registered for each `(version, locale)`.
+    - `indexes` : `dict[tuple[str, str], dict]`
+        - The loaded indexes, mapping `(string_table_name, string_id)` to the localized text.
+    - `active` : `tuple[str, str]`
+        - The `(version, locale)` used by the `DisplayName` lookups.
+    """
+    sources: dict[tuple[str, str], Path] = {}
+    indexes: dict[tuple[str, str], dict[tuple[str, int], str]] = {}
+    active: tuple[str, str] = None
+
+    @staticmethod
+    def register(version: str, locale: str, lang_path: Path, activate: bool = True) -> None:
+        """
+        This method is responsible for registering the language file of a game build. Nothing is loaded until the first lookup.
+        #### Parameters
+        - `version` : `str`
+            - The game version.
+        - `locale` : `str`
+            - The locale of the language file.
+        - `lang_path` : `Path`
+            - The path to the language file.
+        - `activate` : `bool`
+            - A flag to make this `(version, locale)` the one used by the `DisplayName` lookups.
+        """
+        key = (str(version), locale)
+        lang_path = Path(lang_path)
+        if Localization.sources.get(key) != lang_path:
+            Localization.indexes.pop(key, None)
+        Localization.sources[key] = lang_path
+
+        if activate:
+            Localization.active = key
+
+    @staticmethod
+    def get_index(version: str = None, locale: str = None) -> dict[tuple[str, int], str]:
+        """
+        This method is responsible for getting the localization index, loading it on first use.
+        #### Parameters
+        - `version` : `str`
+            - The game version. Defaults to the active one.
+        - `locale` : `str`
+            - The locale. Defaults to the active one.
+        #### Returns
+        - `dict` : The localized texts indexed by `(string_table_name, string_id)`.
+        """
+        key = Localization._get_key(version, locale)
+
+        index = Localization.indexes.get(key)
+        if index is None:
+            index = Localization.load(Localization.sources[key])
+            Localization.indexes[key] = index
+
+        return index
+
+    @staticmethod
+    def invalidate(version: str = None, locale: str = None) -> None:
+        """
+        This method is responsible for dropping loaded indexes so they are read again on the next lookup.
+        #### Parameters
+        - `version` : `str`
+            - The game version to invalidate. All versions when `None`.
+        - `locale` : `str`
+            - The locale to invalidate. All locales when `None`.
+        """
+        for key in list(Localization.indexes):
+            if version is not None and key[0] != str(version):
+                continue
+            if locale is not None and key[1] != locale:
+                continue
+            del Localization.indexes[key]
+
+    @staticmethod
+    def reload(version: str = None, locale: str = None) -> dict[tuple[str, int], str]:
+        """
+        This method is responsible for reading a language file again, e.g. after the dump was re-exported.
+        #### Parameters
+        - `version` : `str`
+            - The game version. Defaults to the active one.
+        - `locale` : `str`
+            - The locale. Defaults to the active one.
+        #### Returns
+        - `dict` : The reloaded localization index.
+        """
+        key = Localization._get_key(version, locale)
+        Localization.indexes.pop(key, None)
+        return Localization.get_index(*key)
+
+    @staticmethod
+    def load(lang_path: Path) -> dict[tuple[str, int], str]:
+        """
+        This method is responsible for reading a language file and indexing its string tables.
+        #### Parameters
+        - `lang_path` : `Path`
+            - The path to the language file.
+        #### Returns
+        - `dict` : The localized texts indexed by `(string_table_name, string_id)`.
+        """
+        string_tables = ParseCache.load(lang_path)[0]['Properties']['StringTables']
+
+        return Localization.build_index(string_tables)
+
+    @staticmethod
+    def build_index(string_tables: list[dict]) -> dict[tuple[str, int], str]:
+        """
+        This method is responsible for indexing the string tables of a localization file.
+        The layout is detected once from the first string table instead of checking the game version for every entry:
+        - Before 1.4.4 each string table is a `{name: table}` object and its entries are plain `{ID, DefaultText}` objects.
+        - From 1.4.4 onwards each string table is a `{Key, Value}` pair and so is each of its entries.
+        #### Parameters
+        - `string_tables` : `list[dict]`
+            - The `StringTables` list of the localization file.
+        #### Returns
+        - `dict` : The localized texts indexed by `(string_table_name, string_id)`.
+        """
+        index = {}
+        if len(string_tables) == 0:
+            return index
+
+        key_value_layout = 'Key' in string_tables[0] and 'Value' in string_tables[0]
+        for string_table in string_tables:
+            if key_value_layout:
+                name, table = string_table['Key'], string_table['Value']
+                entries = [entry['Value'] for entry in table['Entries']]
+            else:
+                name = next(iter(string_table))
+                entries = string_table[name]['Entries']
+
+            for entry in entries:
+                # Keep the first occurrence, which is what the linear scan used to return.
+                index.setdefault((name, entry['ID']), entry['DefaultText'])
+
+        return index
+
+    @staticmethod
+    def _get_key(version: str, locale: str) -> tuple[str, str]:
+        if Localization.active is None and (version is None or locale is None):
+            raise Exception('The localization has not been initialized. Call `BaseCrawler.init` first.')
+
+        key = (
+            Localization.active[0] if version is None else str(version),
+            Localization.active[1] if locale is None else locale
+        )
+        if key not in Localization.sources:
+            raise Exception(f'There is no language file registered for the version {key[0]} and locale {key[1]}')
+
+        return key
@@ -0,0 +1,175 @@
+import uuid
+
+from pathlib import Path
+from typing import Any
+
+from .reference import Reference
+
+class Field:
+    """
+    The declaration of a field of a model, used to generate its `__init__`, `to_dict` and `from_dict`.
+    #### Parameters
+    - `name` : `str`
+        - The name of the field, both as an attribute and as a key of the dictionary.
+    - `model` : `type`
+        - The model of a nested entity, converted with its own `to_dict` and `from_dict`.
+    - `table` : `str`
+        - The crawler that owns the nested entity, which is then saved with `Reference.dump` and loaded with
+          `Reference.load`.
+    - `many` : `bool`
+        - Whether the field is a list of values.
+    - `optional` : `bool`
+        - Whether the value (or each value of the list) may be empty, and is then saved as `None`.
+    - `path` : `str`
+        - How a `Path` is saved: `posix` with `as_posix()` or `str` with `str()`.
+    - `uuid` : `bool`
+        - Whether the field is a `uuid.UUID`, saved as a string.
+    - `save` : `bool`
+        - Whether the field is saved by `to_dict`.
+    - `missing` : `type`
+        - The factory of the value `from_dict` uses when the dictionary doesn't have the field.
+    - `default` : `Any`
+        - The default value of the `__init__` parameter.
+    """
+    no_default = object()
+
+    def __init__(self, name: str, model: type = None, table: str = None, many: bool = False, optional: bool = False, path: str = None, uuid: bool = False, save: bool = True, missing: type = None, default: Any = no_default):
+        self.name = name
+        self.model = model
+        self.table = table
+        self.many = many
+        self.optional = optional
+        self.path = path
+        self.uuid = uuid
+        self.save = save
+        self.missing = missing
+        self.default = default
+
+    def get_dump_code(self, value: str) -> str:
+        """
+        This method is responsible for getting the code that converts a value of the field for `to_dict`.
+        #### Parameters
+        - `value` : `str`
+            - The code of the value.
+        #### Returns
+        - `str` : The code of the converted value.
+        """
+        if self.table is not None:
+            code = f'Reference.dump({value}, {self.table!r})'
+        elif self.model is not None:
+            code = f'{value}.to_dict()'
+        elif self.path == 'posix':
+            code = f'{value}.as_posix()'
+        elif self.path == 'str' or self.uuid:
+            code = f'str({value})'
+        else:
+            return value
+        return f'{code} if {value} else None' if self.optional else code
+
+    def get_load_code(self, value: str) -> str:
+        """
+        This method is responsible for getting the code that converts a saved value of the field for `from_dict`.
+        #### Parameters
+        - `value` : `str`
+            - The code of the saved value.
+        #### Returns
+        - `str` : The code of the converted value.
+        """
+        if self.table is not None:
+            code = f'Reference.load({value}, {self.table!r}, models[{self.name!r}].from_dict)'
+        elif self.model is not None:
+            code = f'models[{self.name!r}].from_dict({value})'
+        elif self.path is not None:
+            code = f'Path({value})'
+        elif self.uuid:
+            code = f'uuid.UUID({value})'
+        else:
+            return value
+        return f'{code} if {value} else None' if self.optional else code
+
+class ModelMeta(type):
+    """
+    The metaclass of the models. From the `fields` declared by a model it makes the class slotted, so instances have
+    no `__dict__`, and generates the code of its `__init__`, `to_dict` and `from_dict` once, when the class is created.
+    Methods the class defines itself are kept, and extra attributes can be declared in its own `__slots__`.
+    """
+    def __new__(metaclass, name: str, bases: tuple, namespace: dict):
+        fields: list[Field] = namespace.get('fields', [])
+        namespace['__slots__'] = tuple(field.name for field in fields) + tuple(namespace.get('__slots__', ()))
+        cls = super().__new__(metaclass, name, bases, namespace)
+        if not fields:
+            return cls
+
+        scope = {
+            'cls': cls,
+            'Path': Path,
+            'uuid': uuid,
+            'Reference': Reference,
+            'models': {field.name: field.model for field in fields},
+            'defaults': {field.name: field.default for field in fields},
+            'missing': {field.name: field.missing for field in fields},
+        }
+        if '__init__' not in namespace:
+            ModelMeta._define(cls, '__init__', ModelMeta._get_init_code(fields), scope)
+        if 'to_dict' not in namespace:
+            ModelMeta._define(cls, 'to_dict', ModelMeta._get_to_dict_code(fields), scope)
+        if 'from_dict' not in namespace:
+            ModelMeta._define(cls, 'from_dict', ModelMeta._get_from_dict_code(fields), scope, static=True)
+        return cls
+
+    @staticmethod
+    def _define(cls: type, name: str, code: str, scope: dict, static: bool = False) -> None:
+        exec(code, scope)
+        function = scope.pop(name)
+        function.__qualname__ = f'{cls.__qualname__}.{name}'
+        function.__module__ = cls.__module__
+        setattr(cls, name, staticmethod(function) if static else function)
+
+    @staticmethod
+    def _get_init_code(fields: list[Field]) -> str:
+        parameters = [
+            field.name if field.default is Field.no_default else f'{field.name}=defaults[{field.name!r}]'
+            for field in fields
+        ]
+        lines = [f'def __init__(self, {", ".join(parameters)}):']
+        lines += [f'    self.{field.name} = {field.name}' for field in fields]
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _get_to_dict_code(fields: list[Field]) -> str:
+        lines = ['def to_dict(self):', '    """', '    This method is responsible for converting the object to a dictionary.', '    """', '    return {']
+        for field in fields:
+            if not field.save:
+                continue
+            if field.many:
+                value = f'[{field.get_dump_code("value")} for value in self.{field.name}]'
+            else:
+                value = field.get_dump_code(f'self.{field.name}')
+            lines.append(f'        {field.name!r}: {value},')
+        lines.append('    }')
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _get_from_dict_code(fields: list[Field]) -> str:
+        lines = ['def from_dict(data):', '    """', '    This method is responsible for creating the object from a dictionary.', '    """']
+        arguments = []
+        for field in fields:
+            saved = f'data[{field.name!r}]'
+            if field.missing is not None:
+                lines.append(f'    {field.name} = {saved} if {field.name!r} in data else missing[{field.name!r}]()')
+                saved = field.name
+            if field.many:
+                arguments.append(f'[{field.get_load_code("value")} for value in {saved}]')
+            else:
+                arguments.append(field.get_load_code(saved))
+        lines.append(f'    return cls({", ".join(arguments)})')
+        return '\n'.join(lines)
+
+class Model(metaclass=ModelMeta):
+    """
+    The base of the models, see `ModelMeta`.
+    #### Attributes
+    - `fields` : `list[Field]`
+        - The fields of the model, in the order of the `__init__` parameters and of the saved dictionary.
+    """
+    fields: list[Field] = []
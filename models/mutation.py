@@ -1,7 +1,7 @@
 from models import DisplayName, MutationTier
-from pathlib import Path
+from .model import Model, Field
 
-class Mutation:
+class Mutation(Model):
     """
     Represents a mutation(perk) in the game.
     #### Parameters
@@ -20,49 +20,15 @@ class Mutation:
     - `unknown_fields`: `dict`
         - The unknown fields of the mutation.
     """
-    def __init__(self, key_name: str, display_name: DisplayName, description: DisplayName, icon_path: Path, stat: str, tiers: list[MutationTier], unknown_fields: dict):
-        self.key_name = key_name
-        self.display_name = display_name
-        self.description = description
-        self.icon_path = icon_path
-        self.stat = stat
-        self.tiers = tiers
-        self.unknown_fields = unknown_fields
-
-    def to_dict(self) -> dict:
-        """
-        This method is responsible for converting the object to a dictionary.
-        #### Returns
-        - `dict` : The dictionary representation of the object.
-        """
-        return {
-            'key_name': self.key_name,
-            'display_name': self.display_name.to_dict(),
-            'description': self.description.to_dict(),
-            'icon_path': str(self.icon_path),
-            'stat': self.stat,
-            'tiers': [tier.to_dict() for tier in self.tiers]
-        }
-    
-    @staticmethod
-    def from_dict(data: dict) -> 'Mutation':
-        """
-        This method is responsible for creating a Mutation from a dictionary.
-        #### Parameters
-        - `data` : `dict`
-            - The dictionary data.
-        #### Returns
-        - `Mutation` : The created Mutation.
-        """
-        return Mutation(
-            data['key_name'],
-            DisplayName.from_dict(data['display_name']),
-            DisplayName.from_dict(data['description']),
-            Path(data['icon_path']),
-            data['stat'],
-            [MutationTier.from_dict(tier) for tier in data['tiers']],
-            data['unknown_fields']
-        )
+    fields = [
+        Field('key_name'),
+        Field('display_name', DisplayName),
+        Field('description', DisplayName),
+        Field('icon_path', path='str'),
+        Field('stat'),
+        Field('tiers', MutationTier, many=True),
+        Field('unknown_fields', save=False, missing=dict)
+    ]
 
     @staticmethod
     def get_unknown_fields() -> list[str]:
@@ -1,8 +1,7 @@
-from typing import TYPE_CHECKING
-if TYPE_CHECKING:
-    from .display_name import DisplayName
+from .display_name import DisplayName
+from .model import Model, Field
 
-class PetPersonality:
+class PetPersonality(Model):
     """
     Represents a pet personality in the game.
     #### Parameters
@@ -13,19 +12,8 @@ class PetPersonality:
     - `unknown_fields` : `dict`
         - The unknown fields of the pet personality.
     """
-    def __init__(self, key_name: str, name: 'DisplayName', unknown_fields: dict):
-        self.key_name = key_name
-        self.name = name
-        self.unknown_fields = unknown_fields
-
-    def to_dict(self) -> dict:
-        """
-        Converts the pet personality to a dictionary.
-        #### Returns
-        - `dict` : The converted pet personality.
-        """
-        return {
-            'key_name': self.key_name,
-            'name': self.name.to_dict(),
-            'unknown_fields': self.unknown_fields
-        }
\ No newline at end of file
+    fields = [
+        Field('key_name'),
+        Field('name', DisplayName),
+        Field('unknown_fields')
+    ]
\ No newline at end of file
@@ -1,4 +1,6 @@
-class PlacementData:
+from .model import Model, Field
+
+class PlacementData(Model):
     """
     Represents the placement data of a placeable static mesh.
     #### Parameters
@@ -11,19 +13,12 @@ class PlacementData:
     - `unknown_fields` : `dict`
         - The unknown fields of the placement object.
     """
-    def __init__(self, subcategory_tag: str, max_slope: float, scale: float, unknown_fields: dict):
-        self.subcategory_tag = subcategory_tag
-        self.max_slope = max_slope
-        self.scale = scale
-        self.unknown_fields = unknown_fields
-
-    def to_dict(self) -> dict:
-        return {
-            'subcategory_tag': self.subcategory_tag,
-            'max_slope': self.max_slope,
-            'scale': self.scale,
-            'unknown_fields': self.unknown_fields
-        }
+    fields = [
+        Field('subcategory_tag'),
+        Field('max_slope'),
+        Field('scale'),
+        Field('unknown_fields')
+    ]
 
     @staticmethod
     def get_unknown_fields() -> dict:
@@ -86,7 +86,10 @@
     #     ]
     #   },
 
-class PlayerUpgrade:
+from .display_name import DisplayName
+from .model import Model, Field
+
+class PlayerUpgrade(Model):
     """
     Represents a player upgrade in the game.
     #### Parameters
@@ -101,23 +104,10 @@ class PlayerUpgrade:
     - ``unknown_fields`` : `dict`
         - The unknown fields of the player upgrade.
     """
-    def __init__(self, name: str, key_name: str, icon_asset_path: str, base_cost: int, unknown_fields: dict):
-        self.name = name
-        self.key_name = key_name
-        self.icon_asset_path = icon_asset_path
-        self.base_cost = base_cost
-        self.unknown_fields = unknown_fields
-
-    def to_dict(self) -> dict:
-        """
-        Converts the player upgrade to a dictionary.
-        #### Returns
-        - `dict` : The converted player upgrade.
-        """
-        return {
-            'name': self.name.to_dict(),
-            'key_name': self.key_name,
-            'icon_asset_path': self.icon_asset_path,
-            'base_cost': self.base_cost,
-            'unknown_fields': self.unknown_fields
-        }
\ No newline at end of file
+    fields = [
+        Field('name', DisplayName),
+        Field('key_name'),
+        Field('icon_asset_path'),
+        Field('base_cost'),
+        Field('unknown_fields')
+    ]
\ No newline at end of file
@@ -1,9 +1,12 @@
 from models.display_name import DisplayName
+from models.reference import Reference
 from pathlib import Path
+from .model import Model, Field
 
-class RecipeComponent:
+class RecipeComponent(Model):
     """
     Wrapper for a recipe component in a recipe.
+    When saved normalized only the `item_key` and `quantity` are kept, and the item fields are read from the item.
     #### Parameters
     - `item_key`: `str`
         - The key of the item.
@@ -18,13 +21,16 @@ class RecipeComponent:
     - `icon_modifier_path`: `Path`
         - The icon modifier path of the item.
     """
-    def __init__(self, item_key: str, quantity: int, display_name: DisplayName, description: DisplayName, icon_path: Path, icon_modifier_path: Path):
-        self.item_key = item_key
-        self.quantity = quantity
-        self.display_name = display_name
-        self.description = description
-        self.icon_path = icon_path
-        self.icon_modifier_path = icon_modifier_path
+    fields = [
+        Field('item_key'),
+        Field('quantity'),
+        Field('display_name', DisplayName),
+        Field('description', DisplayName),
+        Field('icon_path', path='posix'),
+        Field('icon_modifier_path', path='posix')
+    ]
+    # The referenced item of a normalized component.
+    __slots__ = ('item',)
 
     def to_dict(self) -> dict:
         """
@@ -32,6 +38,11 @@ class RecipeComponent:
         #### Returns
         - `dict` : The dictionary representation of the object.
         """
+        if Reference.normalized:
+            return {
+                'item_key': self.item_key,
+                'quantity': self.quantity
+            }
         return {
             'item_key': self.item_key,
             'quantity': self.quantity,
@@ -50,6 +61,13 @@ class RecipeComponent:
         #### Returns
         - `RecipeComponent` : The created RecipeComponent.
         """
+        if 'display_name' not in data:
+            component = RecipeComponent.__new__(RecipeComponent)
+            component.item_key = data['item_key']
+            component.quantity = data['quantity']
+            component.item = Reference('items', data['item_key'])
+            return component
+
         return RecipeComponent(
             data['item_key'],
             data['quantity'],
@@ -57,4 +75,20 @@ class RecipeComponent:
             DisplayName.from_dict(data['description']),
             Path(data['icon_path']),
             Path(data['icon_modifier_path'])
-        )
\ No newline at end of file
+        )
+
+    # The item fields of a normalized component, read from the referenced item on the first access.
+    item_fields = {
+        'display_name': 'name',
+        'description': 'description',
+        'icon_path': 'icon_path',
+        'icon_modifier_path': 'icon_modifier_path'
+    }
+
+    def __getattr__(self, name: str):
+        # Without an `item` (not normalized) the lookup of `self.item` raises the `AttributeError` too.
+        if name not in RecipeComponent.item_fields:
+            raise AttributeError(name)
+        value = getattr(self.item, RecipeComponent.item_fields[name])
+        setattr(self, name, value)
+        return value
\ No newline at end of file
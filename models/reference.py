@@ -0,0 +1,101 @@
+from typing import Any, Callable
+
+class Reference:
+    """
+    A lazy reference to an entity saved in the output of another crawler (e.g.: an item of `items`).
+    Attribute lookups are forwarded to the referenced entity, which is only resolved on the first access.
+    #### Parameters
+    - `table` : `str`
+        - The name of the crawler that owns the entity.
+    - `key_name` : `str`
+        - The key name of the entity.
+    #### Attributes
+    - `normalized` : `bool`
+        - Whether nested entities are saved as references instead of full copies.
+    - `resolver` : `Callable[[str, str], Any]`
+        - The function that gets an entity by crawler name and key name.
+    """
+    normalized: bool = False
+    resolver: Callable[[str, str], Any] = None
+
+    def __init__(self, table: str, key_name: str):
+        self.table = table
+        self.key_name = key_name
+        self.target = None
+
+    def resolve(self) -> Any:
+        """
+        This method is responsible for getting the referenced entity.
+        #### Returns
+        - `Any` : The referenced entity.
+        #### Raises
+        - `Exception` : If there is no resolver.
+        """
+        if self.target is None:
+            if Reference.resolver is None:
+                raise Exception(f'There is no resolver for the reference: {self.table}/{self.key_name}')
+            self.target = Reference.resolver(self.table, self.key_name)
+        return self.target
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for the attributes the reference itself doesn't have. Dunder lookups (e.g.: from pickle)
+        # must not resolve the reference.
+        if name.startswith('__') or name in ('table', 'key_name', 'target'):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def to_dict(self) -> dict:
+        """
+        This method is responsible for converting the referenced entity to a dictionary.
+        #### Returns
+        - `dict` : The reference when saving normalized, otherwise the converted entity.
+        """
+        return Reference.dump(self, self.table)
+
+    @staticmethod
+    def dump(entity: Any, table: str) -> dict:
+        """
+        This method is responsible for converting a nested entity to a dictionary.
+        #### Parameters
+        - `entity` : `Any`
+            - The entity, or a reference to it.
+        - `table` : `str`
+            - The name of the crawler that owns the entity.
+        #### Returns
+        - `dict` : A `{'$ref', 'key_name'}` dictionary when saving normalized, otherwise the converted entity.
+        """
+        if Reference.normalized:
+            return {'$ref': table, 'key_name': entity.key_name}
+        if isinstance(entity, Reference):
+            return entity.resolve().to_dict()
+        return entity.to_dict()
+
+    @staticmethod
+    def load(data: dict, table: str, from_dict: Callable[[dict], Any]) -> Any:
+        """
+        This method is responsible for creating a nested entity from a dictionary, in either output format.
+        #### Parameters
+        - `data` : `dict`
+            - The converted entity, or a reference to it.
+        - `table` : `str`
+            - The name of the crawler that owns the entity.
+        - `from_dict` : `Callable[[dict], Any]`
+            - The function that creates the entity from a full copy.
+        #### Returns
+        - `Any` : The created entity, or a lazy `Reference` to it.
+        """
+        if Reference.is_reference(data):
+            return Reference(table, data['key_name'])
+        return from_dict(data)
+
+    @staticmethod
+    def is_reference(data: dict) -> bool:
+        """
+        This method is responsible for checking if a dictionary is a saved reference.
+        #### Parameters
+        - `data` : `dict`
+            - The dictionary to check.
+        #### Returns
+        - `bool` : Whether the dictionary is a reference.
+        """
+        return '$ref' in data
@@ -1,7 +1,7 @@
 from .display_name import DisplayName
-from pathlib import Path
+from .model import Model, Field
 
-class StatusEffect:
+class StatusEffect(Model):
     """
     Represents a status effect in the game.
     #### Parameters
@@ -34,73 +34,22 @@ class StatusEffect:
     - `unknown_fields`: `dict`
         - The unknown fields of the status effect.
     """
-    def __init__(self, key_name: str, display_name: DisplayName, description: DisplayName, icon_path: Path, 
-                 effect_type: str, value: float, duration_type: str, duration: float, interval: float, 
-                 max_stack: int, is_negative_effect: bool, show_in_ui: bool, effect_tags: list[str], unknown_fields: dict):
-        self.key_name = key_name
-        self.display_name = display_name
-        self.description = description
-        self.icon_path = icon_path
-        self.effect_type = effect_type
-        self.value = value
-        self.duration_type = duration_type
-        self.duration = duration
-        self.interval = interval
-        self.max_stack = max_stack
-        self.is_negative_effect = is_negative_effect
-        self.show_in_ui = show_in_ui
-        self.effect_tags = effect_tags
-        self.unknown_fields = unknown_fields
-
-    def to_dict(self) -> dict:
-        """
-        This method is responsible for converting the object to a dictionary.
-        #### Returns
-        - `dict` : The dictionary representation of the object.
-        """
-        return {
-            'key_name': self.key_name,
-            'display_name': self.display_name.to_dict(),
-            'description': self.description.to_dict(),
-            'icon_path': str(self.icon_path),
-            'effect_type': self.effect_type,
-            'value': self.value,
-            'duration_type': self.duration_type,
-            'duration': self.duration,
-            'interval': self.interval,
-            'max_stack': self.max_stack,
-            'is_negative_effect': self.is_negative_effect,
-            'show_in_ui': self.show_in_ui,
-            'effect_tags': self.effect_tags,
-            'unknown_fields': self.unknown_fields
-        }
-    
-    @staticmethod
-    def from_dict(data: dict) -> 'StatusEffect':
-        """
-        This method is responsible for creating a StatusEffect from a dictionary.
-        #### Parameters
-        - `data` : `dict`
-            - The dictionary data.
-        #### Returns
-        - `StatusEffect` : The created StatusEffect.
-        """
-        return StatusEffect(
-            data['key_name'],
-            DisplayName.from_dict(data['display_name']),
-            DisplayName.from_dict(data['description']),
-            Path(data['icon_path']),
-            data['effect_type'],
-            data['value'],
-            data['duration_type'],
-            data['duration'],
-            data['interval'],
-            data['max_stack'],
-            data['is_negative_effect'],
-            data['show_in_ui'],
-            data['effect_tags'],
-            data['unknown_fields']
-        )
+    fields = [
+        Field('key_name'),
+        Field('display_name', DisplayName),
+        Field('description', DisplayName),
+        Field('icon_path', path='str'),
+        Field('effect_type'),
+        Field('value'),
+        Field('duration_type'),
+        Field('duration'),
+        Field('interval'),
+        Field('max_stack'),
+        Field('is_negative_effect'),
+        Field('show_in_ui'),
+        Field('effect_tags'),
+        Field('unknown_fields')
+    ]
 
     @staticmethod
     def get_unknown_fields() -> list[str]:
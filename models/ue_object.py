@@ -1,4 +1,6 @@
-class UEObject:
+from .model import Model, Field
+
+class UEObject(Model):
     """
     This class represents an Unreal Engine object.
     #### Parameters
@@ -7,28 +9,7 @@ class UEObject:
     - `path`: `str`
         - The path to the object.
     """
-    def __init__(self, name: str, path: str):
-        self.name = name
-        self.path = path
-
-    def to_dict(self) -> dict:
-        """
-        This method is responsible for converting the Unreal Engine object to a dictionary.
-        #### Returns
-        - `dict` : The converted Unreal Engine object.
-        """
-        return {
-            'name': self.name,
-            'path': self.path
-        }
-    
-    def from_dict(data: dict) -> 'UEObject':
-        """
-        This method is responsible for converting the dictionary to a UEObject object.
-        #### Parameters
-        - `data` : `dict`
-            - The dictionary to convert.
-        #### Returns
-        - `UEObject` : The converted UEObject object.
-        """
-        return UEObject(data['name'], data['path'])
\ No newline at end of file
+    fields = [
+        Field('name'),
+        Field('path')
+    ]
\ No newline at end of file
@@ -1,4 +1,6 @@
-class Weakpoint:
+from .model import Model, Field
+
+class Weakpoint(Model):
     """
     Class representing a weakpoint of a creature.
     #### Parameters
@@ -11,41 +13,13 @@ class Weakpoint:
     - `unknown_fields` : `dict`
         - The unknown fields of the weakpoint.
     """
-    def __init__(self, key_name: str, damage_multiplier: float, damage_sources: list[str], unknown_fields: dict):
-        self.key_name = key_name    
-        self.damage_multiplier = damage_multiplier
-        self.damage_sources = damage_sources
-        self.unknown_fields = unknown_fields
+    fields = [
+        Field('key_name'),
+        Field('damage_multiplier'),
+        Field('damage_sources'),
+        Field('unknown_fields')
+    ]
 
-    def to_dict(self) -> dict:
-        """
-        This method is responsible for converting the weakpoint to a dictionary.
-        #### Returns
-        - `dict` : The converted weakpoint.
-        """
-        return {
-            'key_name': self.key_name,
-            'damage_multiplier': self.damage_multiplier,
-            'damage_sources': self.damage_sources,
-            'unknown_fields': self.unknown_fields
-        }
-    
-    def from_dict(data: dict) -> 'Weakpoint':
-        """
-        This method is responsible for converting a dictionary to an weakpoint.
-        #### Parameters
-        - `data` : `dict`
-            - The dictionary to convert.
-        #### Returns
-        - `ItemSet` : The converted weakpoint.
-        """
-        return Weakpoint(
-            key_name=data['key_name'],
-            damage_multiplier=data['damage_multiplier'],
-            damage_sources=data['damage_sources'],
-            unknown_fields=data['unknown_fields']
-        )
-    
     @staticmethod
     def get_unknown_fields() -> list[str]:
         """
@@ -0,0 +1,236 @@
+import json
+import mmap
+import os
+import struct
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Iterator
+
+class RowStore(Mapping):
+    """
+    Read-only view of a `.rows` file, the offset-indexed form of the saved output of a crawler that is written next to
+    its JSON (e.g.: `data/crawled/1.4.4.4634/items.rows`). The file is memory-mapped and only the key directory is read
+    when it is opened: every row is decoded from its own slice of the map when it is looked up.
+    The file starts with a header (`header_format`: the magic, the format version, the number of rows and the offset
+    and length of the directory), followed by the rows as compact UTF-8 JSON, in the crawled order, and ends with the
+    directory, a JSON list of the `[key_name, offset, length]` of every row.
+    #### Parameters
+    - `path` : `Path`
+        - The path to the `.rows` file.
+    #### Raises
+    - `ValueError` : If the file is not a `.rows` file of this format version.
+    """
+    magic: bytes = b'GRDNROWS'
+    format_version: int = 1
+    header_format: str = '<8sIIQQ'
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.file = open(self.path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_size = struct.calcsize(RowStore.header_format)
+        magic, format_version, count, directory_offset, directory_length = struct.unpack(RowStore.header_format, self.map[:header_size])
+        if magic != RowStore.magic or format_version != RowStore.format_version:
+            self.close()
+            raise ValueError(f'{self.path} is not a rows file of version {RowStore.format_version}')
+
+        self.directory: dict[str, tuple[int, int]] = {
+            key: (offset, length) for key, offset, length in json.loads(self.map[directory_offset:directory_offset + directory_length])
+        }
+        if len(self.directory) != count:
+            self.close()
+            raise ValueError(f'The directory of {self.path} has {len(self.directory)} rows instead of {count}')
+
+    @staticmethod
+    def export(data_path: Path, store_path: Path = None) -> Path:
+        """
+        This method is responsible for writing the `.rows` file of an existing output of a crawler.
+        #### Parameters
+        - `data_path` : `Path`
+            - The path to the saved output of the crawler (e.g.: `data/crawled/1.4.4.4634/items.json`).
+        - `store_path` : `Path`
+            - The path to the `.rows` file. Defaults to the output path with the `.rows` suffix.
+        #### Returns
+        - `Path` : The path to the written file.
+        """
+        data_path = Path(data_path)
+        store_path = Path(store_path) if store_path else data_path.with_suffix('.rows')
+        with RowStoreWriter(store_path) as writer:
+            for key, value in json.loads(data_path.read_text(encoding='utf-8')).items():
+                writer.write(key, value)
+        return store_path
+
+    def get_row(self, key: str) -> dict[str, Any]:
+        """
+        This method is responsible for decoding the saved dictionary of a row.
+        #### Parameters
+        - `key` : `str`
+            - The key name of the row.
+        #### Returns
+        - `dict` : The row, or `None` if it does not exist.
+        """
+        entry = self.directory.get(key)
+        if entry is None:
+            return None
+        offset, length = entry
+        return json.loads(self.map[offset:offset + length])
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        row = self.get_row(key)
+        if row is None:
+            raise KeyError(key)
+        return row
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.directory
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.directory)
+
+    def __len__(self) -> int:
+        return len(self.directory)
+
+    def close(self) -> None:
+        """
+        This method is responsible for unmapping and closing the file. On Windows, the file can't be replaced while it
+        is open.
+        """
+        self.map.close()
+        self.file.close()
+
+    def __reduce__(self) -> tuple:
+        # Pickled as its path, so the worker processes map the file themselves instead of receiving its rows.
+        return RowStore, (self.path,)
+
+    def __enter__(self) -> 'RowStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+class RowStoreWriter:
+    """
+    Writes a `.rows` file one row at a time, like the `JsonWriter` of the crawlers writes the JSON output. Only the key
+    directory is kept in memory, and the rows are written to a temporary file that replaces the target when the writer
+    is closed without errors.
+    #### Parameters
+    - `path` : `Path`
+        - The path to the `.rows` file.
+    """
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.temp_path = self.path.with_name(f'{self.path.name}.tmp')
+        self.file = None
+        self.directory: list[tuple[str, int, int]] = []
+
+    def __enter__(self) -> 'RowStoreWriter':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def open(self) -> None:
+        """
+        This method is responsible for opening the temporary file and reserving the header.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.temp_path, 'wb')
+        self.file.write(b'\0' * struct.calcsize(RowStore.header_format))
+        self.directory = []
+
+    def write(self, key: str, value: Any) -> None:
+        """
+        This method is responsible for writing a row.
+        #### Parameters
+        - `key` : `str`
+            - The key name of the row.
+        - `value` : `Any`
+            - The JSON serializable row.
+        """
+        blob = json.dumps(value, separators=(',', ':')).encode('utf-8')
+        self.directory.append((key, self.file.tell(), len(blob)))
+        self.file.write(blob)
+
+    def close(self) -> None:
+        """
+        This method is responsible for writing the directory and the header and moving the temporary file to the path.
+        """
+        directory = json.dumps(self.directory, separators=(',', ':')).encode('utf-8')
+        directory_offset = self.file.tell()
+        self.file.write(directory)
+        self.file.seek(0)
+        self.file.write(struct.pack(RowStore.header_format, RowStore.magic, RowStore.format_version, len(self.directory), directory_offset, len(directory)))
+        self.file.close()
+        os.replace(self.temp_path, self.path)
+
+    def abort(self) -> None:
+        """
+        This method is responsible for dropping the temporary file, leaving the previous file untouched.
+        """
+        self.file.close()
+        os.remove(self.temp_path)
+
+class LazyRows(Mapping):
+    """
+    The rows of a `RowStore` as models, each one built on its first lookup and kept afterwards, up to `max_models`
+    models: then the least recently used ones are dropped and built again on their next lookup. Iterating the values
+    builds every model, like the fully loaded data.
+    #### Parameters
+    - `store` : `RowStore`
+        - The rows.
+    - `model` : `type`
+        - The model class of the rows, built with `from_dict`.
+    - `max_models` : `int`
+        - The number of built models that are kept. `None` keeps all of them.
+    """
+    def __init__(self, store: RowStore, model: type, max_models: int = None):
+        self.store = store
+        self.model = model
+        self.max_models = max_models
+        self.models: OrderedDict[str, Any] = OrderedDict()
+
+    def __getitem__(self, key: str) -> Any:
+        model = self.models.get(key)
+        if model is None:
+            model = self.model.from_dict(self.store[key])
+            self.models[key] = model
+            self._evict()
+        else:
+            self.models.move_to_end(key)
+        return model
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.store
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __reduce__(self) -> tuple:
+        # The built models are left out, the worker processes build the ones they look up.
+        return LazyRows, (self.store, self.model, self.max_models)
+
+    def set_max_models(self, max_models: int) -> None:
+        """
+        This method is responsible for changing the number of built models that are kept.
+        #### Parameters
+        - `max_models` : `int`
+            - The number of built models that are kept. `None` keeps all of them.
+        """
+        self.max_models = max_models
+        self._evict()
+
+    def _evict(self) -> None:
+        if self.max_models is None:
+            return
+        while len(self.models) > self.max_models:
+            self.models.popitem(last=False)
@@ -0,0 +1,277 @@
+import json
+import sqlite3
+
+from pathlib import Path
+from typing import Any
+
+from global_database import GlobalDatabase
+
+class SQLiteDatabase:
+    """
+    This class is responsible for storing the output of every crawler of a game version in a single SQLite file.
+    Each crawler gets a table with a column per top-level field of its rows: scalars are stored as they are and
+    nested data as JSON. The fields a row doesn't have are stored as `NULL` and listed in its `_missing` column, so
+    the row is read back without them. The tags and the string ids of the display names are indexed in the
+    `<crawler>_tags` and `<crawler>_strings` tables.
+    #### Parameters
+    - `db_path` : `Path`
+        - The path to the SQLite file.
+    """
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS _columns (table_name TEXT, position INTEGER, name TEXT, kind TEXT, PRIMARY KEY (table_name, position))')
+        self.columns: dict[str, list[tuple[str, str]]] = {}
+        self.cache: dict[tuple[str, str], Any] = {}
+
+    @staticmethod
+    def export(crawled_data_path: Path, db_path: Path = None) -> 'SQLiteDatabase':
+        """
+        This method is responsible for exporting the saved output of every crawler of a game version.
+        #### Parameters
+        - `crawled_data_path` : `Path`
+            - The directory with the saved output of the crawlers (e.g.: `data/crawled/1.4.4.4634`).
+        - `db_path` : `Path`
+            - The path to the SQLite file. Defaults to `<crawled_data_path>.sqlite`.
+        #### Returns
+        - `SQLiteDatabase` : The exported database.
+        """
+        crawled_data_path = Path(crawled_data_path)
+        database = SQLiteDatabase(db_path if db_path else crawled_data_path.with_name(f'{crawled_data_path.name}.sqlite'))
+        for data_path in sorted(crawled_data_path.glob('*.json')):
+            # Only the output of the crawlers, not the indexes saved next to it (e.g.: `used_in.json`).
+            if data_path.stem not in GlobalDatabase.models:
+                continue
+            database.write_table(data_path.stem, json.loads(data_path.read_text()))
+        return database
+
+    def write_table(self, crawler_name: str, rows: dict[str, Any]) -> None:
+        """
+        This method is responsible for writing the output of a crawler, replacing its previous table.
+        #### Parameters
+        - `crawler_name` : `str`
+            - The name of the crawler.
+        - `rows` : `dict`
+            - The crawled rows by key name, either as models or as their dictionaries.
+        """
+        rows = {key: value if isinstance(value, dict) else value.to_dict() for key, value in rows.items()}
+        columns = SQLiteDatabase._get_columns(rows)
+        table = SQLiteDatabase._quote(crawler_name)
+        tags_table = SQLiteDatabase._quote(f'{crawler_name}_tags')
+        strings_table = SQLiteDatabase._quote(f'{crawler_name}_strings')
+
+        with self.connection:
+            for name in (table, tags_table, strings_table):
+                self.connection.execute(f'DROP TABLE IF EXISTS {name}')
+            self.connection.execute('DELETE FROM _columns WHERE table_name = ?', (crawler_name,))
+
+            column_list = ', '.join(SQLiteDatabase._quote(name) for name, _ in columns)
+            self.connection.execute(f'CREATE TABLE {table} (_key_name TEXT PRIMARY KEY, _missing TEXT{", " if columns else ""}{column_list})')
+            self.connection.execute(f'CREATE TABLE {tags_table} (_key_name TEXT, field TEXT, tag TEXT)')
+            self.connection.execute(f'CREATE TABLE {strings_table} (_key_name TEXT, field TEXT, table_id INTEGER, string_id INTEGER, text TEXT)')
+            self.connection.executemany('INSERT INTO _columns VALUES (?, ?, ?, ?)', [(crawler_name, position, name, kind) for position, (name, kind) in enumerate(columns)])
+
+            placeholders = ', '.join('?' * (len(columns) + 2))
+            self.connection.executemany(f'INSERT INTO {table} VALUES ({placeholders})', (
+                (
+                    key,
+                    SQLiteDatabase._get_missing(value, columns),
+                    *(SQLiteDatabase._encode(value[name], kind) if name in value else None for name, kind in columns)
+                ) for key, value in rows.items()
+            ))
+            self.connection.executemany(f'INSERT INTO {tags_table} VALUES (?, ?, ?)', (
+                (key, field, tag) for key, value in rows.items() for field, tag in SQLiteDatabase._get_tags(value)
+            ))
+            self.connection.executemany(f'INSERT INTO {strings_table} VALUES (?, ?, ?, ?, ?)', (
+                (key, field, string['table_id'], string['string_id'], string.get('text')) for key, value in rows.items() for field, string in SQLiteDatabase._get_strings(value)
+            ))
+
+            if any(name == 'tier' for name, _ in columns):
+                self.connection.execute(f'CREATE INDEX {SQLiteDatabase._quote(f"{crawler_name}_tier")} ON {table} (tier)')
+            self.connection.execute(f'CREATE INDEX {SQLiteDatabase._quote(f"{crawler_name}_tags_tag")} ON {tags_table} (tag)')
+            self.connection.execute(f'CREATE INDEX {SQLiteDatabase._quote(f"{crawler_name}_strings_id")} ON {strings_table} (table_id, string_id)')
+
+        self.columns.pop(crawler_name, None)
+        self.cache = {cache_key: value for cache_key, value in self.cache.items() if cache_key[0] != crawler_name}
+
+    def has_table(self, crawler_name: str) -> bool:
+        """
+        This method is responsible for checking if the output of a crawler was exported.
+        #### Parameters
+        - `crawler_name` : `str`
+            - The name of the crawler.
+        #### Returns
+        - `bool` : Whether the crawler has a table.
+        """
+        query = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+        return self.connection.execute(query, (crawler_name,)).fetchone() is not None
+
+    def get_row(self, crawler_name: str, key: str) -> dict[str, Any]:
+        """
+        This method is responsible for getting the saved dictionary of a row.
+        #### Parameters
+        - `crawler_name` : `str`
+            - The name of the crawler.
+        - `key` : `str`
+            - The key name of the row.
+        #### Returns
+        - `dict` : The row with the fields it was saved with, or `None` if it does not exist.
+        """
+        columns = self._get_table_columns(crawler_name)
+        row = self.connection.execute(f'SELECT * FROM {SQLiteDatabase._quote(crawler_name)} WHERE _key_name = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        missing = set(json.loads(row[1])) if row[1] is not None else ()
+        return {
+            name: SQLiteDatabase._decode(value, kind)
+            for (name, kind), value in zip(columns, row[2:]) if name not in missing
+        }
+
+    def get(self, crawler_name: str, key: str) -> Any:
+        """
+        This method is responsible for getting a row as a model, creating it only once.
+        #### Parameters
+        - `crawler_name` : `str`
+            - The name of the crawler.
+        - `key` : `str`
+            - The key name of the row.
+        #### Returns
+        - `Any` : The model of the row.
+        #### Raises
+        - `Exception` : If the row does not exist.
+        """
+        if (crawler_name, key) not in self.cache:
+            row = self.get_row(crawler_name, key)
+            if row is None:
+                raise Exception(f'The key: {key} does not exist in the data for the crawler: {crawler_name}')
+            self.cache[(crawler_name, key)] = GlobalDatabase.models[crawler_name].from_dict(row)
+        return self.cache[(crawler_name, key)]
+
+    def get_keys(self, crawler_name: str, tag: str = None, tier: int = None, table_id: int = None, string_id: int = None) -> list[str]:
+        """
+        This method is responsible for finding the rows of a crawler through the indexed columns.
+        #### Parameters
+        - `crawler_name` : `str`
+            - The name of the crawler.
+        - `tag` : `str`
+            - A tag the row must have in any of its tag fields.
+        - `tier` : `int`
+            - The tier of the row.
+        - `table_id` : `int`
+            - The string table of a display name of the row.
+        - `string_id` : `int`
+            - The string id of a display name of the row.
+        #### Returns
+        - `list[str]` : The key names of the matching rows, in the crawled order.
+        """
+        conditions = []
+        parameters = []
+        if tag is not None:
+            conditions.append(f'_key_name IN (SELECT _key_name FROM {SQLiteDatabase._quote(f"{crawler_name}_tags")} WHERE tag = ?)')
+            parameters.append(tag)
+        if tier is not None:
+            conditions.append('tier = ?')
+            parameters.append(tier)
+        if table_id is not None or string_id is not None:
+            string_conditions = []
+            if table_id is not None:
+                string_conditions.append('table_id = ?')
+                parameters.append(table_id)
+            if string_id is not None:
+                string_conditions.append('string_id = ?')
+                parameters.append(string_id)
+            conditions.append(f'_key_name IN (SELECT _key_name FROM {SQLiteDatabase._quote(f"{crawler_name}_strings")} WHERE {" AND ".join(string_conditions)})')
+
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        query = f'SELECT _key_name FROM {SQLiteDatabase._quote(crawler_name)}{where} ORDER BY rowid'
+        return [row[0] for row in self.connection.execute(query, parameters)]
+
+    def close(self) -> None:
+        """
+        This method is responsible for closing the SQLite file.
+        """
+        self.connection.close()
+
+    def _get_table_columns(self, crawler_name: str) -> list[tuple[str, str]]:
+        if crawler_name not in self.columns:
+            self.columns[crawler_name] = [tuple(row) for row in self.connection.execute(
+                'SELECT name, kind FROM _columns WHERE table_name = ? ORDER BY position', (crawler_name,)
+            )]
+        return self.columns[crawler_name]
+
+    @staticmethod
+    def _get_columns(rows: dict[str, dict[str, Any]]) -> list[tuple[str, str]]:
+        """
+        This method is responsible for getting the columns of a table from its rows.
+        #### Parameters
+        - `rows` : `dict`
+            - The rows of the table.
+        #### Returns
+        - `list[tuple[str, str]]` : The name and kind of each column, in the order the fields first appear. The kind is
+          `json` for nested data and for fields that mix booleans with other values, `bool` for booleans and `value`
+          for the other scalars.
+        """
+        kinds: dict[str, set[str]] = {}
+        for value in rows.values():
+            for name, field in value.items():
+                field_kinds = kinds.setdefault(name, set())
+                if isinstance(field, (dict, list)):
+                    field_kinds.add('json')
+                elif isinstance(field, bool):
+                    field_kinds.add('bool')
+                elif field is not None:
+                    field_kinds.add('value')
+
+        columns = []
+        for name, field_kinds in kinds.items():
+            if 'json' in field_kinds or len(field_kinds) > 1:
+                columns.append((name, 'json'))
+            else:
+                columns.append((name, field_kinds.pop() if field_kinds else 'value'))
+        return columns
+
+    @staticmethod
+    def _get_missing(value: dict[str, Any], columns: list[tuple[str, str]]) -> str:
+        # `NULL` for the rows that have every field, which are most of them.
+        missing = [name for name, _ in columns if name not in value]
+        return json.dumps(missing) if missing else None
+
+    @staticmethod
+    def _get_tags(value: dict[str, Any]) -> list[tuple[str, str]]:
+        tags = []
+        for name, field in value.items():
+            if name not in ('tag', 'tags') and not name.endswith(('_tag', '_tags')):
+                continue
+            for tag in field if isinstance(field, list) else [field]:
+                if isinstance(tag, str) and tag not in ('', 'None'):
+                    tags.append((name, tag))
+        return tags
+
+    @staticmethod
+    def _get_strings(value: dict[str, Any]) -> list[tuple[str, dict]]:
+        strings = []
+        for name, field in value.items():
+            for string in field if isinstance(field, list) else [field]:
+                if isinstance(string, dict) and 'table_id' in string and 'string_id' in string:
+                    strings.append((name, string))
+        return strings
+
+    @staticmethod
+    def _encode(value: Any, kind: str) -> Any:
+        if kind == 'json':
+            return json.dumps(value)
+        if kind == 'bool' and value is not None:
+            return int(value)
+        return value
+
+    @staticmethod
+    def _decode(value: Any, kind: str) -> Any:
+        if kind == 'json':
+            return json.loads(value) if value is not None else None
+        if kind == 'bool' and value is not None:
+            return bool(value)
+        return value
+
+    @staticmethod
+    def _quote(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
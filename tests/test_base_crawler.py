@@ -0,0 +1,33 @@
+import unittest
+
+from crawler import BaseCrawler
+
+class UnknownFieldsTest(unittest.TestCase):
+    """
+    Extracts unknown fields with the compiled extractors of `BaseCrawler._compile_unknown_fields`.
+    """
+    def extract(self, fields: list, value):
+        return BaseCrawler._compile_unknown_fields(fields)(value)
+
+    def test_keys_and_paths(self):
+        value = {'A': 1, 'B': {'C': 2, 'D': 3, 'E': {'F': 4, 'G': 5}}, 'H': 6}
+        self.assertEqual(self.extract(['A', 'B>D', 'B>E>F', 'B>E>G'], value), {'A': 1, 'B': {'D': 3, 'E': {'F': 4, 'G': 5}}})
+
+    def test_indexes_into_lists(self):
+        self.assertEqual(self.extract([0, 2], ['a', 'b', 'c']), {0: 'a', 2: 'c'})
+        value = {'Tiers': [{'Value': 1, 'Other': 2}, {'Value': 3}]}
+        self.assertEqual(self.extract(['Tiers>0>Value', 'Tiers>1'], value), {'Tiers': {'0': {'Value': 1}, '1': {'Value': 3}}})
+
+    def test_digit_segment_is_a_key_of_a_dictionary(self):
+        self.assertEqual(self.extract(['Tiers>0>Value'], {'Tiers': {'0': {'Value': 1}}}), {'Tiers': {'0': {'Value': 1}}})
+
+    def test_missing_fields_fail(self):
+        with self.assertRaises(IndexError):
+            self.extract([0, 3], ['a', 'b'])
+        with self.assertRaises(KeyError):
+            self.extract(['A>B'], {'A': {}})
+        with self.assertRaises(TypeError):
+            self.extract(['Tiers>Value'], {'Tiers': [{'Value': 1}]})
+
+if __name__ == '__main__':
+    unittest.main()
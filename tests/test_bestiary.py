@@ -0,0 +1,65 @@
+import json
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from crawler import BaseCrawler, BestiaryCrawler
+
+class BestiaryCrawlerTest(unittest.TestCase):
+    """
+    Parses the creature info of synthetic creature blueprints, saved in a temporary dump.
+    """
+    version = '1.4.4.4634'
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.write_blueprint('Base', [
+            {'Name': 'Default__Base_C', 'Type': 'Base_C', 'Properties': {}},
+            {'Name': 'Health', 'Type': 'HealthComponent', 'Properties': {'MaxHealth': 100, 'BaseDamageReduction': 10}},
+            {'Name': 'Team', 'Type': 'TeamComponent', 'Properties': {'TeamDataTable': {'RowName': 'Bugs'}}},
+        ])
+        for name, properties in [('A', {'MaxHealth': 50}), ('B', {})]:
+            self.write_blueprint(name, [
+                {'Name': f'Default__{name}_C', 'Type': f'{name}_C', 'Properties': {}, 'Template': {'ObjectPath': '/Game/Creatures/Base.Default__Base_C'}},
+                {'Name': 'Health', 'Type': 'HealthComponent', 'Properties': properties, 'Template': {'ObjectPath': '/Game/Creatures/Base.Health'}},
+            ])
+        BaseCrawler.init(self.directory.name, BestiaryCrawlerTest.version)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_blueprint(self, name: str, exports: list[dict]) -> None:
+        path = Path(self.directory.name) / BestiaryCrawlerTest.version / 'json_data/Maine/Content/Creatures' / f'{name}.json'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(exports))
+
+    def get_creature_info(self, crawler: BestiaryCrawler, name: str):
+        return crawler.blueprints.parse('creature_info', f'/Game/Creatures/{name}.{name}', crawler._parse_creature_info)[1]
+
+    def test_creatures_sharing_a_template_do_not_modify_it(self):
+        crawler = BestiaryCrawler()
+        a, b, base = (self.get_creature_info(crawler, name) for name in ['A', 'B', 'Base'])
+        self.assertEqual((a.health, a.base_damage_reduction, a.team), (50, 10, 'Bugs'))
+        self.assertEqual((b.health, b.base_damage_reduction, b.team), (100, 10, 'Bugs'))
+        self.assertEqual(base.health, 100)
+
+    def test_creature_info_does_not_depend_on_the_crawl_order(self):
+        first, second = BestiaryCrawler(), BestiaryCrawler()
+        for name in ['A', 'B']:
+            self.get_creature_info(first, name)
+        self.assertEqual(self.get_creature_info(first, 'B').to_dict(), self.get_creature_info(second, 'B').to_dict())
+
+    def test_unknown_components_are_picked_by_type(self):
+        attack_info = {'AttackTags': ['Damage.Melee']}
+        self.write_blueprint('C', [
+            {'Name': 'Default__C_C', 'Type': 'C_C', 'Properties': {}},
+            {'Name': 'Team', 'Type': 'TeamComponent', 'Properties': {}},
+            {'Name': 'AttackInfo', 'Type': 'AttackInfoComponent', 'Properties': attack_info},
+        ])
+        self.assertEqual(self.get_creature_info(BestiaryCrawler(), 'C').unknown_fields, {'AttackInfoComponent': attack_info})
+        self.assertEqual(self.get_creature_info(BestiaryCrawler(), 'A').unknown_fields, {})
+        self.assertIsNone(self.get_creature_info(BestiaryCrawler(hide_unknown_fields=True), 'C').unknown_fields)
+
+if __name__ == '__main__':
+    unittest.main()
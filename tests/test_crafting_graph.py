@@ -0,0 +1,71 @@
+import unittest
+
+from models import CraftingRecipe, RecipeComponent
+from analysis import CraftingGraph
+
+class UncachedCraftingGraph(CraftingGraph):
+    """
+    The graph without memoization, as the reference of every expansion.
+    """
+    def _expand(self, item_key: str, quantity: int, path: set[str]):
+        self.cache.clear()
+        return super()._expand(item_key, quantity, path)
+
+class ItemStub:
+    def __init__(self, key_name: str):
+        self.key_name = key_name
+
+def build_recipe(key_name: str, item_key: str, components: dict[str, int], quantity: int = 1) -> CraftingRecipe:
+    return CraftingRecipe(
+        key_name=key_name,
+        item=ItemStub(item_key),
+        components=[
+            RecipeComponent(item_key=component_key, quantity=component_quantity, display_name=None, description=None, icon_path=None, icon_modifier_path=None)
+            for component_key, component_quantity in components.items()
+        ],
+        quantity=quantity,
+        category=None,
+        unknown_fields=None
+    )
+
+class CraftingGraphTest(unittest.TestCase):
+    """
+    Expands synthetic recipes where a cyclic subgraph (`Glue` needs `Resin`, which needs `Glue`) sits under `Bench`,
+    a parent shared by `Armor` and `Helmet`.
+    """
+    def setUp(self):
+        self.recipes = {recipe.key_name: recipe for recipe in [
+            build_recipe('R_Armor', 'Armor', {'Bench': 1, 'Fiber': 2}),
+            build_recipe('R_Helmet', 'Helmet', {'Bench': 1, 'Stem': 1}),
+            build_recipe('R_Bench', 'Bench', {'Glue': 2, 'Stem': 3}),
+            build_recipe('R_Glue', 'Glue', {'Resin': 1, 'Sap': 2}, quantity=2),
+            build_recipe('R_Resin', 'Resin', {'Glue': 1, 'Sap': 1}),
+        ]}
+
+    def assert_same_tree(self, graph: CraftingGraph, item_key: str, quantity: int = 1):
+        expected = UncachedCraftingGraph(self.recipes).expand(item_key, quantity).to_dict()
+        self.assertEqual(graph.expand(item_key, quantity).to_dict(), expected)
+
+    def test_cyclic_subtree_is_memoized_under_a_shared_parent(self):
+        graph = CraftingGraph(self.recipes)
+        armor = graph.expand('Armor')
+        self.assertIn(('Bench', 1), graph.cache)
+        self.assertIn(('Glue', 2), graph.cache)
+        self.assertIs(graph.expand('Helmet').components[0], armor.components[0])
+        self.assertEqual(graph.get_raw_materials('Helmet'), {'Glue': 1, 'Sap': 3, 'Stem': 4})
+
+    def test_memoized_trees_match_new_expansions(self):
+        graph = CraftingGraph(self.recipes)
+        for item_key in ['Armor', 'Helmet', 'Bench', 'Glue', 'Resin', 'Glue', 'Armor']:
+            with self.subTest(item_key=item_key):
+                self.assert_same_tree(graph, item_key)
+
+    def test_tree_is_not_reused_where_its_cycle_would_be_cut_elsewhere(self):
+        graph = CraftingGraph(self.recipes)
+        graph.expand('Glue')
+        # The memoized Glue has Resin in it, so starting from Resin it is expanded again and the cycle is cut at Resin.
+        self.assert_same_tree(graph, 'Resin')
+        self.assertTrue(graph.expand('Resin').components[0].components[0].cycle)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import json
+import math
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from models import Attack, AttacksInfo, Creature, CreatureInfo, DamageData, StatusEffect, ToolWeapon, Weakpoint
+from analysis import DamageTable
+
+def build(model: type, **values) -> object:
+    return model(**{field.name: None for field in model.fields} | values)
+
+def build_attack(tags: list[str], main: tuple[float, str], *secondary: tuple[float, str]) -> Attack:
+    damage_data = [build(DamageData, damage=damage, damage_type=damage_type) for damage, damage_type in [main, *secondary]]
+    return build(Attack, main_damage_data=damage_data[0], secondary_damage_data=damage_data[1:], tags=tags, status_effects=[])
+
+def build_resistance(damage_type: str, value: float) -> StatusEffect:
+    return build(StatusEffect, key_name=f'DamageResist_{damage_type.capitalize()}', value=value)
+
+class DamageTableTest(unittest.TestCase):
+    """
+    Compares the batched damage of `DamageTable` with a scalar loop over every attack, creature and location.
+    """
+    def setUp(self):
+        self.weapons = {
+            'Axe': build(ToolWeapon, key_name='Axe', melee_attacks_info=build(
+                AttacksInfo,
+                main_combo=[
+                    build_attack(['Damage.Melee.Chop'], (10.0, 'BP_FreshChoppingDamage')),
+                    build_attack(['Damage.Melee'], (20.0, 'BP_SmashingDamage'), (5.0, 'BP_SpicyDamage')),
+                    build_attack(['Damage.Mining'], (7.0, 'BP_MiningDamage')),
+                ],
+                main_scaling=[1.0, 1.5],
+                alternate_combo=[], alternate_scaling=[],
+                swimming_combo=[], swimming_scaling=[]
+            )),
+            'Sword': build(ToolWeapon, key_name='Sword', melee_attacks_info=build(
+                AttacksInfo,
+                main_combo=[build_attack(['Damage.Melee.Slash'], (12.0, 'BP_SlashingDamage'))],
+                main_scaling=[2.0],
+                alternate_combo=[], alternate_scaling=[],
+                swimming_combo=[], swimming_scaling=[]
+            )),
+            'Torch': build(ToolWeapon, key_name='Torch', melee_attacks_info=None),
+        }
+        self.creatures = {
+            'Aphid': build(Creature, key_name='Aphid', info=build(
+                CreatureInfo,
+                base_damage_reduction=25.0,
+                weakpoints=[
+                    build(Weakpoint, key_name='Head', damage_multiplier=2.0, damage_sources=['Damage.Melee']),
+                    build(Weakpoint, key_name='Belly', damage_multiplier=1.5, damage_sources=[]),
+                ],
+                status_effects=[build_resistance('fresh', 0.5), build_resistance('chopping', 1.5), build_resistance('spicy', 2.0)]
+            )),
+            'Mite': build(Creature, key_name='Mite', info=build(
+                CreatureInfo,
+                base_damage_reduction=None,
+                weakpoints=[build(Weakpoint, key_name='Back', damage_multiplier=3.0, damage_sources=['Damage.Melee.Slash'])],
+                status_effects=[build_resistance('smashing', 0.25)]
+            )),
+            'Ghost': build(Creature, key_name='Ghost', info=None),
+        }
+
+    def get_scalar_damage(self, attack: Attack, scale: float, creature: Creature, location: str) -> float:
+        damage = 0.0
+        for damage_data in [attack.main_damage_data, *attack.secondary_damage_data]:
+            value = damage_data.damage * scale
+            for damage_type in DamageTable.get_damage_types(damage_data):
+                value *= creature.get_weakness_or_resistance(damage_type)
+            damage += value
+
+        info = creature.info
+        damage *= 1.0 - (info.base_damage_reduction or 0.0) / 100.0 if info else 1.0
+        for weakpoint in info.weakpoints if info else []:
+            if weakpoint.key_name != location:
+                continue
+            sources = weakpoint.damage_sources
+            if not sources or any(tag == source or tag.startswith(f'{source}.') for tag in attack.tags for source in sources):
+                damage *= weakpoint.damage_multiplier
+        return damage
+
+    def test_per_hit_and_per_combo_match_scalar_loop(self):
+        table = DamageTable(self.weapons, self.creatures)
+        for weapon_key, weapon in self.weapons.items():
+            attacks_info = weapon.melee_attacks_info
+            attacks = attacks_info.main_combo if attacks_info else []
+            scaling = attacks_info.main_scaling if attacks_info else []
+            for creature_key, creature in self.creatures.items():
+                weakpoints = creature.info.weakpoints if creature.info else []
+                for location in ['body'] + [weakpoint.key_name for weakpoint in weakpoints]:
+                    expected = [
+                        self.get_scalar_damage(attack, scaling[position] if position < len(scaling) else 1.0, creature, location)
+                        for position, attack in enumerate(attacks)
+                    ]
+                    with self.subTest(weapon=weapon_key, creature=creature_key, location=location):
+                        hits = table.get_hit_damage(weapon_key, creature_key, location)
+                        self.assertEqual(len(hits), len(expected))
+                        for hit, value in zip(hits, expected):
+                            self.assertAlmostEqual(hit, value)
+                        self.assertAlmostEqual(table.get_combo_damage(weapon_key, creature_key, location), sum(expected))
+
+    def test_compound_damage_type_multiplies_every_resistance(self):
+        table = DamageTable(self.weapons, self.creatures)
+        # 10 fresh chopping damage, 0.5 fresh and 1.5 chopping resistance, 25% damage reduction.
+        self.assertAlmostEqual(table.get_hit_damage('Axe', 'Aphid')[0], 10.0 * 0.5 * 1.5 * 0.75)
+
+    def test_weakpoint_applies_only_to_its_damage_sources(self):
+        table = DamageTable(self.weapons, self.creatures)
+        self.assertAlmostEqual(table.get_hit_damage('Sword', 'Mite', 'Back')[0], 24.0 * 3.0)
+        self.assertAlmostEqual(table.get_hit_damage('Axe', 'Mite', 'Back')[0], 10.0)
+        # The mining attack isn't a melee attack, so only the weakpoint without sources applies.
+        self.assertAlmostEqual(table.get_hit_damage('Axe', 'Aphid', 'Head')[2], 7.0 * 0.75)
+        self.assertAlmostEqual(table.get_hit_damage('Axe', 'Aphid', 'Belly')[2], 7.0 * 0.75 * 1.5)
+
+    def test_missing_locations_are_nan(self):
+        table = DamageTable(self.weapons, self.creatures)
+        ghost = table.creature_index['Ghost']
+        self.assertTrue(all(math.isnan(value) for value in table.per_combo[:, ghost, 1:].ravel()))
+        with self.assertRaises(ValueError):
+            table.get_combo_damage('Axe', 'Ghost', 'Head')
+
+    def test_from_crawled_data_without_an_output(self):
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / 'bestiary.json').write_text('{}')
+            with self.assertRaisesRegex(ValueError, 'tools_weapons'):
+                DamageTable.from_crawled_data(Path(directory))
+
+    def test_from_crawled_data_with_an_outdated_output(self):
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / 'tools_weapons.json').write_text(json.dumps({'Sword': {'key_name': 'Sword'}}))
+            with self.assertRaisesRegex(ValueError, 'display_name'):
+                DamageTable.from_crawled_data(Path(directory))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from sqlite_database import SQLiteDatabase
+
+class SQLiteDatabaseTest(unittest.TestCase):
+    """
+    Writes synthetic crawled rows to a temporary SQLite file and reads them back.
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.database = SQLiteDatabase(Path(self.directory.name) / 'test.sqlite')
+
+    def tearDown(self):
+        self.database.close()
+        self.directory.cleanup()
+
+    def test_rows_are_read_back_as_saved(self):
+        rows = {
+            'Pebble': {'key_name': 'Pebble', 'tier': 1, 'two_handed': False, 'tags': ['Item.Resource'], 'consumable_data': None},
+            'Sword': {'key_name': 'Sword', 'tier': None, 'two_handed': True, 'tags': [], 'consumable_data': {'food': 1}, 'durability': 100},
+            'Sap': {'key_name': 'Sap'},
+        }
+        self.database.write_table('items', rows)
+        for key, row in rows.items():
+            with self.subTest(key=key):
+                self.assertEqual(self.database.get_row('items', key), row)
+
+    def test_missing_field_is_stored_as_null(self):
+        self.database.write_table('items', {'Sap': {'key_name': 'Sap'}, 'Sword': {'key_name': 'Sword', 'tags': None, 'tier': 2}})
+        stored = self.database.connection.execute('SELECT tags, tier FROM items WHERE _key_name = ?', ('Sap',)).fetchone()
+        self.assertEqual(stored, (None, None))
+        self.assertEqual(self.database.get_keys('items', tier=2), ['Sword'])
+
+    def test_unknown_row(self):
+        self.database.write_table('items', {'Sap': {'key_name': 'Sap'}})
+        self.assertIsNone(self.database.get_row('items', 'Pebble'))
+
+if __name__ == '__main__':
+    unittest.main()
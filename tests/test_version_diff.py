@@ -0,0 +1,57 @@
+import json
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from version_diff import VersionDiff
+
+def build_component(item_key: str, quantity: int) -> dict:
+    return {'item_key': item_key, 'quantity': quantity, 'display_name': None, 'description': None, 'icon_path': '', 'icon_modifier_path': ''}
+
+def build_item(key_name: str, repair_recipe: list[dict], tags: list[str]) -> dict:
+    return {'key_name': key_name, 'tier': 1, 'equippable_data': {'repair_recipe': repair_recipe, 'tags': tags}}
+
+class VersionDiffTest(unittest.TestCase):
+    """
+    Compares two synthetic crawled versions, saved in temporary directories.
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.old_path = Path(self.directory.name) / 'old'
+        self.new_path = Path(self.directory.name) / 'new'
+        self.old_path.mkdir()
+        self.new_path.mkdir()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def diff(self, old: dict, new: dict) -> dict:
+        (self.old_path / 'items.json').write_text(json.dumps(old))
+        (self.new_path / 'items.json').write_text(json.dumps(new))
+        return VersionDiff(self.old_path, self.new_path).run()
+
+    def test_inserted_component_is_aligned_by_item_key(self):
+        old = {'HeadMite': build_item('HeadMite', [build_component('FuzzMite', 1), build_component('Fiber', 2)], [])}
+        new = {'HeadMite': build_item('HeadMite', [build_component('Sap', 3), build_component('FuzzMite', 1), build_component('Fiber', 4)], [])}
+        changes = self.diff(old, new).tables['items']['changed']['HeadMite']
+        self.assertEqual(changes, [
+            {'path': 'equippable_data.repair_recipe[Fiber].quantity', 'change': 'changed', 'old': 2, 'new': 4},
+            {'path': 'equippable_data.repair_recipe[Sap]', 'change': 'added', 'new': build_component('Sap', 3)},
+        ])
+
+    def test_list_without_identity_is_compared_by_index(self):
+        old = {'HeadMite': build_item('HeadMite', [], ['Item.Armor'])}
+        new = {'HeadMite': build_item('HeadMite', [], ['Item.Armor', 'Item.Head'])}
+        changes = self.diff(old, new).tables['items']['changed']['HeadMite']
+        self.assertEqual(changes, [{'path': 'equippable_data.tags[1]', 'change': 'added', 'new': 'Item.Head'}])
+
+    def test_added_removed_and_unchanged_entities(self):
+        pebble = build_item('Pebble', [], [])
+        old = {'Pebble': pebble, 'HeadMite': build_item('HeadMite', [], [])}
+        new = {'HeadMite': build_item('HeadMite', [], []), 'AntHead': build_item('AntHead', [], [])}
+        table = self.diff(old, new).tables['items']
+        self.assertEqual(table, {'added': ['AntHead'], 'removed': ['Pebble'], 'changed': {}})
+
+if __name__ == '__main__':
+    unittest.main()
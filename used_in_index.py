@@ -0,0 +1,151 @@
+import json
+
+from pathlib import Path
+from typing import Any
+
+from global_database import GlobalDatabase
+from models import Item, StatusEffect, RecipeComponent, Reference, Model
+
+class UsedInIndex:
+    """
+    This class is responsible for indexing which crawled entities reference each item and status effect, e.g.: the
+    crafting recipes, repair recipes, item sets and loot tables that use an item.
+    Every reference is saved as `{'crawler', 'key_name', 'field'}`, where `field` is the dotted path of the field of
+    the entity that holds it (e.g.: `components`, `equippable_data.repair_recipe` or `info.loot`).
+    #### Parameters
+    - `items` : `dict[str, list[dict]]`
+        - The references to every item, by item key name.
+    - `status_effects` : `dict[str, list[dict]]`
+        - The references to every status effect, by status effect key name.
+    """
+    def __init__(self, items: dict[str, list[dict]] = None, status_effects: dict[str, list[dict]] = None):
+        self.items = items if items is not None else {}
+        self.status_effects = status_effects if status_effects is not None else {}
+
+    @staticmethod
+    def build() -> 'UsedInIndex':
+        """
+        This method is responsible for building the index from the data in the global database, in a single pass.
+        References are read without resolving them, so the normalized output is indexed without loading other tables.
+        #### Returns
+        - `UsedInIndex` : The built index.
+        """
+        index = UsedInIndex()
+        for crawler_name in GlobalDatabase.models:
+            crawled_data = getattr(GlobalDatabase, crawler_name, None)
+            if crawled_data is None:
+                continue
+            for key, entity in crawled_data.items():
+                for field, value in UsedInIndex._get_fields(entity):
+                    index._walk(crawler_name, key, field, value)
+        return index
+
+    @staticmethod
+    def load(path: Path) -> 'UsedInIndex':
+        """
+        This method is responsible for loading a saved index.
+        #### Parameters
+        - `path` : `Path`
+            - The path to `used_in.json`.
+        #### Returns
+        - `UsedInIndex` : The loaded index.
+        """
+        data = json.loads(Path(path).read_text())
+        return UsedInIndex(data['items'], data['status_effects'])
+
+    def save(self, path: Path, indent: int = 4) -> None:
+        """
+        This method is responsible for saving the index, usually as `used_in.json` next to the crawled output.
+        #### Parameters
+        - `path` : `Path`
+            - The path to the output file.
+        - `indent` : `int`
+            - The indentation of the output, or `None` for the compact output.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=indent))
+
+    def to_dict(self) -> dict:
+        """
+        This method is responsible for converting the index to a dictionary.
+        #### Returns
+        - `dict` : The converted index.
+        """
+        return {
+            'items': self.items,
+            'status_effects': self.status_effects
+        }
+
+    def get_item(self, item_key: str) -> list[dict]:
+        """
+        This method is responsible for getting the entities that reference an item.
+        #### Parameters
+        - `item_key` : `str`
+            - The key name of the item.
+        #### Returns
+        - `list[dict]` : The references, in the crawled order.
+        """
+        return self.items.get(item_key, [])
+
+    def get_status_effect(self, status_effect_key: str) -> list[dict]:
+        """
+        This method is responsible for getting the entities that reference a status effect.
+        #### Parameters
+        - `status_effect_key` : `str`
+            - The key name of the status effect.
+        #### Returns
+        - `list[dict]` : The references, in the crawled order.
+        """
+        return self.status_effects.get(status_effect_key, [])
+
+    def _add(self, index: dict[str, list[dict]], target_key: str, crawler_name: str, key: str, field: str) -> None:
+        references = index.setdefault(target_key, [])
+        reference = {'crawler': crawler_name, 'key_name': key, 'field': field}
+        # The same entity usually references a key more than once in the same field (e.g.: several loot entries).
+        if not references or references[-1] != reference:
+            references.append(reference)
+
+    def _walk(self, crawler_name: str, key: str, field: str, value: Any) -> None:
+        """
+        This method is responsible for indexing the references inside a field of an entity.
+        #### Parameters
+        - `crawler_name` : `str`
+            - The name of the crawler of the entity.
+        - `key` : `str`
+            - The key name of the entity.
+        - `field` : `str`
+            - The dotted path of the field.
+        - `value` : `Any`
+            - The value of the field.
+        """
+        if isinstance(value, Reference):
+            if value.table == 'items':
+                self._add(self.items, value.key_name, crawler_name, key, field)
+            elif value.table == 'status_effects':
+                self._add(self.status_effects, value.key_name, crawler_name, key, field)
+        elif isinstance(value, RecipeComponent):
+            self._add(self.items, value.item_key, crawler_name, key, field)
+        elif isinstance(value, Item):
+            self._add(self.items, value.key_name, crawler_name, key, field)
+        elif isinstance(value, StatusEffect):
+            self._add(self.status_effects, value.key_name, crawler_name, key, field)
+        elif isinstance(value, list):
+            for element in value:
+                self._walk(crawler_name, key, field, element)
+        elif isinstance(value, dict):
+            # Loot entries only keep the key of the dropped item: `{'item': {'key': ...}, ...}`.
+            loot_item = value.get('item')
+            if isinstance(loot_item, dict) and isinstance(loot_item.get('key'), str):
+                self._add(self.items, loot_item['key'], crawler_name, key, field)
+                return
+            for name, element in value.items():
+                self._walk(crawler_name, key, f'{field}.{name}', element)
+        elif isinstance(value, Model):
+            for name, element in UsedInIndex._get_fields(value):
+                self._walk(crawler_name, key, f'{field}.{name}', element)
+
+    @staticmethod
+    def _get_fields(entity: Any) -> list[tuple[str, Any]]:
+        # The unknown fields are raw game data and are not indexed.
+        return [(field.name, getattr(entity, field.name)) for field in entity.fields if field.name != 'unknown_fields']
@@ -0,0 +1,106 @@
+class SuffixAutomaton:
+    """
+    The suffix automaton of a string: the smallest automaton that accepts all of its substrings, built in linear time.
+    Every state represents the substrings that end at the same set of positions, with lengths in
+    `(length[link], length]`.
+    #### Parameters
+    - `text` : `str`
+        - The string to build the automaton of.
+    """
+    def __init__(self, text: str):
+        self.text = text
+        self.transitions: list[dict[str, int]] = [{}]
+        self.link: list[int] = [-1]
+        self.length: list[int] = [0]
+        # The end position of the first occurrence of the substrings of each state.
+        self.first_end: list[int] = [-1]
+
+        last = 0
+        for position, character in enumerate(text):
+            state = self._add_state(self.length[last] + 1, position)
+            current = last
+            while current != -1 and character not in self.transitions[current]:
+                self.transitions[current][character] = state
+                current = self.link[current]
+
+            if current == -1:
+                self.link[state] = 0
+            else:
+                next_state = self.transitions[current][character]
+                if self.length[current] + 1 == self.length[next_state]:
+                    self.link[state] = next_state
+                else:
+                    clone = self._add_state(self.length[current] + 1, self.first_end[next_state])
+                    self.transitions[clone] = dict(self.transitions[next_state])
+                    self.link[clone] = self.link[next_state]
+                    while current != -1 and self.transitions[current].get(character) == next_state:
+                        self.transitions[current][character] = clone
+                        current = self.link[current]
+                    self.link[next_state] = clone
+                    self.link[state] = clone
+            last = state
+
+    def _add_state(self, length: int, first_end: int) -> int:
+        self.transitions.append({})
+        self.link.append(-1)
+        self.length.append(length)
+        self.first_end.append(first_end)
+        return len(self.length) - 1
+
+    def _get_matches(self, other: str, order: list[int]) -> list[int]:
+        """
+        This method is responsible for matching another string against the automaton.
+        #### Parameters
+        - `other` : `str`
+            - The string to match.
+        - `order` : `list[int]`
+            - The states by decreasing length.
+        #### Returns
+        - `list[int]` : The length of the longest substring of each state that is also a substring of `other`.
+        """
+        matches = [0] * len(self.length)
+        state, matched = 0, 0
+        for character in other:
+            while state and character not in self.transitions[state]:
+                state = self.link[state]
+                matched = self.length[state]
+            if character in self.transitions[state]:
+                state = self.transitions[state][character]
+                matched += 1
+            if matched > matches[state]:
+                matches[state] = matched
+
+        # A match in a state is also a match of the suffixes of its substrings, which live in its suffix link.
+        for state in order:
+            link = self.link[state]
+            if link > 0 and matches[state]:
+                matches[link] = max(matches[link], min(matches[state], self.length[link]))
+        return matches
+
+    def longest_common_substring(self, others: list[str]) -> str:
+        """
+        This method is responsible for finding the longest substring of the text that is in every other string.
+        #### Parameters
+        - `others` : `list[str]`
+            - The other strings.
+        #### Returns
+        - `str` : The longest common substring. Among several of the same length, the one that occurs first in the
+          text. Empty if there is none.
+        """
+        order = sorted(range(1, len(self.length)), key=self.length.__getitem__, reverse=True)
+        common = self.length[:]
+        for other in others:
+            for state, matched in enumerate(self._get_matches(other, order)):
+                if matched < common[state]:
+                    common[state] = matched
+
+        best_length, best_start = 0, 0
+        for state in range(1, len(self.length)):
+            # Only the states whose own substrings have that length, the shorter ones are counted in their links.
+            length = common[state]
+            if length <= self.length[self.link[state]]:
+                continue
+            start = self.first_end[state] - length + 1
+            if length > best_length or (length == best_length and start < best_start):
+                best_length, best_start = length, start
+        return self.text[best_start:best_start + best_length]
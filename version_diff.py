@@ -0,0 +1,243 @@
+import json
+import sys
+
+from pathlib import Path
+from typing import Any
+
+from crawler import CrawledDataReader, CrawlManifest
+from models import Reference
+
+class VersionDiff:
+    """
+    This class is responsible for comparing the crawled output of two versions of the game, e.g.:
+    `data/crawled/1.4.1.4512` and `data/crawled/1.4.4.4634`, to find the added, removed and changed entities of every
+    crawler. Entities are aligned by key name and the changes are saved as
+    `{'path', 'change', 'old', 'new'}`, where `path` is the path of the changed field (e.g.: `tier`,
+    `equippable_data.repair_recipe[FuzzMite].quantity` or `tags[2]`) and `change` is `added`, `removed` or `changed`.
+    The files are streamed: the old version is indexed by the hash and the byte span of every entity, then the new
+    version is read one entity at a time and only the entities with a different hash are read again to be compared.
+    #### Parameters
+    - `old_path` : `Path`
+        - The path to the crawled output of the old version.
+    - `new_path` : `Path`
+        - The path to the crawled output of the new version.
+    - `ignore_unknown_fields` : `bool`
+        - Whether the changes of the `unknown_fields` are left out.
+    #### Attributes
+    - `tables` : `dict[str, dict]`
+        - The `{'added', 'removed', 'changed'}` entities of every compared crawler, by crawler name.
+    - `identity_fields` : `list[str]`
+        - The fields that identify the elements of a list of entities, in order of preference: `key_name` for most
+          models, `item_key` for the recipe components and `row_name` for the data table references.
+    """
+    identity_fields: list[str] = ['key_name', 'item_key', 'row_name']
+
+    def __init__(self, old_path: Path, new_path: Path, ignore_unknown_fields: bool = False):
+        self.old_path = Path(old_path)
+        self.new_path = Path(new_path)
+        self.ignore_unknown_fields = ignore_unknown_fields
+        self.tables: dict[str, dict] = {}
+
+    def run(self, names: list[str] = None) -> 'VersionDiff':
+        """
+        This method is responsible for comparing the crawled output of both versions.
+        #### Parameters
+        - `names` : `list[str]`
+            - The names of the crawlers to compare, by default every crawled output of either version.
+        #### Returns
+        - `VersionDiff` : The diff itself.
+        """
+        if names is None:
+            names = sorted({path.stem for path in self.old_path.glob('*.json')} | {path.stem for path in self.new_path.glob('*.json')})
+        for name in names:
+            self.tables[name] = self.diff_table(name)
+        return self
+
+    def diff_table(self, name: str) -> dict:
+        """
+        This method is responsible for comparing the crawled output of a crawler in both versions. A crawler that is
+        only in one of the versions has all its entities added or removed.
+        #### Parameters
+        - `name` : `str`
+            - The name of the crawler.
+        #### Returns
+        - `dict` : The key names of the `added` and `removed` entities and the changes of every `changed` entity.
+        """
+        old_path, new_path = self.old_path / f'{name}.json', self.new_path / f'{name}.json'
+        old_reader = CrawledDataReader(old_path) if old_path.exists() else None
+        new_reader = CrawledDataReader(new_path) if new_path.exists() else None
+
+        old_index: dict[str, tuple[str, int, int]] = {}
+        if old_reader is not None:
+            for key, entity, start, end in old_reader:
+                old_index[key] = (CrawlManifest.hash_row(entity), start, end)
+
+        added, changed = [], {}
+        if new_reader is not None:
+            for key, entity, start, end in new_reader:
+                old_entry = old_index.pop(key, None)
+                if old_entry is None:
+                    added.append(key)
+                    continue
+                if old_entry[0] == CrawlManifest.hash_row(entity):
+                    continue
+                changes = []
+                self._diff_values(old_reader.read_entity(old_entry[1], old_entry[2]), new_reader.read_entity(start, end), '', changes)
+                # The hashes can also differ if only the escaping of the non-ASCII characters is different.
+                if changes:
+                    changed[key] = changes
+
+        # The entities left in the index are not in the new version.
+        return {'added': added, 'removed': list(old_index), 'changed': changed}
+
+    def _diff_values(self, old: Any, new: Any, path: str, changes: list[dict]) -> None:
+        """
+        This method is responsible for comparing a field in both versions.
+        #### Parameters
+        - `old` : `Any`
+            - The value in the old version.
+        - `new` : `Any`
+            - The value in the new version.
+        - `path` : `str`
+            - The path of the field.
+        - `changes` : `list[dict]`
+            - The changes found so far.
+        """
+        if old == new:
+            return
+        if isinstance(old, dict) and isinstance(new, dict):
+            # A reference is the same if it is to the same entity, whose changes are found with its own crawler.
+            if Reference.is_reference(old) or Reference.is_reference(new):
+                if old.get('key_name') != new.get('key_name'):
+                    changes.append({'path': path, 'change': 'changed', 'old': old, 'new': new})
+                return
+            for name, value in old.items():
+                if self.ignore_unknown_fields and name == 'unknown_fields':
+                    continue
+                if name in new:
+                    self._diff_values(value, new[name], VersionDiff._join(path, name), changes)
+                else:
+                    changes.append({'path': VersionDiff._join(path, name), 'change': 'removed', 'old': value})
+            for name, value in new.items():
+                if name not in old and not (self.ignore_unknown_fields and name == 'unknown_fields'):
+                    changes.append({'path': VersionDiff._join(path, name), 'change': 'added', 'new': value})
+        elif isinstance(old, list) and isinstance(new, list):
+            old_keys, new_keys = VersionDiff._get_list_keys(old), VersionDiff._get_list_keys(new)
+            if old_keys is not None and new_keys is not None:
+                # Lists of entities (e.g.: attacks, weakpoints or recipe components) are aligned by their identity field.
+                old, new = dict(zip(old_keys, old)), dict(zip(new_keys, new))
+            else:
+                old, new = dict(enumerate(old)), dict(enumerate(new))
+            for index, value in old.items():
+                if index in new:
+                    self._diff_values(value, new[index], f'{path}[{index}]', changes)
+                else:
+                    changes.append({'path': f'{path}[{index}]', 'change': 'removed', 'old': value})
+            for index, value in new.items():
+                if index not in old:
+                    changes.append({'path': f'{path}[{index}]', 'change': 'added', 'new': value})
+        else:
+            changes.append({'path': path, 'change': 'changed', 'old': old, 'new': new})
+
+    @staticmethod
+    def _get_list_keys(values: list) -> list[str] | None:
+        # The first identity field every element has with a different value, otherwise the list is compared by index.
+        for identity_field in VersionDiff.identity_fields:
+            keys = [value.get(identity_field) if isinstance(value, dict) else None for value in values]
+            if None not in keys and len(set(keys)) == len(keys):
+                return keys
+        return None
+
+    @staticmethod
+    def _join(path: str, name: str) -> str:
+        # The keys of the unknown fields are paths themselves (e.g.: `Tiers.0.Value`).
+        if '.' in name or '[' in name:
+            return f'{path}[{json.dumps(name)}]'
+        return f'{path}.{name}' if path else name
+
+    def to_dict(self) -> dict:
+        """
+        This method is responsible for converting the diff to a dictionary.
+        #### Returns
+        - `dict` : The converted diff.
+        """
+        return {
+            'old_path': self.old_path.as_posix(),
+            'new_path': self.new_path.as_posix(),
+            'tables': self.tables
+        }
+
+    def save(self, path: Path, indent: int = 4) -> None:
+        """
+        This method is responsible for saving the diff as JSON.
+        #### Parameters
+        - `path` : `Path`
+            - The path to the output file.
+        - `indent` : `int`
+            - The indentation of the output, or `None` for the compact output.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=indent))
+
+    def get_report(self, max_value_length: int = 60) -> str:
+        """
+        This method is responsible for getting a compact human readable report of the diff, e.g.:
+        ```
+        items: 2 added, 1 removed, 1 changed
+          + AntHead
+          + AntLeg
+          - Pebble
+          ~ Sword
+              tier: 2 -> 3
+              tags[1]: + "Item.Weapon"
+        ```
+        #### Parameters
+        - `max_value_length` : `int`
+            - The length the values are shortened to.
+        #### Returns
+        - `str` : The report, with only the crawlers that have changes.
+        """
+        def format_value(value: Any) -> str:
+            text = json.dumps(value)
+            return text if len(text) <= max_value_length else f'{text[:max_value_length - 3]}...'
+
+        lines = [f'{self.old_path.name} -> {self.new_path.name}']
+        for name, table in self.tables.items():
+            if not table['added'] and not table['removed'] and not table['changed']:
+                continue
+            lines.append(f'{name}: {len(table["added"])} added, {len(table["removed"])} removed, {len(table["changed"])} changed')
+            lines += [f'  + {key}' for key in table['added']]
+            lines += [f'  - {key}' for key in table['removed']]
+            for key, changes in table['changed'].items():
+                lines.append(f'  ~ {key}')
+                for change in changes:
+                    if change['change'] == 'added':
+                        lines.append(f'      {change["path"]}: + {format_value(change["new"])}')
+                    elif change['change'] == 'removed':
+                        lines.append(f'      {change["path"]}: - {format_value(change["old"])}')
+                    else:
+                        lines.append(f'      {change["path"]}: {format_value(change["old"])} -> {format_value(change["new"])}')
+        return '\n'.join(lines)
+
+def main() -> None:
+    """
+    Usage (from the repository root):
+        python version_diff.py <old crawled path> <new crawled path> [output path]
+    The report is printed and, with an output path, the diff is saved to `<output path>.json` and the report to
+    `<output path>.txt`.
+    """
+    if len(sys.argv) < 3:
+        print(main.__doc__)
+        return
+
+    diff = VersionDiff(sys.argv[1], sys.argv[2]).run()
+    report = diff.get_report()
+    print(report)
+    if len(sys.argv) > 3:
+        output_path = Path(sys.argv[3])
+        diff.save(output_path.with_suffix('.json'))
+        output_path.with_suffix('.txt').write_text(report)
+
+if __name__ == '__main__':
+    main()